@@ -4,11 +4,12 @@ Utilise OR-Tools pour optimiser la planification
 """
 
 from ortools.sat.python import cp_model
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.patches as patches
 from datetime import datetime
 import os
 import numpy as np
+from chart_utils import subplots
 
 class FlowshopHybrideSolver:
     def __init__(self, jobs_data, machines_per_stage, job_names=None, stage_names=None):
@@ -195,10 +196,10 @@ class FlowshopHybrideSolver:
         if not solution:
             return None
         
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = subplots(figsize=(12, 8))
         
         # Couleurs pour les jobs
-        colors = plt.cm.Set3(np.linspace(0, 1, self.num_jobs))
+        colors = matplotlib.colormaps["Set3"](np.linspace(0, 1, self.num_jobs))
         
         # Dessiner les tâches
         y_pos = 0
@@ -252,13 +253,13 @@ class FlowshopHybrideSolver:
         
         ax.legend(handles=legend_elements, loc='upper right', bbox_to_anchor=(1.15, 1))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Sauvegarder
         filepath = os.path.join("static", filename)
         os.makedirs("static", exist_ok=True)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        # Figure Agg réutilisée par thread : rien à fermer côté pyplot
+        fig.savefig(filepath, dpi=300, bbox_inches='tight')
         
         return f"/static/{filename}"
 
@@ -0,0 +1,131 @@
+import os
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+import orjson
+from pydantic import BaseModel
+
+def _default(obj):
+    """Sérialisation des objets non gérés nativement par orjson"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+def payload_key(payload):
+    """Empreinte stable (blake2b sur JSON trié) d'une requête ou d'un résultat"""
+    data = orjson.dumps(payload, default=_default, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+class LRUCache:
+    """Cache LRU thread-safe, borné en nombre d'entrées et en taille totale"""
+
+    def __init__(self, max_entries=128, max_bytes=None, sizeof=len):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            # Éviction des entrées les moins récemment utilisées
+            while len(self._data) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._data)
+
+class DiskCache:
+    """
+    Fichiers en cache dans un répertoire (tmpfs de préférence), partagés entre processus :
+    écriture atomique, LRU approché par date de modification, taille totale bornée
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._bytes = sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+        self._lock = threading.Lock()
+
+    def find(self, key, suffixes):
+        """(chemin, stat, suffixe) du premier fichier présent pour cette clé, sinon None"""
+        for suffix in suffixes:
+            path = os.path.join(self.directory, f"{key}.{suffix}")
+            try:
+                stat_result = os.stat(path)
+            except FileNotFoundError:
+                continue
+            return path, stat_result, suffix
+        return None
+
+    def touch(self, path):
+        """Marque le fichier comme récemment utilisé"""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    def put(self, key, suffix, data):
+        path = os.path.join(self.directory, f"{key}.{suffix}")
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            self._bytes += len(data)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Supprime les fichiers les moins récemment utilisés jusqu'à 80 % de la taille maximale"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".tmp"):
+                continue
+            try:
+                stat_result = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat_result.st_mtime, stat_result.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes * 0.8:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._bytes = total
@@ -0,0 +1,96 @@
+import io
+import queue
+import threading
+import contextlib
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+
+matplotlib.rcParams["path.simplify"] = True
+# Aucun libellé n'utilise mathtext ni de valeurs négatives : on évite leur traitement
+matplotlib.rcParams["text.parse_math"] = False
+matplotlib.rcParams["axes.unicode_minus"] = False
+
+# Une Figure Agg réutilisable par thread (évite pyplot et son état global)
+_FIG_POOL = threading.local()
+
+def get_figure(figsize):
+    """Retourne la Figure du thread courant, vidée et redimensionnée"""
+    fig = getattr(_FIG_POOL, "fig", None)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        _FIG_POOL.canvas = FigureCanvasAgg(fig)
+        _FIG_POOL.fig = fig
+    else:
+        fig.clear()
+        fig.set_size_inches(figsize)
+        # tight_layout() modifie les marges : on repart des valeurs par défaut
+        fig.subplots_adjust(**{k: matplotlib.rcParams[f"figure.subplot.{k}"]
+                               for k in ("left", "right", "bottom", "top", "wspace", "hspace")})
+    return fig
+
+def subplots(nrows=1, ncols=1, figsize=None, **kwargs):
+    """Équivalent de plt.subplots() sur la Figure réutilisable du thread"""
+    fig = get_figure(figsize or matplotlib.rcParams["figure.figsize"])
+    axes = fig.subplots(nrows, ncols, **kwargs)
+    return fig, axes
+
+def add_bars(ax, bars, **kwargs):
+    """
+    Ajoute des barres horizontales [(début, bas, durée, hauteur)] en une seule PolyCollection
+    (comme broken_barh, mais sur plusieurs lignes à la fois) plutôt qu'un Rectangle par barh
+    """
+    vertices = [[(x, y), (x, y + h), (x + w, y + h), (x + w, y)] for x, y, w, h in bars]
+    collection = PolyCollection(vertices, **kwargs)
+    ax.add_collection(collection, autolim=True)
+    # Comme barh : pas de marge à gauche du début des barres
+    collection.sticky_edges.x.extend(x for x, _, _, _ in bars)
+    ax.autoscale_view()
+    return collection
+
+# SVG : texte conservé en <text> (pas de contours de glyphes) et identifiants stables d'un rendu à l'autre
+matplotlib.rcParams["svg.fonttype"] = "none"
+matplotlib.rcParams["svg.hashsalt"] = "chart"
+
+# Formats d'image proposés par les routes de graphiques
+IMAGE_MEDIA_TYPES = {"png": "image/png", "webp": "image/webp", "svg": "image/svg+xml"}
+
+def save_kwargs(fmt="png"):
+    """Paramètres de savefig : PNG peu compressé (encodage rapide), WebP sans perte ou SVG vectoriel (sans rastérisation)"""
+    if fmt == "webp":
+        return {"format": "webp", "pil_kwargs": {"lossless": True}}
+    if fmt == "svg":
+        return {"format": "svg", "metadata": {"Date": None}}
+    return {"format": "png", "pil_kwargs": {"compress_level": 1}}
+
+# Tampons BytesIO réutilisés d'un rendu à l'autre (par processus)
+_BUF_POOL = queue.LifoQueue(maxsize=64)
+
+@contextlib.contextmanager
+def image_buffer():
+    """Emprunte un BytesIO au pool, remis au début, et le restitue après usage"""
+    try:
+        buf = _BUF_POOL.get_nowait()
+    except queue.Empty:
+        buf = io.BytesIO()
+    buf.seek(0)
+    try:
+        yield buf
+    finally:
+        try:
+            _BUF_POOL.put_nowait(buf)
+        except queue.Full:
+            pass
+
+def figure_bytes(fig, fmt="png", dpi=300, tight=True):
+    """
+    Encode la figure dans un tampon du pool et retourne les octets de l'image.
+    tight=False garde la taille de la figure : pas de passe de mesure supplémentaire pour le recadrage,
+    à réserver aux figures déjà mises en page par tight_layout()
+    """
+    with image_buffer() as buf:
+        fig.savefig(buf, dpi=dpi, bbox_inches='tight' if tight else None, **save_kwargs(fmt))
+        buf.truncate()
+        return buf.getvalue()
@@ -1,10 +1,12 @@
 import collections
 from ortools.sat.python import cp_model
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from datetime import datetime
 import os
 import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
 
 def schedule(jobs_data, due_dates):
     # ✅ Convertir en int pour OR-Tools (qui ne supporte pas les floats)
@@ -95,7 +97,7 @@ def flowshop_contraintes(jobs_data, due_dates, job_names=None, machine_names=Non
     Fonction principale pour flowshop avec contraintes.
     Utilise seulement l'algorithme de base (une machine par étape).
     """
-    print("DEBUG: Flowshop classique avec contraintes")
+    logger.debug("Flowshop classique avec contraintes")
     return schedule(jobs_data, due_dates)
 
 
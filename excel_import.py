@@ -1,9 +1,19 @@
 import pandas as pd
 import io
 from typing import Dict, List, Tuple, Optional
-from fastapi import HTTPException
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Les parsings et exports s'exécutent dans le pool de processus : leurs erreurs sont des exceptions simples
+# (un seul message), renvoyées telles quelles au processus principal qui les convertit en 400 / 500
+class ExcelImportError(ValueError):
+    """Fichier Excel importé invalide (réponse 400)"""
+
+class ExcelExportError(RuntimeError):
+    """Échec de la génération d'un classeur Excel (réponse 500)"""
 
 def parse_flowshop_excel(file_content: bytes) -> Dict:
     """
@@ -33,9 +43,8 @@ def parse_flowshop_excel(file_content: bytes) -> Dict:
         missing_sheets = [sheet for sheet in required_sheets if sheet not in excel_file.sheet_names]
         
         if missing_sheets:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Format Excel non reconnu. Utilisez le template fourni."
+            raise ExcelImportError(
+                f"Format Excel non reconnu. Utilisez le template fourni."
             )
         
         # Lire les onglets
@@ -57,9 +66,9 @@ def parse_flowshop_excel(file_content: bytes) -> Dict:
         }
         
     except Exception as e:
-        if isinstance(e, HTTPException):
+        if isinstance(e, ExcelImportError):
             raise e
-        raise HTTPException(status_code=400, detail=f"Erreur lors de la lecture du fichier Excel: {str(e)}")
+        raise ExcelImportError(f"Erreur lors de la lecture du fichier Excel: {str(e)}")
 
 def parse_matrix_format(file_content: bytes) -> Dict:
     """
@@ -78,9 +87,9 @@ def parse_matrix_format(file_content: bytes) -> Dict:
         Dict contenant les données formatées pour l'API
     """
     try:
-        # Lire le fichier Excel sans en-tête automatique
+        # Lire le fichier Excel sans en-tête automatique : seules les 20 premières lignes du modèle sont utilisées (unité en C20)
         excel_file = io.BytesIO(file_content)
-        df = pd.read_excel(excel_file, header=None)
+        df = pd.read_excel(excel_file, header=None, nrows=20)
         
         # Vérifier la structure minimale
         if df.shape[0] < 20 or df.shape[1] < 14:
@@ -175,12 +184,11 @@ def parse_matrix_format(file_content: bytes) -> Dict:
             error_msg = "Erreurs dans le fichier Excel:\n" + "\n".join(f"• {err}" for err in errors[:10])
             if len(errors) > 10:
                 error_msg += f"\n... et {len(errors) - 10} autres erreurs"
-            raise HTTPException(status_code=400, detail=error_msg)
+            raise ExcelImportError(error_msg)
         
         if not job_names:
-            raise HTTPException(
-                status_code=400,
-                detail="Aucun job valide trouvé. Vérifiez que vous avez rempli les noms de jobs et au moins une durée par job."
+            raise ExcelImportError(
+                "Aucun job valide trouvé. Vérifiez que vous avez rempli les noms de jobs et au moins une durée par job."
             )
         
         # Lire les noms des machines depuis les en-têtes (ligne 5, colonnes D-M)
@@ -212,7 +220,7 @@ def parse_matrix_format(file_content: bytes) -> Dict:
             "unite": unite
         }
         
-    except HTTPException:
+    except ExcelImportError:
         raise
     except Exception as e:
         raise ValueError(f"Erreur parsing format matrice: {str(e)}")
@@ -229,25 +237,23 @@ def parse_machines(machines_df: pd.DataFrame) -> Tuple[List[str], Dict[int, str]
     missing_columns = [col for col in required_columns if col not in machines_df.columns]
     
     if missing_columns:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Colonnes manquantes dans l'onglet Machines: {', '.join(missing_columns)}"
+        raise ExcelImportError(
+            f"Colonnes manquantes dans l'onglet Machines: {', '.join(missing_columns)}"
         )
     
     # Nettoyer les données
     machines_df = machines_df.dropna(subset=['ID_Machine', 'Nom_Machine'])
     
     if machines_df.empty:
-        raise HTTPException(status_code=400, detail="Aucune machine valide trouvée dans l'onglet Machines")
+        raise ExcelImportError("Aucune machine valide trouvée dans l'onglet Machines")
     
     # Vérifier que les ID sont des entiers consécutifs commençant à 0
     machine_ids = sorted(machines_df['ID_Machine'].astype(int).tolist())
     expected_ids = list(range(len(machine_ids)))
     
     if machine_ids != expected_ids:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Les ID des machines doivent être des entiers consécutifs commençant à 0. Trouvé: {machine_ids}, Attendu: {expected_ids}"
+        raise ExcelImportError(
+            f"Les ID des machines doivent être des entiers consécutifs commençant à 0. Trouvé: {machine_ids}, Attendu: {expected_ids}"
         )
     
     # Créer le mapping et la liste des noms
@@ -259,9 +265,8 @@ def parse_machines(machines_df: pd.DataFrame) -> Tuple[List[str], Dict[int, str]
         machine_name = str(row['Nom_Machine']).strip()
         
         if not machine_name or machine_name.lower() in ['nan', 'none', '[à remplir]']:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Nom de machine manquant pour l'ID {machine_id}"
+            raise ExcelImportError(
+                f"Nom de machine manquant pour l'ID {machine_id}"
             )
         
         machine_mapping[machine_id] = machine_name
@@ -281,9 +286,8 @@ def parse_jobs(jobs_df: pd.DataFrame, machine_names: List[str]) -> Tuple[List[Li
     missing_base = [col for col in base_columns if col not in jobs_df.columns]
     
     if missing_base:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Colonnes manquantes dans l'onglet Jobs: {', '.join(missing_base)}"
+        raise ExcelImportError(
+            f"Colonnes manquantes dans l'onglet Jobs: {', '.join(missing_base)}"
         )
     
     # Vérifier les colonnes des machines (Machine_0, Machine_1, etc.)
@@ -291,16 +295,15 @@ def parse_jobs(jobs_df: pd.DataFrame, machine_names: List[str]) -> Tuple[List[Li
     missing_machines = [col for col in machine_columns if col not in jobs_df.columns]
     
     if missing_machines:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Colonnes de machines manquantes dans l'onglet Jobs: {', '.join(missing_machines)}"
+        raise ExcelImportError(
+            f"Colonnes de machines manquantes dans l'onglet Jobs: {', '.join(missing_machines)}"
         )
     
     # Nettoyer les données
     jobs_df = jobs_df.dropna(subset=['Nom_Job', 'Date_Echeance'])
     
     if jobs_df.empty:
-        raise HTTPException(status_code=400, detail="Aucun job valide trouvé dans l'onglet Jobs")
+        raise ExcelImportError("Aucun job valide trouvé dans l'onglet Jobs")
     
     jobs_data = []
     due_dates = []
@@ -310,9 +313,8 @@ def parse_jobs(jobs_df: pd.DataFrame, machine_names: List[str]) -> Tuple[List[Li
         # Nom du job
         job_name = str(row['Nom_Job']).strip()
         if not job_name or job_name.lower() in ['nan', 'none', '[à remplir]']:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Nom de job manquant à la ligne {index + 2}"
+            raise ExcelImportError(
+                f"Nom de job manquant à la ligne {index + 2}"
             )
         
         # Date d'échéance
@@ -321,9 +323,8 @@ def parse_jobs(jobs_df: pd.DataFrame, machine_names: List[str]) -> Tuple[List[Li
             if due_date < 0:
                 raise ValueError("Date d'échéance négative")
         except (ValueError, TypeError):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Date d'échéance invalide pour le job '{job_name}' à la ligne {index + 2}"
+            raise ExcelImportError(
+                f"Date d'échéance invalide pour le job '{job_name}' à la ligne {index + 2}"
             )
         
         # Durées des tâches
@@ -340,9 +341,8 @@ def parse_jobs(jobs_df: pd.DataFrame, machine_names: List[str]) -> Tuple[List[Li
                 job_tasks.append([machine_id, duration])
                 
             except (ValueError, TypeError):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Durée invalide pour le job '{job_name}' sur la machine '{machine_name}' à la ligne {index + 2}"
+                raise ExcelImportError(
+                    f"Durée invalide pour le job '{job_name}' sur la machine '{machine_name}' à la ligne {index + 2}"
                 )
         
         jobs_data.append(job_tasks)
@@ -364,35 +364,20 @@ def create_flowshop_template(template_type: str = "exemple") -> bytes:
     # Créer un BytesIO pour le fichier Excel
     output = io.BytesIO()
     
-    # Préparer les données
+    # Préparer les données (même format matriciel que l'export des données manuelles)
     if template_type == "exemple":
-        machines_data = {
-            'ID_Machine': [0, 1, 2],
-            'Nom_Machine': ['Découpe', 'Assemblage', 'Finition']
-        }
-        jobs_data = {
-            'Nom_Job': ['Job_A', 'Job_B', 'Job_C'],
-            'Date_Echeance': [12, 15, 18],
-            'Machine_0': [4, 3, 5],
-            'Machine_1': [2, 4, 2],
-            'Machine_2': [3, 2, 4]
-        }
+        job_names = ['Job_A', 'Job_B', 'Job_C']
+        machine_names = ['Découpe', 'Assemblage', 'Finition']
+        due_dates = [12, 15, 18]
+        # Durées par job, dans l'ordre des machines
+        jobs_data = [[4, 2, 3], [3, 4, 2], [5, 2, 4]]
     else:
-        machines_data = {
-            'ID_Machine': [0, 1, 2],
-            'Nom_Machine': ['[À remplir]', '[À remplir]', '[À remplir]']
-        }
-        jobs_data = {
-            'Nom_Job': ['[À remplir]', '[À remplir]', '[À remplir]'],
-            'Date_Echeance': ['[À remplir]', '[À remplir]', '[À remplir]'],
-            'Machine_0': ['[À remplir]', '[À remplir]', '[À remplir]'],
-            'Machine_1': ['[À remplir]', '[À remplir]', '[À remplir]'],
-            'Machine_2': ['[À remplir]', '[À remplir]', '[À remplir]']
-        }
-    
-    # Créer les DataFrames
-    machines_df = pd.DataFrame(machines_data)
-    jobs_df = pd.DataFrame(jobs_data)
+        # Template vide : grille à remplir
+        job_names = []
+        machine_names = []
+        due_dates = []
+        jobs_data = []
+    unite = "heures"
     
     # Créer un workbook avec openpyxl pour un contrôle précis de la structure
     wb = Workbook()
@@ -445,7 +430,7 @@ def create_flowshop_template(template_type: str = "exemple") -> bytes:
     for job_idx in range(11):  # TOUJOURS 11 lignes de jobs
         for machine_idx in range(10):  # TOUJOURS 10 colonnes de machines
             if job_idx < len(jobs_data) and machine_idx < len(jobs_data[job_idx]):
-                duration = jobs_data[job_idx][machine_idx][1]
+                duration = jobs_data[job_idx][machine_idx]
             else:
                 duration = ""  # Cellule vide si pas de données
                 
@@ -487,7 +472,7 @@ def create_flowshop_template(template_type: str = "exemple") -> bytes:
     unit_abbrev = unit_mapping.get(unite.lower(), unite.lower())
     ws.cell(row=20, column=3, value=unit_abbrev)
     
-    print(f"DEBUG - Unité de temps ajoutée: '{unite}' -> '{unit_abbrev}' en C20")
+    logger.debug("Unité de temps ajoutée: '%s' -> '%s' en C20", unite, unit_abbrev)
 
     # Sauvegarder le fichier
     wb.save(output)
@@ -507,9 +492,9 @@ def parse_jobshop_excel(file_content: bytes) -> Dict:
         Dict contenant les données formatées pour l'API Jobshop
     """
     try:
-        # Lire le fichier Excel
+        # Lire le fichier Excel : seules les 20 premières lignes du modèle sont utilisées (unité en C20)
         excel_file = io.BytesIO(file_content)
-        df = pd.read_excel(excel_file, header=None)
+        df = pd.read_excel(excel_file, header=None, nrows=20)
         
         # Vérifier la structure minimale
         if df.shape[0] < 20 or df.shape[1] < 14:
@@ -634,12 +619,11 @@ def parse_jobshop_excel(file_content: bytes) -> Dict:
             error_msg = "Erreurs dans le fichier Excel Jobshop:\n" + "\n".join(f"• {err}" for err in errors[:10])
             if len(errors) > 10:
                 error_msg += f"\n... et {len(errors) - 10} autres erreurs"
-            raise HTTPException(status_code=400, detail=error_msg)
+            raise ExcelImportError(error_msg)
         
         if not job_names:
-            raise HTTPException(
-                status_code=400,
-                detail="Aucun job valide trouvé. Vérifiez que vous avez rempli les noms de jobs et au moins une tâche par job au format (séquence, temps)."
+            raise ExcelImportError(
+                "Aucun job valide trouvé. Vérifiez que vous avez rempli les noms de jobs et au moins une tâche par job au format (séquence, temps)."
             )
         
         # Lire les noms des machines depuis les en-têtes (ligne 5, colonnes D-M)
@@ -672,9 +656,9 @@ def parse_jobshop_excel(file_content: bytes) -> Dict:
         }
         
     except Exception as e:
-        if isinstance(e, HTTPException):
+        if isinstance(e, ExcelImportError):
             raise e
-        raise HTTPException(status_code=400, detail=f"Erreur lors de la lecture du fichier Excel Jobshop: {str(e)}")
+        raise ExcelImportError(f"Erreur lors de la lecture du fichier Excel Jobshop: {str(e)}")
 
 def export_jobshop_data_to_excel(
     jobs_data: List[List[Dict]],  # Format: [[{'sequence': int, 'machine': int, 'duration': float}]]
@@ -808,9 +792,10 @@ def parse_flowshop_mm_excel(file_content: bytes) -> Dict:
         Dict contenant les données formatées pour l'API FlowshopMM
     """
     try:
-        # Lire le fichier Excel
+        # Lire le fichier Excel : seules les 20 premières lignes du modèle sont utilisées (jobs, unité en C20),
+        # la lecture (openpyxl en lecture seule) s'arrête après elles quelle que soit la taille de la feuille
         excel_file = io.BytesIO(file_content)
-        df = pd.read_excel(excel_file, header=None)
+        df = pd.read_excel(excel_file, header=None, nrows=20)
         
         # Vérifier la structure minimale
         if df.shape[0] < 20 or df.shape[1] < 14:
@@ -929,12 +914,11 @@ def parse_flowshop_mm_excel(file_content: bytes) -> Dict:
             error_msg = "Erreurs dans le fichier Excel FlowshopMM:\n" + "\n".join(f"• {err}" for err in errors[:10])
             if len(errors) > 10:
                 error_msg += f"\n... et {len(errors) - 10} autres erreurs"
-            raise HTTPException(status_code=400, detail=error_msg)
+            raise ExcelImportError(error_msg)
         
         if not job_names:
-            raise HTTPException(
-                status_code=400,
-                detail="Aucun job valide trouvé. Vérifiez que vous avez rempli les noms de jobs et au moins une durée par job (format: 35 ou 35; 43.4; 33.5)."
+            raise ExcelImportError(
+                "Aucun job valide trouvé. Vérifiez que vous avez rempli les noms de jobs et au moins une durée par job (format: 35 ou 35; 43.4; 33.5)."
             )
         
         # Lire les noms des machines depuis les en-têtes (ligne 5, colonnes D-M)
@@ -977,9 +961,9 @@ def parse_flowshop_mm_excel(file_content: bytes) -> Dict:
         }
         
     except Exception as e:
-        if isinstance(e, HTTPException):
+        if isinstance(e, ExcelImportError):
             raise e
-        raise HTTPException(status_code=400, detail=f"Erreur lors de la lecture du fichier Excel FlowshopMM: {str(e)}")
+        raise ExcelImportError(f"Erreur lors de la lecture du fichier Excel FlowshopMM: {str(e)}")
 
 def export_flowshop_mm_data_to_excel(
     jobs_data: List[List[List[List[float]]]],  # Format FlowshopMM: job -> stage -> alternatives -> [machine_id, duration]
@@ -1125,10 +1109,10 @@ def export_manual_data_to_excel(
         raise ValueError(f"Le nombre de dates d'échéance ({len(due_dates)}) ne correspond pas au nombre de jobs ({num_jobs})")
     
     # Debug : afficher les données reçues
-    print(f"DEBUG - jobs_data: {jobs_data}")
-    print(f"DEBUG - due_dates: {due_dates}")
-    print(f"DEBUG - job_names: {job_names}")
-    print(f"DEBUG - machine_names: {machine_names}")
+    logger.debug("jobs_data: %s", jobs_data)
+    logger.debug("due_dates: %s", due_dates)
+    logger.debug("job_names: %s", job_names)
+    logger.debug("machine_names: %s", machine_names)
     
     # Normaliser les données des jobs pour s'assurer qu'elles ont toutes la bonne longueur
     normalized_jobs_data = []
@@ -1144,11 +1128,11 @@ def export_manual_data_to_excel(
                         duration = 0.0
                     normalized_job.append(duration)
                 normalized_jobs_data.append(normalized_job)
-                print(f"DEBUG - Job {job_idx} ({job_names[job_idx]}): {job} -> {normalized_job}")
+                logger.debug("Job %s (%s): %s -> %s", job_idx, job_names[job_idx], job, normalized_job)
             else:
                 # Si ce n'est pas une liste, créer une liste de zéros
                 normalized_jobs_data.append([0.0] * len(machine_names))
-                print(f"DEBUG - Job {job_idx} ({job_names[job_idx]}): Not a list, created zeros")
+                logger.debug("Job %s (%s): Not a list, created zeros", job_idx, job_names[job_idx])
         except (ValueError, TypeError) as e:
             raise ValueError(f"Erreur dans les données du job '{job_names[job_idx]}': {str(e)}")
     
@@ -1227,14 +1211,14 @@ def export_manual_data_to_excel(
         for machine_idx in range(10):  # TOUJOURS 10 colonnes de machines
             if job_idx < len(normalized_jobs_data) and machine_idx < len(normalized_jobs_data[job_idx]):
                 duration = normalized_jobs_data[job_idx][machine_idx]
-                print(f"DEBUG - Writing job {job_idx}, machine {machine_idx}: duration = {duration} (type: {type(duration)})")
+                logger.debug("Writing job %s, machine %s: duration = %s (type: %s)", job_idx, machine_idx, duration, type(duration))
             else:
                 duration = ""  # Cellule vide si pas de données
-                print(f"DEBUG - No data for job {job_idx}, machine {machine_idx}: setting empty")
+                logger.debug("No data for job %s, machine %s: setting empty", job_idx, machine_idx)
                 
             cell = ws.cell(row=6+job_idx, column=4+machine_idx, value=duration)
             cell.border = border
-            print(f"DEBUG - Cell ({6+job_idx}, {4+machine_idx}) = {cell.value}")
+            logger.debug("Cell (%s, %s) = %s", 6+job_idx, 4+machine_idx, cell.value)
     
     # Ajuster la largeur des colonnes (C à N)
     for col in range(3, 15):  # De C=3 à N=14
@@ -1289,7 +1273,7 @@ def export_manual_data_to_excel(
     unit_abbrev = unit_mapping.get(unite.lower(), unite.lower())
     ws.cell(row=20, column=3, value=unit_abbrev)
     
-    print(f"DEBUG - Unité de temps ajoutée: '{unite}' -> '{unit_abbrev}' en C20")
+    logger.debug("Unité de temps ajoutée: '%s' -> '%s' en C20", unite, unit_abbrev)
 
     # Sauvegarder dans le BytesIO
     wb.save(output)
@@ -1433,12 +1417,11 @@ async def parse_ligne_assemblage_excel(file) -> Dict:
             error_msg = "Erreurs dans le fichier Excel:\n" + "\n".join(f"• {err}" for err in errors[:10])
             if len(errors) > 10:
                 error_msg += f"\n... et {len(errors) - 10} autres erreurs"
-            raise HTTPException(status_code=400, detail=error_msg)
+            raise ExcelImportError(error_msg)
         
         if not tasks_data:
-            raise HTTPException(
-                status_code=400,
-                detail="Aucune tâche valide trouvée. Vérifiez que vous avez rempli les noms, durées et prédécesseurs."
+            raise ExcelImportError(
+                "Aucune tâche valide trouvée. Vérifiez que vous avez rempli les noms, durées et prédécesseurs."
             )
         
         return {
@@ -1448,9 +1431,9 @@ async def parse_ligne_assemblage_excel(file) -> Dict:
         }
         
     except Exception as e:
-        if isinstance(e, HTTPException):
+        if isinstance(e, ExcelImportError):
             raise e
-        raise HTTPException(status_code=400, detail=f"Erreur lors de la lecture du fichier Excel: {str(e)}")
+        raise ExcelImportError(f"Erreur lors de la lecture du fichier Excel: {str(e)}")
 
 
 def export_ligne_assemblage_to_excel(
@@ -1477,7 +1460,7 @@ def export_ligne_assemblage_to_excel(
         bytes: Contenu du fichier Excel
     """
     try:
-        from fastapi.responses import StreamingResponse
+        from fastapi.responses import Response
         
         # Validation des données d'entrée
         if not tasks_data:
@@ -1619,15 +1602,15 @@ def export_ligne_assemblage_to_excel(
         wb.save(output)
         output.seek(0)
         
-        # Retourner une réponse de streaming
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        # Retourner le classeur en une seule réponse
+        return Response(
+            content=output.getvalue(),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename=Export_{algorithm_name}_LigneAssemblage.xlsx"}
         )
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+        raise ExcelExportError(f"Erreur lors de l'export: {str(e)}")
 
 async def parse_precedence_excel(file) -> Dict:
     """
@@ -1753,12 +1736,11 @@ async def parse_precedence_excel(file) -> Dict:
             error_msg = "Erreurs dans le fichier Excel:\n" + "\n".join(f"• {err}" for err in errors[:10])
             if len(errors) > 10:
                 error_msg += f"\n... et {len(errors) - 10} autres erreurs"
-            raise HTTPException(status_code=400, detail=error_msg)
+            raise ExcelImportError(error_msg)
         
         if not tasks_data:
-            raise HTTPException(
-                status_code=400,
-                detail="Aucune tâche valide trouvée. Vérifiez que vous avez rempli les noms, durées et prédécesseurs."
+            raise ExcelImportError(
+                "Aucune tâche valide trouvée. Vérifiez que vous avez rempli les noms, durées et prédécesseurs."
             )
         
         return {
@@ -1767,9 +1749,9 @@ async def parse_precedence_excel(file) -> Dict:
         }
         
     except Exception as e:
-        if isinstance(e, HTTPException):
+        if isinstance(e, ExcelImportError):
             raise e
-        raise HTTPException(status_code=400, detail=f"Erreur lors de la lecture du fichier Excel: {str(e)}")
+        raise ExcelImportError(f"Erreur lors de la lecture du fichier Excel: {str(e)}")
 
 
 def export_precedence_to_excel(
@@ -1796,7 +1778,7 @@ def export_precedence_to_excel(
         bytes: Contenu du fichier Excel
     """
     try:
-        from fastapi.responses import StreamingResponse
+        from fastapi.responses import Response
         
         # Validation des données d'entrée
         if not tasks_data:
@@ -1939,15 +1921,15 @@ def export_precedence_to_excel(
         wb.save(output)
         output.seek(0)
         
-        # Retourner une réponse de streaming
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
+        # Retourner le classeur en une seule réponse
+        return Response(
+            content=output.getvalue(),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename=Export_{algorithm_name}_Precedences.xlsx"}
         )
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+        raise ExcelExportError(f"Erreur lors de l'export: {str(e)}")
 
 
 def export_ligne_assemblage_mixte_equilibrage_to_excel(
@@ -1984,8 +1966,6 @@ def export_ligne_assemblage_mixte_equilibrage_to_excel(
         bytes: Contenu du fichier Excel
     """
     try:
-        from fastapi.responses import StreamingResponse
-        
         # Validation
         if not products_data or not tasks_data:
             raise ValueError("Données de produits et tâches requises")
@@ -2224,7 +2204,7 @@ def export_ligne_assemblage_mixte_equilibrage_to_excel(
         return output.getvalue()
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+        raise ExcelExportError(f"Erreur lors de l'export: {str(e)}")
 
 
 async def parse_ligne_assemblage_mixte_equilibrage_excel(file) -> Dict:
@@ -2248,8 +2228,8 @@ async def parse_ligne_assemblage_mixte_equilibrage_excel(file) -> Dict:
         Dict contenant les données formatées pour l'API
     """
     try:
-        print(f"Début du parsing pour équilibrage mixte")
-        print(f"Type de fichier reçu: {type(file)}")
+        logger.debug("Début du parsing pour équilibrage mixte")
+        logger.debug("Type de fichier reçu: %s", type(file))
         
         # Lire le fichier Excel - s'assurer qu'on lit le contenu correctement
         if hasattr(file, 'file'):
@@ -2259,11 +2239,11 @@ async def parse_ligne_assemblage_mixte_equilibrage_excel(file) -> Dict:
         else:
             # Fichier direct
             df = pd.read_excel(file, header=None)
-        print(f"Fichier Excel lu, dimensions: {df.shape}")
+        logger.debug("Fichier Excel lu, dimensions: %s", df.shape)
         
         # Vérifier la structure minimale
         if df.shape[0] < 10 or df.shape[1] < 16:
-            print(f"Structure insuffisante: {df.shape[0]} lignes, {df.shape[1]} colonnes")
+            logger.debug("Structure insuffisante: %s lignes, %s colonnes", df.shape[0], df.shape[1])
             raise ValueError(f"Structure de fichier incorrecte - taille insuffisante: {df.shape[0]} lignes x {df.shape[1]} colonnes (minimum requis: 10x16)")
         
         # Extraire l'unité de temps (P6)
@@ -2327,7 +2307,7 @@ async def parse_ligne_assemblage_mixte_equilibrage_excel(file) -> Dict:
                 })
                 
             except Exception as e:
-                print(f"Erreur lors de la lecture du produit {i+1}: {e}")
+                logger.exception("Erreur lors de la lecture du produit %s: %s", i+1, e)
                 break
         
         if not products_data:
@@ -2428,7 +2408,7 @@ async def parse_ligne_assemblage_mixte_equilibrage_excel(file) -> Dict:
             error_msg = "Avertissements lors de l'import:\n" + "\n".join(f"• {err}" for err in errors[:10])
             if len(errors) > 10:
                 error_msg += f"\n... et {len(errors) - 10} autres avertissements"
-            print(f"Import warnings: {error_msg}")
+            logger.warning("Import warnings: %s", error_msg)
         
         return {
             "products_data": products_data,
@@ -2438,14 +2418,11 @@ async def parse_ligne_assemblage_mixte_equilibrage_excel(file) -> Dict:
         }
         
     except Exception as e:
-        print(f"Erreur dans parse_ligne_assemblage_mixte_equilibrage_excel: {str(e)}")
-        print(f"Type d'erreur: {type(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Erreur dans parse_ligne_assemblage_mixte_equilibrage_excel: %s", e)
         
-        if isinstance(e, HTTPException):
+        if isinstance(e, ExcelImportError):
             raise e
-        raise HTTPException(status_code=400, detail=f"Erreur lors de la lecture du fichier Excel: {str(e)}")
+        raise ExcelImportError(f"Erreur lors de la lecture du fichier Excel: {str(e)}")
 
 
 def export_ligne_assemblage_mixte_goulot_to_excel(
@@ -2664,7 +2641,7 @@ def export_ligne_assemblage_mixte_goulot_to_excel(
         return output.getvalue()
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+        raise ExcelExportError(f"Erreur lors de l'export: {str(e)}")
 
 
 async def parse_ligne_assemblage_mixte_goulot_excel(file) -> Dict:
@@ -2690,8 +2667,8 @@ async def parse_ligne_assemblage_mixte_goulot_excel(file) -> Dict:
         Dict contenant les données formatées pour l'API
     """
     try:
-        print(f"Début du parsing pour goulot mixte")
-        print(f"Type de fichier reçu: {type(file)}")
+        logger.debug("Début du parsing pour goulot mixte")
+        logger.debug("Type de fichier reçu: %s", type(file))
         
         # Lire le fichier Excel - s'assurer qu'on lit le contenu correctement
         if hasattr(file, 'file'):
@@ -2701,11 +2678,11 @@ async def parse_ligne_assemblage_mixte_goulot_excel(file) -> Dict:
         else:
             # Fichier direct
             df = pd.read_excel(file, header=None)
-        print(f"Fichier Excel lu, dimensions: {df.shape}")
+        logger.debug("Fichier Excel lu, dimensions: %s", df.shape)
         
         # Vérifier la structure minimale
         if df.shape[0] < 10 or df.shape[1] < 10:
-            print(f"Structure insuffisante: {df.shape[0]} lignes, {df.shape[1]} colonnes")
+            logger.debug("Structure insuffisante: %s lignes, %s colonnes", df.shape[0], df.shape[1])
             raise ValueError(f"Structure de fichier incorrecte - taille insuffisante: {df.shape[0]} lignes x {df.shape[1]} colonnes (minimum requis: 10x10)")
         
         # Extraire l'unité de temps (J13)
@@ -2772,7 +2749,7 @@ async def parse_ligne_assemblage_mixte_goulot_excel(file) -> Dict:
                 })
                 
             except Exception as e:
-                print(f"Erreur lors de la lecture du produit {i+1}: {e}")
+                logger.exception("Erreur lors de la lecture du produit %s: %s", i+1, e)
                 break
         
         if not products_data:
@@ -2841,7 +2818,7 @@ async def parse_ligne_assemblage_mixte_goulot_excel(file) -> Dict:
             error_msg = "Avertissements lors de l'import:\n" + "\n".join(f"• {err}" for err in errors[:10])
             if len(errors) > 10:
                 error_msg += f"\n... et {len(errors) - 10} autres avertissements"
-            print(f"Import warnings: {error_msg}")
+            logger.warning("Import warnings: %s", error_msg)
         
         return {
             "products_data": products_data,
@@ -2852,12 +2829,9 @@ async def parse_ligne_assemblage_mixte_goulot_excel(file) -> Dict:
         }
         
     except Exception as e:
-        print(f"Erreur dans parse_ligne_assemblage_mixte_goulot_excel: {str(e)}")
-        print(f"Type d'erreur: {type(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Erreur dans parse_ligne_assemblage_mixte_goulot_excel: %s", e)
         
-        if isinstance(e, HTTPException):
+        if isinstance(e, ExcelImportError):
             raise e
-        raise HTTPException(status_code=400, detail=f"Erreur lors de la lecture du fichier Excel: {str(e)}")
+        raise ExcelImportError(f"Erreur lors de la lecture du fichier Excel: {str(e)}")
  
\ No newline at end of file
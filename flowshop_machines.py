@@ -1,22 +1,27 @@
 import collections
 from ortools.sat.python import cp_model
-import matplotlib.pyplot as plt
+from chart_utils import subplots, add_bars
 import matplotlib.patches as patches
 import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
 
 def debug_jobs_data(jobs_data, due_dates):
     """Debug function to trace data structure"""
-    print("=== DEBUG FLOWSHOP FLEXIBLE ===")
-    print(f"Nombre de jobs: {len(jobs_data)}")
-    print(f"Due dates: {due_dates}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("=== DEBUG FLOWSHOP FLEXIBLE ===")
+    logger.debug("Nombre de jobs: %s", len(jobs_data))
+    logger.debug("Due dates: %s", due_dates)
     
     for job_idx, job in enumerate(jobs_data):
-        print(f"Job {job_idx + 1}: {len(job)} étapes")
+        logger.debug("Job %s: %s étapes", job_idx + 1, len(job))
         for task_idx, alternatives in enumerate(job):
-            print(f"  Étape {task_idx + 1}: {len(alternatives)} alternatives")
+            logger.debug("  Étape %s: %s alternatives", task_idx + 1, len(alternatives))
             for alt_idx, (machine_id, duration) in enumerate(alternatives):
-                print(f"    Machine {machine_id}: durée {duration} (type: {type(duration)})")
-    print("=" * 35)
+                logger.debug("    Machine %s: durée %s (type: %s)", machine_id, duration, type(duration))
+    logger.debug("=" * 35)
 
 def solve_flexible_flowshop(jobs_data, due_dates, machine_names=None, stage_names=None, machines_per_stage=None, machine_priorities=None):
     """
@@ -142,10 +147,10 @@ def solve_flexible_flowshop(jobs_data, due_dates, machine_names=None, stage_name
             model.Add(combined_objective == obj_var * 10000 + total_penalty)
             model.Minimize(combined_objective)
             
-            print(f"Priorités des machines activées: {machine_priorities}")
+            logger.debug("Priorités des machines activées: %s", machine_priorities)
         else:
             model.Minimize(obj_var)
-            print("Pas de priorités valides, utilisation de l'objectif standard")
+            logger.debug("Pas de priorités valides, utilisation de l'objectif standard")
     else:
         model.Minimize(obj_var)
 
@@ -187,9 +192,9 @@ def solve_flexible_flowshop(jobs_data, due_dates, machine_names=None, stage_name
     flowtime = sum(completion_times) / len(completion_times)
     total_delay = sum(max(0, ct - dd) for ct, dd in zip(completion_times, due_dates))
 
-    print(f"Makespan (Cmax): {makespan}")
-    print(f"Flowtime (F): {flowtime}")
-    print(f"Retard cumulé (Rc): {total_delay}")
+    logger.debug("Makespan (Cmax): %s", makespan)
+    logger.debug("Flowtime (F): %s", flowtime)
+    logger.debug("Retard cumulé (Rc): %s", total_delay)
 
     # Formatter les résultats pour l'interface web
     machines_formatted = {}
@@ -220,17 +225,19 @@ def solve_flexible_flowshop(jobs_data, due_dates, machine_names=None, stage_name
     }
 
 
-def create_gantt_chart(jobs_data, due_dates, machine_names=None, stage_names=None, machines_per_stage=None, machine_priorities=None):
+def create_gantt_chart(jobs_data, due_dates, machine_names=None, stage_names=None, machines_per_stage=None, machine_priorities=None, result=None):
     """
     Crée un diagramme de Gantt pour la solution du flowshop flexible
     AVEC le même visuel standardisé que les autres algorithmes
+    (result : solution déjà calculée par solve_flexible_flowshop, sinon le problème est résolu ici)
     """
     # Résoudre d'abord le problème
-    result = solve_flexible_flowshop(jobs_data, due_dates, machine_names, stage_names, machines_per_stage, machine_priorities)
+    if result is None:
+        result = solve_flexible_flowshop(jobs_data, due_dates, machine_names, stage_names, machines_per_stage, machine_priorities)
     
     if result["status"] == "no_solution":
         # Créer un graphique vide en cas de pas de solution
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = subplots(figsize=(10, 6))
         ax.text(0.5, 0.5, 'Aucune solution trouvée', ha='center', va='center', transform=ax.transAxes)
         ax.set_title("Flow Shop Scheduling - Pas de solution")
         return fig
@@ -259,7 +266,7 @@ def create_gantt_chart(jobs_data, due_dates, machine_names=None, stage_names=Non
     # Calculer la taille optimale selon le nombre de machines
     num_machines = len(machine_display_names)
     fig_height = max(4, num_machines * 0.8 + 2)
-    fig, ax = plt.subplots(figsize=(14, fig_height))
+    fig, ax = subplots(figsize=(14, fig_height))
     
     # Style professionnel (comme create_gantt_figure)
     ax.set_facecolor('#f8f9fa')
@@ -271,27 +278,23 @@ def create_gantt_chart(jobs_data, due_dates, machine_names=None, stage_names=Non
 
     # Inverser l'ordre des étiquettes pour que la plus petite machine soit en haut
     reversed_machine_names = list(reversed(machine_display_names))
+    y_positions = {label: y for y, label in enumerate(reversed_machine_names)}
     ax.set_yticks(range(len(machine_display_names)))
     ax.set_yticklabels(reversed_machine_names)
 
     # Hauteur des barres
     bar_height = 0.6
 
-    # Dessiner les tâches avec le nouveau style (utiliser l'ordre inversé)
+    # Dessiner les tâches avec le nouveau style (utiliser l'ordre inversé) : toutes les barres
+    # dans une seule collection, toutes les ombres dans une autre
+    bars, bar_colors = [], []
     for y, label in enumerate(reversed_machine_names):
         machine_id = display_name_to_id[label]
         if machine_id in result["machines"]:
             for task in result["machines"][machine_id]:
                 job_idx = task["job"] - 1  # Ajuster l'index (jobs commencent à 1)
-                color = colors[job_idx % len(colors)]
-                
-                # Créer la barre avec bordure (style professionnel)
-                bar = ax.barh(y, task["duration"], left=task["start"], height=bar_height, 
-                             color=color, alpha=0.9, edgecolor='white', linewidth=1.5)
-                
-                # Ajouter une ombre subtile
-                shadow = ax.barh(y, task["duration"], left=task["start"] + 0.1, color='black', 
-                               height=bar_height, alpha=0.1, zorder=0)
+                bars.append((task["start"], y - bar_height / 2, task["duration"], bar_height))
+                bar_colors.append(colors[job_idx % len(colors)])
                 
                 # Texte du job avec style amélioré
                 text_color = 'white'
@@ -309,7 +312,7 @@ def create_gantt_chart(jobs_data, due_dates, machine_names=None, stage_names=Non
     for group_labels in base_to_group.values():
         if len(group_labels) > 1:
             # Utiliser l'ordre inversé pour les positions Y
-            ys = [reversed_machine_names.index(lab) for lab in group_labels]
+            ys = [y_positions[lab] for lab in group_labels]
             y_min = min(ys) - 0.4
             height = len(ys) * 1.0 - 0.2
             ax.add_patch(
@@ -319,6 +322,13 @@ def create_gantt_chart(jobs_data, due_dates, machine_names=None, stage_names=Non
                 )
             )
 
+    # Barres ajoutées après les rectangles de groupe : la mise à l'échelle des axes les inclut
+    if bars:
+        # Barres avec bordure (style professionnel)
+        add_bars(ax, bars, facecolors=bar_colors, alpha=0.9, edgecolor='white', linewidth=1.5)
+        # Ajouter une ombre subtile
+        add_bars(ax, [(x + 0.1, y, w, h) for x, y, w, h in bars], facecolors='black', alpha=0.1, zorder=0)
+
     # Ajouter le cadrillage avec des valeurs rondes (comme create_gantt_figure)
     max_time = result["makespan"]
     if max_time > 0:
@@ -420,7 +430,7 @@ def create_gantt_chart(jobs_data, due_dates, machine_names=None, stage_names=Non
                  frameon=True, fancybox=True, shadow=True, fontsize=9)
     
     # Ajuster les marges
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Ajouter une bordure autour du graphique
     for spine in ax.spines.values():
@@ -443,6 +453,6 @@ if __name__ == '__main__':
     result = solve_flexible_flowshop(jobs_data, due_dates)
     print("Résultat:", result)
     
-    # Créer et afficher le diagramme de Gantt
+    # Créer et enregistrer le diagramme de Gantt
     fig = create_gantt_chart(jobs_data, due_dates)
-    plt.show()
+    fig.savefig("gantt_flowshop_machines_multiples.png")
@@ -1,7 +1,6 @@
-import matplotlib.pyplot as plt
+from chart_utils import subplots, figure_bytes
 import matplotlib.patches as patches
 from typing import List, Tuple, Dict, Any, Optional
-import io
 import base64
 from pydantic import BaseModel
 import numpy as np
@@ -313,15 +312,17 @@ def format_assignments_for_output(assignments, noms_machines):
         formatted_assignments.append(machine_data)
     return formatted_assignments
 
-def generate_fms_lots_chargement_heuristique_chart(request: FMSLotsChargementHeuristiqueRequest):
+def generate_fms_lots_chargement_heuristique_chart(request: FMSLotsChargementHeuristiqueRequest, result=None, fmt="png", dpi=300, figsize=None):
     """
     Génère un graphique d'analyse pour les lots de chargement heuristique
+    (result peut être fourni pour éviter une seconde résolution)
     """
     try:
-        result = solve_fms_lots_chargement_heuristique(request)
+        if result is None:
+            result = solve_fms_lots_chargement_heuristique(request)
         
         # Configuration du graphique
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = subplots(2, 2, figsize=figsize or (16, 12))
         fig.suptitle('Analyse FMS - Lots de Chargement (Heuristique)', fontsize=16, fontweight='bold')
         
         # 1. Nombre d'opérations vs clusters vs groupes
@@ -443,26 +444,20 @@ def generate_fms_lots_chargement_heuristique_chart(request: FMSLotsChargementHeu
                     transform=ax4.transAxes, fontsize=12)
             ax4.set_title('Répartition Globale', fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Sauvegarder en mémoire
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
+        image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
         
-        return img_buffer
+        return image_data
         
     except Exception as e:
         # Créer un graphique d'erreur
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = subplots(figsize=figsize or (10, 6))
         ax.text(0.5, 0.5, f'Erreur lors de la génération du graphique:\n{str(e)}', 
                 ha='center', va='center', transform=ax.transAxes, fontsize=12)
         ax.set_title('Erreur - Analyse FMS Lots de Chargement Heuristique')
         
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
+        image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
         
-        return img_buffer 
\ No newline at end of file
+        return image_data 
\ No newline at end of file
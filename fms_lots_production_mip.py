@@ -1,11 +1,10 @@
-import matplotlib.pyplot as plt
+from chart_utils import subplots, figure_bytes
 import matplotlib.patches as patches
 from typing import List, Tuple, Dict, Any, Optional
-import io
 import base64
 from pydantic import BaseModel
 import numpy as np
-from pulp import LpProblem, LpVariable, lpSum, LpMinimize, LpStatus, LpBinary
+from pulp import LpProblem, LpVariable, lpSum, LpMinimize, LpStatus, LpBinary, PULP_CBC_CMD
 
 class FMSLotsProductionMIPRequest(BaseModel):
     # Configuration des produits
@@ -25,10 +24,22 @@ class FMSLotsProductionMIPRequest(BaseModel):
     espace_outils: List[List[int]]             # [[1, 1], [1, 1], ...] espace requis par outil
     unite_temps: str = "minutes"
 
+def problem_structure(request: FMSLotsProductionMIPRequest) -> Tuple:
+    """Structure du problème (nombre de produits, horizon, outils par machine) : fixe les noms des variables MIP"""
+    return (len(request.noms_produits), max(request.dates_dues, default=0), tuple(len(o) for o in request.outils_disponibles))
+
 def solve_fms_lots_production_mip(request: FMSLotsProductionMIPRequest) -> Dict[str, Any]:
     """
     Résout le problème de lots de production FMS avec l'algorithme MIP (PuLP)
     """
+    return solve_fms_lots_production_mip_warm(request)[0]
+
+def solve_fms_lots_production_mip_warm(request: FMSLotsProductionMIPRequest, warm_start: Optional[Dict[str, float]] = None) -> Tuple[Dict[str, Any], Optional[Dict[str, float]]]:
+    """
+    Comme solve_fms_lots_production_mip, en partant de warm_start (valeurs des variables d'une solution
+    précédente de même structure, voir problem_structure) ; retourne aussi les valeurs de la solution
+    si elle est optimale, pour la résolution suivante
+    """
     try:
         # Préparation des données
         produits = []
@@ -101,8 +112,14 @@ def solve_fms_lots_production_mip(request: FMSLotsProductionMIPRequest) -> Dict[
             for t in range(T):
                 prob += lpSum(espace_outil[j][l] * y[j][l][t] for l in range(len(outils[j]))) <= outils_max[j]
         
-        # Résoudre le problème
-        prob.solve()
+        # Résoudre le problème (démarrage à chaud si une solution de même structure est fournie)
+        if warm_start is None:
+            prob.solve()
+        else:
+            for var in prob.variables():
+                if var.name in warm_start:
+                    var.setInitialValue(warm_start[var.name])
+            prob.solve(PULP_CBC_CMD(warmStart=True))
         
         # Extraction des résultats
         status = LpStatus[prob.status]
@@ -176,6 +193,8 @@ def solve_fms_lots_production_mip(request: FMSLotsProductionMIPRequest) -> Dict[
             resultats_machines[f"nb_{machine_key}"] = request.nb_machines[j]
             resultats_machines[f"temps_disponible_par_periode_{machine_key}"] = round(temps_max[j], 2)  # Per period capacity
         
+        solution = {var.name: var.varValue for var in prob.variables()} if status == "Optimal" else None
+        
         return {
             "status": status,
             "methode": "Mixed Integer Programming (MIP)",
@@ -205,7 +224,7 @@ def solve_fms_lots_production_mip(request: FMSLotsProductionMIPRequest) -> Dict[
             "nombre_periodes": T,
             "nombre_produits": len(request.noms_produits),
             "nombre_machines": len(request.noms_machines)
-        }
+        }, solution
         
     except Exception as e:
         return {
@@ -214,17 +233,19 @@ def solve_fms_lots_production_mip(request: FMSLotsProductionMIPRequest) -> Dict[
             "message": f"Erreur lors du calcul: {str(e)}",
             "planification_periodes": [],
             "cout_total_inventaire": 0
-        }
+        }, None
 
-def generate_fms_lots_production_mip_chart(request: FMSLotsProductionMIPRequest):
+def generate_fms_lots_production_mip_chart(request: FMSLotsProductionMIPRequest, result=None, fmt="png", dpi=300, figsize=None):
     """
     Génère un graphique d'analyse pour les lots de production MIP
+    (result peut être fourni pour éviter une seconde résolution)
     """
     try:
-        result = solve_fms_lots_production_mip(request)
+        if result is None:
+            result = solve_fms_lots_production_mip(request)
         
         # Configuration du graphique
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = subplots(2, 2, figsize=figsize or (16, 12))
         fig.suptitle('Analyse FMS - Lots de Production (Mixed Integer Programming)', fontsize=16, fontweight='bold')
         
         # 1. Utilisation des machines
@@ -334,26 +355,20 @@ def generate_fms_lots_production_mip_chart(request: FMSLotsProductionMIPRequest)
                     transform=ax4.transAxes, fontsize=12)
             ax4.set_title('Planning Production par Période', fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Sauvegarder en mémoire
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
+        image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
         
-        return img_buffer
+        return image_data
         
     except Exception as e:
         # Créer un graphique d'erreur
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = subplots(figsize=figsize or (10, 6))
         ax.text(0.5, 0.5, f'Erreur lors de la génération du graphique:\n{str(e)}', 
                 ha='center', va='center', transform=ax.transAxes, fontsize=12)
         ax.set_title('Erreur - Analyse FMS Lots de Production MIP')
         
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close()
+        image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
         
-        return img_buffer 
\ No newline at end of file
+        return image_data 
\ No newline at end of file
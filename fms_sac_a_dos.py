@@ -1,7 +1,5 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import io
-import base64
+from chart_utils import subplots, figure_bytes
 from pydantic import BaseModel
 from typing import List
 import matplotlib
@@ -125,13 +123,13 @@ def solve_fms_sac_a_dos(request: FMSSacADosRequest):
             "produits_non_selectionnes": []
         }
 
-def generate_fms_sac_a_dos_chart(result):
+def generate_fms_sac_a_dos_chart(result, fmt="png", dpi=300, figsize=None):
     """Génère les graphiques d'analyse du sac à dos FMS"""
     try:
         if result["status"] == "Erreur":
             raise ValueError(result.get("message", "Erreur inconnue"))
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = subplots(2, 2, figsize=figsize or (15, 12))
         fig.suptitle('Analyse FMS - Algorithme du Sac à Dos', fontsize=16, fontweight='bold')
         
         # Graphique 1: Profits par produit sélectionné
@@ -213,28 +211,20 @@ def generate_fms_sac_a_dos_chart(result):
             ax4.text(bar.get_x() + bar.get_width()/2., height,
                     valeur, ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Sauvegarde en base64
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
+        # Sauvegarder en mémoire
+        image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
         
-        return image_base64
+        return image_data
         
     except Exception as e:
         # Créer un graphique d'erreur simple
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = subplots(figsize=figsize or (10, 6))
         ax.text(0.5, 0.5, f'Erreur lors de la génération du graphique:\n{str(e)}', 
                 ha='center', va='center', transform=ax.transAxes, fontsize=12)
         ax.set_title('Erreur - Graphique FMS Sac à Dos')
         
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
+        image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
         
-        return image_base64 
\ No newline at end of file
+        return image_data 
\ No newline at end of file
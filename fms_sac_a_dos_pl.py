@@ -1,10 +1,21 @@
 import numpy as np
-from pulp import LpMaximize, LpProblem, LpStatus, lpSum, LpVariable
-import matplotlib.pyplot as plt
+from pulp import LpMaximize, LpProblem, LpStatus, LpAffineExpression, LpVariable
+from chart_utils import subplots, figure_bytes
 import matplotlib
 matplotlib.use('Agg')
-import io
 import base64
+from pydantic import BaseModel
+from typing import List, Union
+
+class FMSSacADosPLRequest(BaseModel):
+    vente_unite: List[float]  # Prix de vente par unité
+    cout_mp_unite: List[float]  # Coût matière première par unité
+    demande_periode: List[float]  # Demande par période
+    temps_fabrication_unite: List[float]  # Temps de fabrication par unité
+    cout_op: float  # Coût d'opération par heure
+    capacite_max: Union[int, float]  # Capacité maximale en heures (entier conservé pour l'affichage)
+    noms_produits: List[str]  # Noms des produits
+    unite: str  # Unité de temps
 
 def fms_sac_a_dos_pl(vente_unite, cout_mp_unite, demande_periode, temps_fabrication_unite, cout_op, capacite_max, noms_produits, unite):
     """
@@ -24,11 +35,11 @@ def fms_sac_a_dos_pl(vente_unite, cout_mp_unite, demande_periode, temps_fabricat
         dict: Résultats de l'optimisation
     """
     
-    # Conversion en arrays numpy
-    vente_unite = np.array(vente_unite)
-    cout_mp_unite = np.array(cout_mp_unite)
-    demande_periode = np.array(demande_periode)
-    temps_fabrication_unite = np.array(temps_fabrication_unite)
+    # Conversion en arrays numpy (une seule fois, à l'entrée du solveur)
+    vente_unite = np.asarray(vente_unite, dtype=np.float64)
+    cout_mp_unite = np.asarray(cout_mp_unite, dtype=np.float64)
+    demande_periode = np.asarray(demande_periode, dtype=np.float64)
+    temps_fabrication_unite = np.asarray(temps_fabrication_unite, dtype=np.float64)
     
     n_produits = len(vente_unite)
     
@@ -43,13 +54,13 @@ def fms_sac_a_dos_pl(vente_unite, cout_mp_unite, demande_periode, temps_fabricat
     model = LpProblem(name="fms-sac-a-dos-pl", sense=LpMaximize)
     
     # Création des variables binaires (x[i] = 1 si produit i sélectionné, 0 sinon)
-    x = {i: LpVariable(name=f"x{i}", lowBound=0, upBound=1, cat='Binary') for i in range(n_produits)}
+    x = [LpVariable(name=f"x{i}", lowBound=0, upBound=1, cat='Binary') for i in range(n_produits)]
     
-    # Fonction objectif : maximiser le profit total
-    model += lpSum(profits_totaux[i] * x[i] for i in range(n_produits))
+    # Fonction objectif : maximiser le profit total (coefficients construits en bloc)
+    model += LpAffineExpression(zip(x, profits_totaux.tolist()))
     
     # Contrainte de capacité : temps total ≤ capacité maximale
-    model += lpSum(temps_requis_totaux[i] * x[i] for i in range(n_produits)) <= capacite_max
+    model += LpAffineExpression(zip(x, temps_requis_totaux.tolist())) <= capacite_max
     
     # Résolution du problème
     model.solve()
@@ -59,11 +70,12 @@ def fms_sac_a_dos_pl(vente_unite, cout_mp_unite, demande_periode, temps_fabricat
     profit_maximal = float(model.objective.value()) if model.objective.value() else 0.0
     
     # Identification des produits sélectionnés
-    produits_selectionnes_indices = [i for i in range(n_produits) if x[i].value() and x[i].value() > 0.5]
-    produits_non_selectionnes_indices = [i for i in range(n_produits) if not x[i].value() or x[i].value() < 0.5]
+    valeurs_x = np.array([v.value() or 0.0 for v in x], dtype=np.float64)
+    produits_selectionnes_indices = np.flatnonzero(valeurs_x > 0.5).tolist()
+    produits_non_selectionnes_indices = np.flatnonzero(valeurs_x < 0.5).tolist()
     
     # Calcul de la capacité utilisée
-    capacite_utilisee = sum(float(temps_requis_totaux[i]) for i in produits_selectionnes_indices)
+    capacite_utilisee = float(temps_requis_totaux[produits_selectionnes_indices].sum())
     utilisation_capacite = round((capacite_utilisee / capacite_max) * 100, 1)
     
     # Calcul de l'efficacité (profit par unité de capacité utilisée)
@@ -107,26 +119,30 @@ def fms_sac_a_dos_pl(vente_unite, cout_mp_unite, demande_periode, temps_fabricat
         'methode': 'Programmation Linéaire (PuLP)'
     }
 
-def generate_fms_sac_a_dos_pl_chart(vente_unite, cout_mp_unite, demande_periode, temps_fabrication_unite, cout_op, capacite_max, noms_produits, unite):
+def generate_fms_sac_a_dos_pl_chart(vente_unite, cout_mp_unite, demande_periode, temps_fabrication_unite, cout_op, capacite_max, noms_produits, unite, result=None, fmt="png", dpi=300, figsize=None):
     """
     Génère les graphiques pour l'analyse FMS Sac à Dos PL
+    (result peut être fourni pour éviter une seconde résolution)
     """
     
     # Résoudre le problème pour obtenir les données
-    result = fms_sac_a_dos_pl(vente_unite, cout_mp_unite, demande_periode, temps_fabrication_unite, cout_op, capacite_max, noms_produits, unite)
+    if result is None:
+        result = fms_sac_a_dos_pl(vente_unite, cout_mp_unite, demande_periode, temps_fabrication_unite, cout_op, capacite_max, noms_produits, unite)
     
-    # Configuration matplotlib
-    plt.style.use('default')
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    fig, ((ax1, ax2), (ax3, ax4)) = subplots(2, 2, figsize=figsize or (16, 12))
     fig.suptitle('Analyse FMS - Sac à Dos (Programmation Linéaire)', fontsize=16, fontweight='bold')
     
-    # Calcul des données
-    profits_unitaires = np.array(vente_unite) - (cout_op * np.array(temps_fabrication_unite) + np.array(cout_mp_unite))
-    temps_requis = np.array(temps_fabrication_unite) * np.array(demande_periode)
-    profits_totaux = profits_unitaires * np.array(demande_periode)
+    # Calcul des données (conversion numpy unique)
+    vente_unite = np.asarray(vente_unite, dtype=np.float64)
+    cout_mp_unite = np.asarray(cout_mp_unite, dtype=np.float64)
+    demande_periode = np.asarray(demande_periode, dtype=np.float64)
+    temps_fabrication_unite = np.asarray(temps_fabrication_unite, dtype=np.float64)
+    profits_unitaires = vente_unite - (cout_op * temps_fabrication_unite + cout_mp_unite)
+    temps_requis = temps_fabrication_unite * demande_periode
+    profits_totaux = profits_unitaires * demande_periode
     
     # Identification des produits sélectionnés
-    produits_selectionnes = [p['nom'] for p in result['produits_selectionnes']]
+    produits_selectionnes = {p['nom'] for p in result['produits_selectionnes']}
     colors = ['#10b981' if nom in produits_selectionnes else '#ef4444' for nom in noms_produits]
     
     # Graphique 1: Profits par produit
@@ -202,12 +218,9 @@ def generate_fms_sac_a_dos_pl_chart(vente_unite, cout_mp_unite, demande_periode,
     
     ax4.set_title('Métriques de Performance', fontweight='bold', pad=20)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Sauvegarde en buffer
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    plt.close()
+    image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
     
-    return buffer 
\ No newline at end of file
+    return image_data 
\ No newline at end of file
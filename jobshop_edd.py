@@ -1,3 +1,4 @@
+import math
 from collections import defaultdict
 from typing import List, Dict, Any
 
@@ -8,24 +9,30 @@ def planifier_jobshop_edd(job_names: List[str], machine_names: List[str], jobs_d
     completion_times = defaultdict(float)
     cumulative_delay = 0.0
 
-    # Format: (due_date, processing_time, operation_index, job_index, machine)
-    jobs = [(due_dates[j], float(t), i, j, int(m)) 
-            for j, job in enumerate(jobs_data) 
-            for i, (m, t) in enumerate(job)]
+    # Opérations de chaque job, dans l'ordre : (date due, durée, index d'opération, job, machine)
+    operations = [[(due_dates[j], float(t), i, j, int(m)) for i, (m, t) in enumerate(job)]
+                  for j, job in enumerate(jobs_data)]
     job_indices = defaultdict(int)
+    remaining = sum(len(ops) for ops in operations)
 
+    # Horloge discrète au pas de 0.1 : time == round(tick / 10, 2)
+    tick = 0
     time = 0.0
-    while jobs:
-        available_tasks = [(due_date, t, i, j, m) for due_date, t, i, j, m in jobs 
-                          if i == job_indices[j] and max(machine_time[m], job_time[j]) <= time]
+    while remaining:
+        # Seule la prochaine opération de chaque job peut être lancée
+        heads = [ops[job_indices[j]] for j, ops in enumerate(operations) if job_indices[j] < len(ops)]
+        available_tasks = [task for task in heads if max(machine_time[task[4]], job_time[task[3]]) <= time]
         if not available_tasks:
-            time += 0.1
-            time = round(time, 2)
+            # Avancer directement au premier pas où une opération devient disponible
+            ready = min(max(machine_time[m], job_time[j]) for _, _, _, j, m in heads)
+            tick = max(tick + 1, math.ceil(ready * 10) - 1)
+            while round(tick / 10, 2) < ready:
+                tick += 1
+            time = round(tick / 10, 2)
             continue
 
         # Trier par EDD (Earliest Due Date)
-        available_tasks.sort()
-        due_date, t, i, j, m = available_tasks[0]
+        due_date, t, i, j, m = min(available_tasks)
 
         start_time = max(machine_time[m], job_time[j])
         end_time = start_time + t
@@ -39,14 +46,14 @@ def planifier_jobshop_edd(job_names: List[str], machine_names: List[str], jobs_d
         job_indices[j] += 1
         machine_time[m] = end_time
         job_time[j] = end_time
-        jobs.remove((due_date, t, i, j, m))
+        remaining -= 1
 
         completion_times[j] = job_time[j]
         delay = max(completion_times[j] - due_dates[j], 0)
         cumulative_delay += delay
 
-        time += 0.1
-        time = round(time, 2)
+        tick += 1
+        time = round(tick / 10, 2)
 
     makespan = max(machine_time.values())
     flowtime = sum(completion_times.values()) / len(jobs_data)
@@ -1,11 +1,9 @@
+import math
 from collections import defaultdict
 from typing import List, Dict, Any
-import matplotlib.pyplot as plt
-import matplotlib
-import io
 import base64
+from chart_utils import subplots, figure_bytes
 
-matplotlib.use("Agg")
 
 def planifier_jobshop_spt(job_names: List[str], machine_names: List[str], jobs_data: List[List[List[float]]], due_dates: List[float]) -> Dict[str, Any]:
     machine_time = defaultdict(float)
@@ -14,20 +12,29 @@ def planifier_jobshop_spt(job_names: List[str], machine_names: List[str], jobs_d
     completion_times = defaultdict(float)
     cumulative_delay = 0.0
 
-    jobs = [(float(t), i, j, int(m)) for j, job in enumerate(jobs_data) for i, (m, t) in enumerate(job)]
+    # Opérations de chaque job, dans l'ordre : (durée, index d'opération, job, machine)
+    operations = [[(float(t), i, j, int(m)) for i, (m, t) in enumerate(job)]
+                  for j, job in enumerate(jobs_data)]
     job_indices = defaultdict(int)
+    remaining = sum(len(ops) for ops in operations)
 
+    # Horloge discrète au pas de 0.1 : time == round(tick / 10, 2)
+    tick = 0
     time = 0.0
-    while jobs:
-        available_tasks = [(t, i, j, m) for t, i, j, m in jobs if i == job_indices[j] and 
-                           max(machine_time[m], job_time[j]) <= time]
+    while remaining:
+        # Seule la prochaine opération de chaque job peut être lancée
+        heads = [ops[job_indices[j]] for j, ops in enumerate(operations) if job_indices[j] < len(ops)]
+        available_tasks = [task for task in heads if max(machine_time[task[3]], job_time[task[2]]) <= time]
         if not available_tasks:
-            time += 0.1
-            time = round(time, 2)
+            # Avancer directement au premier pas où une opération devient disponible
+            ready = min(max(machine_time[m], job_time[j]) for _, _, j, m in heads)
+            tick = max(tick + 1, math.ceil(ready * 10) - 1)
+            while round(tick / 10, 2) < ready:
+                tick += 1
+            time = round(tick / 10, 2)
             continue
 
-        available_tasks.sort()
-        t, i, j, m = available_tasks[0]
+        t, i, j, m = min(available_tasks)
 
         start_time = max(machine_time[m], job_time[j])
         end_time = start_time + t
@@ -41,14 +48,14 @@ def planifier_jobshop_spt(job_names: List[str], machine_names: List[str], jobs_d
         job_indices[j] += 1
         machine_time[m] = end_time
         job_time[j] = end_time
-        jobs.remove((t, i, j, m))
+        remaining -= 1
 
         completion_times[j] = job_time[j]
         delay = max(completion_times[j] - due_dates[j], 0)
         cumulative_delay += delay
 
-        time += 0.1
-        time = round(time, 2)
+        tick += 1
+        time = round(tick / 10, 2)
 
     makespan = max(machine_time.values())
     flowtime = sum(completion_times.values()) / len(jobs_data)
@@ -81,7 +88,7 @@ def generer_gantt_jobshop(schedule: List[Dict[str, Any]]) -> str:
     machine_index = {m: i for i, m in enumerate(machines)}
     job_colors = {job: f"C{i % 10}" for i, job in enumerate(jobs)}
 
-    fig, ax = plt.subplots(figsize=(10, len(machines)))
+    fig, ax = subplots(figsize=(10, len(machines)))
     for task in schedule:
         y = machine_index[task["machine"]]
         ax.broken_barh(
@@ -102,10 +109,7 @@ def generer_gantt_jobshop(schedule: List[Dict[str, Any]]) -> str:
     ax.set_title("Diagramme de Gantt - Jobshop SPT")
     ax.grid(True)
 
-    buf = io.BytesIO()
-    plt.tight_layout()
-    plt.savefig(buf, format='png')
-    plt.close(fig)
-    buf.seek(0)
-    return base64.b64encode(buf.read()).decode('utf-8')
+    fig.tight_layout()
+    # Figure réutilisée par thread : dpi par défaut de savefig, sans recadrage (déjà mise en page)
+    return base64.b64encode(figure_bytes(fig, "png", 100, tight=False)).decode('utf-8')
 
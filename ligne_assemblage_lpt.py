@@ -1,9 +1,10 @@
-from typing import List, Dict, Optional
-import matplotlib.pyplot as plt
-import io
+import bisect
+from typing import List, Dict, Optional, Union
+import matplotlib
+from chart_utils import subplots, figure_bytes
 import base64
 
-def lpt_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "minutes", task_names: Optional[Dict[int, str]] = None) -> Dict:
+def lpt_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "minutes", task_names: Optional[Dict[int, str]] = None, return_bytes: bool = False, with_chart: bool = True) -> Dict:
     """
     Implémente l'algorithme LPT (Longest Processing Time) pour l'équilibrage de ligne d'assemblage
     
@@ -11,6 +12,8 @@ def lpt_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "min
         task_tuples: Liste de tuples (tâche, prédécesseurs, durée)
         cycle_time: Temps de cycle de la ligne
         unite: Unité de temps
+        return_bytes: Graphique en octets PNG bruts plutôt qu'en base64
+        with_chart: False pour ne pas tracer le graphique (voir render_station_chart)
     
     Returns:
         Dict avec les résultats de l'équilibrage
@@ -19,31 +22,52 @@ def lpt_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "min
     tasks = {task[0]: {"pred": task[1], "time": task[2], "assigned": False} for task in task_tuples}
     stations = []
     utilization_rates = []
-    
+
+    # Nombre de prédécesseurs non affectés et successeurs de chaque tâche
+    order = {task_id: i for i, task_id in enumerate(tasks)}
+    missing_preds = {}
+    successors = {task_id: [] for task_id in tasks}
+    for task_id, task in tasks.items():
+        preds = predecessors_of(task)
+        for pred in preds:
+            successors[pred].append(task_id)
+        missing_preds[task_id] = len(preds)
+
+    # Tâches disponibles (prédécesseurs affectés), triées par durée décroissante puis ordre d'origine
+    available = sorted((-task["time"], order[task_id], task_id) for task_id, task in tasks.items() if not missing_preds[task_id])
+    unassigned = len(tasks)
+
     # Algorithme LPT
-    while any(not task["assigned"] for task in tasks.values()):
+    while unassigned:
         # Initialisation de la nouvelle station
         station = []
         remaining_time = cycle_time
 
         while True:
-            # Identification des tâches éligibles
-            eligible_tasks = [task_id for task_id, task in tasks.items() 
-                              if not task["assigned"]
-                              and is_precedence_satisfied(task_id, task, tasks)
-                              and task["time"] <= remaining_time]
-            
+            # Tâche disponible la plus longue tenant dans le temps restant (la première en cas d'égalité)
+            index = next((i for i, (neg_time, _, _) in enumerate(available) if -neg_time <= remaining_time), None)
+
             # Si aucune tâche éligible, on arrête pour cette station
-            if not eligible_tasks:
+            if index is None:
                 break
 
-            # Sélection de la tâche avec le temps de traitement le plus long
-            task_to_assign = max(eligible_tasks, key=lambda t: tasks[t]["time"])
+            task_to_assign = available.pop(index)[2]
 
             station.append(task_to_assign)
             tasks[task_to_assign]["assigned"] = True
             remaining_time -= tasks[task_to_assign]["time"]
-            
+            unassigned -= 1
+
+            # Les successeurs dont tous les prédécesseurs sont affectés deviennent disponibles
+            for successor in successors[task_to_assign]:
+                missing_preds[successor] -= 1
+                if not missing_preds[successor]:
+                    bisect.insort(available, (-tasks[successor]["time"], order[successor], successor))
+
+        if not station:
+            raise ValueError("Certaines tâches ne peuvent être affectées à aucune station "
+                             "(durée supérieure au temps de cycle ou précédences circulaires).")
+
         stations.append(station)
 
         # Calcul du taux d'utilisation de la station
@@ -53,26 +77,33 @@ def lpt_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "min
     # Calcul des métriques globales
     metrics = calculate_metrics(stations, utilization_rates, tasks, cycle_time, unite)
     
-    # Génération de la visualisation
-    chart_base64 = generate_station_chart(stations, utilization_rates, tasks, unite, task_names)
-    
-    return {
+    result = {
         "stations": [{"id": i+1, "tasks": station, "utilization": rate} for i, (station, rate) in enumerate(zip(stations, utilization_rates))],
         "metrics": metrics,
-        "graphique": chart_base64,
         "cycle_time": cycle_time,
         "unite": unite
     }
+    
+    # Génération de la visualisation
+    if with_chart:
+        result["graphique"] = generate_station_chart(stations, utilization_rates, tasks, unite, task_names, return_bytes)
+    
+    return result
+
+def render_station_chart(result: Dict, task_tuples: List[tuple], task_names: Optional[Dict[int, str]] = None, return_bytes: bool = True) -> Union[str, bytes]:
+    """Trace le graphique des stations d'un résultat calculé avec with_chart=False"""
+    tasks = {task[0]: {"time": task[2]} for task in task_tuples}
+    stations = [station["tasks"] for station in result["stations"]]
+    utilization_rates = [station["utilization"] for station in result["stations"]]
+    return generate_station_chart(stations, utilization_rates, tasks, result["unite"], task_names, return_bytes)
 
-def is_precedence_satisfied(task_id: int, task: Dict, tasks: Dict) -> bool:
-    """Vérifie si les contraintes de précédence sont satisfaites pour une tâche"""
+def predecessors_of(task: Dict) -> set:
+    """Ensemble des prédécesseurs d'une tâche (None, un identifiant ou une liste)"""
     if task["pred"] is None:
-        return True
-    
+        return set()
     if isinstance(task["pred"], list):
-        return all(tasks[pred]["assigned"] for pred in task["pred"])
-    else:
-        return tasks[task["pred"]]["assigned"]
+        return set(task["pred"])
+    return {task["pred"]}
 
 def calculate_metrics(stations: List[List], utilization_rates: List[float], tasks: Dict, cycle_time: float, unite: str) -> Dict:
     """Calcule les métriques de performance de l'équilibrage"""
@@ -116,9 +147,9 @@ def calculate_metrics(stations: List[List], utilization_rates: List[float], task
             "taux_equilibrage": 0
         }
 
-def generate_station_chart(stations: List[List], utilization_rates: List[float], tasks: Dict, unite: str, task_names: Optional[Dict[int, str]] = None) -> str:
+def generate_station_chart(stations: List[List], utilization_rates: List[float], tasks: Dict, unite: str, task_names: Optional[Dict[int, str]] = None, return_bytes: bool = False) -> Union[str, bytes]:
     """Génère un graphique des stations et de leur utilisation"""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    fig, (ax1, ax2) = subplots(2, 1, figsize=(12, 10))
     
     # Graphique 1: Taux d'utilisation par station
     station_numbers = [f"Station {i+1}" for i in range(len(stations))]
@@ -141,7 +172,7 @@ def generate_station_chart(stations: List[List], utilization_rates: List[float],
     
     # Graphique 2: Temps de traitement par station avec barres empilées
     # Palette de couleurs pour les tâches
-    task_colors = plt.cm.Set3(range(len(tasks)))
+    task_colors = matplotlib.colormaps["Set3"](range(len(tasks)))
     all_task_ids = list(tasks.keys())
     
     # Préparer les données pour les barres empilées
@@ -182,13 +213,10 @@ def generate_station_chart(stations: List[List], utilization_rates: List[float],
     ax2.set_title('Charge de travail par station - Stratégie LPT (Plus longue tâche d\'abord)')
     ax2.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
     
-    plt.tight_layout()
-    
-    # Convertir en base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode()
-    plt.close()
+    fig.tight_layout()
     
-    return image_base64 
\ No newline at end of file
+    # Octets PNG bruts pour les routes image, base64 pour les réponses JSON
+    image_data = figure_bytes(fig, "png", 300)
+    if return_bytes:
+        return image_data
+    return base64.b64encode(image_data).decode()
@@ -1,10 +1,11 @@
 from pulp import *
 import numpy as np
-import matplotlib.pyplot as plt
+from chart_utils import subplots, figure_bytes
 import matplotlib
+import logging
 matplotlib.use('Agg')
-import io
-import base64
+
+logger = logging.getLogger(__name__)
 
 def mixed_assembly_line_scheduling_heuristic(models, tasks_data, cycle_time):
     """
@@ -155,7 +156,7 @@ def mixed_assembly_line_scheduling(models, tasks_data, cycle_time):
     # Si le problème est trop gros, utiliser l'heuristique
     problem_size = num_tasks * estimated_stations
     if problem_size > 200 or num_tasks > 24:  # Limite conservative pour 512MB
-        print(f"Problem too large for LP (size: {problem_size}), using heuristic")
+        logger.debug("Problem too large for LP (size: %s), using heuristic", problem_size)
         return mixed_assembly_line_scheduling_heuristic(models, tasks_data, cycle_time)
 
     # Définition des stations (limite raisonnable)
@@ -222,7 +223,7 @@ def mixed_assembly_line_scheduling(models, tasks_data, cycle_time):
         status = LpStatus[prob.status]
         
         if status != "Optimal":
-            print(f"LP solver failed with status: {status}, falling back to heuristic")
+            logger.warning("LP solver failed with status: %s, falling back to heuristic", status)
             return mixed_assembly_line_scheduling_heuristic(models, tasks_data, cycle_time)
 
         assigned_tasks = {j: [] for j in stations}
@@ -291,14 +292,14 @@ def mixed_assembly_line_scheduling(models, tasks_data, cycle_time):
         return results
 
     except Exception as e:
-        print(f"LP solver failed with error: {str(e)}, falling back to heuristic")
+        logger.warning("LP solver failed with error: %s, falling back to heuristic", e)
         return mixed_assembly_line_scheduling_heuristic(models, tasks_data, cycle_time)
 
-def generate_equilibrage_chart(results):
+def generate_equilibrage_chart(results, fmt="png", dpi=300, figsize=None):
     """
     Génère des graphiques pour visualiser l'équilibrage de la ligne mixte
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig, (ax1, ax2) = subplots(1, 2, figsize=figsize or (14, 6))
     
     # Couleurs pour ligne mixte (tons violets/pourpres)
     colors = ['#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE', '#F5F3FF']
@@ -351,16 +352,12 @@ def generate_equilibrage_chart(results):
         ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
                 f'{load:.1f}', ha='center', va='bottom', fontsize=9)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Conversion en base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    plt.close()
+    # Encodage de l'image
+    image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
     
-    return image_base64
+    return image_data
 
 def solve_mixed_assembly_line(data):
     """
@@ -1,11 +1,12 @@
 from pulp import *
 import numpy as np
-import matplotlib.pyplot as plt
+from chart_utils import subplots, figure_bytes
 import matplotlib
 matplotlib.use('Agg')
-import io
-import base64
 import math
+import logging
+
+logger = logging.getLogger(__name__)
 
 def mixed_assembly_line_scheduling_plus_plus(models, tasks_data, cycle_time, optimize_balance=True, allow_station_reduction=False):
     """
@@ -34,7 +35,7 @@ def mixed_assembly_line_scheduling_plus_plus(models, tasks_data, cycle_time, opt
 
     try:
         # ÉTAPE 1 : Minimisation du nombre de stations
-        print("ÉTAPE 1 : Minimisation du nombre de stations...")
+        logger.debug("ÉTAPE 1 : Minimisation du nombre de stations...")
         
         # Estimation du nombre maximum de stations nécessaires
         estimated_stations = int(np.ceil(K_min)) + 3
@@ -91,23 +92,23 @@ def mixed_assembly_line_scheduling_plus_plus(models, tasks_data, cycle_time, opt
                     min_stations_needed = max(min_stations_needed, j)
                     step1_assignment[i] = j
         
-        print(f"Nombre minimum de stations trouvé : {min_stations_needed}")
+        logger.debug("Nombre minimum de stations trouvé : %s", min_stations_needed)
         
         # Si l'optimisation d'équilibrage n'est pas demandée, retourner le résultat de l'étape 1
         if not optimize_balance:
             return _format_results_step1(step1_assignment, min_stations_needed, models, tasks_data, cycle_time, weighted_processing_times, K_min)
         
         # ÉTAPE 2 : Minimisation de l'écart des taux d'utilisation
-        print("ÉTAPE 2 : Minimisation de l'écart des taux d'utilisation...")
+        logger.debug("ÉTAPE 2 : Minimisation de l'écart des taux d'utilisation...")
         
         if allow_station_reduction:
-            print("Mode réduction de stations activé - test de toutes les combinaisons...")
+            logger.debug("Mode réduction de stations activé - test de toutes les combinaisons...")
             return _optimize_with_station_reduction(tasks, predecessors, weighted_processing_times, cycle_time, min_stations_needed, models, tasks_data, K_min)
         else:
             # Mode standard : optimisation simple avec nombre de stations fixe
             stations_step2 = list(range(1, min_stations_needed + 1))
             
-            print(f"Optimisation avec {min_stations_needed} stations...")
+            logger.debug("Optimisation avec %s stations...", min_stations_needed)
             prob2 = LpProblem("MixedAssemblyLineScheduling_Step2", LpMinimize)
             y2 = LpVariable.dicts("Station_Step2", [(i,j) for i in tasks for j in stations_step2], 0, 1, LpBinary)
             
@@ -151,7 +152,7 @@ def mixed_assembly_line_scheduling_plus_plus(models, tasks_data, cycle_time, opt
             prob2.solve(PULP_CBC_CMD(msg=0, timeLimit=120))
             
             if LpStatus[prob2.status] != "Optimal":
-                print(f"Étape 2 échouée : {LpStatus[prob2.status]}, utilisation du résultat de l'étape 1")
+                logger.warning("Étape 2 échouée : %s, utilisation du résultat de l'étape 1", LpStatus[prob2.status])
                 return _format_results_step1(step1_assignment, min_stations_needed, models, tasks_data, cycle_time, weighted_processing_times, K_min)
             
             # Extraction des résultats - Étape 2
@@ -175,12 +176,12 @@ def mixed_assembly_line_scheduling_plus_plus(models, tasks_data, cycle_time, opt
             else:
                 utilization_gap = 0
             
-            print(f"Écart d'utilisation calculé : {utilization_gap:.2f}%")
+            logger.debug("Écart d'utilisation calculé : %.2f%%", utilization_gap)
             
             return _format_results_step2(step2_assignment, min_stations_needed, [], models, tasks_data, cycle_time, weighted_processing_times, K_min, utilization_gap)
 
     except Exception as e:
-        print(f"Erreur dans l'algorithme ++ : {str(e)}")
+        logger.exception("Erreur dans l'algorithme ++ : %s", e)
         # Fallback vers l'algorithme heuristique standard
         return _fallback_heuristic(models, tasks_data, cycle_time, weighted_processing_times, K_min)
 
@@ -193,11 +194,11 @@ def _optimize_with_station_reduction(tasks, predecessors, weighted_processing_ti
     best_gap = float('inf')
     best_num_stations = min_stations_needed
     
-    print(f"Test des combinaisons de 1 à {min_stations_needed} stations...")
+    logger.debug("Test des combinaisons de 1 à %s stations...", min_stations_needed)
     
     # Tester toutes les possibilités de 1 à min_stations_needed stations
     for num_stations in range(1, min_stations_needed + 1):
-        print(f"  Test avec {num_stations} stations...")
+        logger.debug("  Test avec %s stations...", num_stations)
         
         try:
             stations = list(range(1, num_stations + 1))
@@ -282,10 +283,11 @@ def _optimize_with_station_reduction(tasks, predecessors, weighted_processing_ti
                                 station_details[j] = []
                             station_details[j].append(i)
                 
-                print(f"    Solution trouvée : {num_stations} stations, écart = {utilization_gap:.2f}%")
-                print(f"    Assignations : {station_details}")
-                print(f"    Stations doublées : {doubled_stations}")
-                print(f"    Utilisations : {[f'{u:.1f}%' for u in station_utilizations]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("    Solution trouvée : %s stations, écart = %.2f%%", num_stations, utilization_gap)
+                    logger.debug("    Assignations : %s", station_details)
+                    logger.debug("    Stations doublées : %s", doubled_stations)
+                    logger.debug("    Utilisations : %s", [f'{u:.1f}%' for u in station_utilizations])
                 
                 # Vérifier si cette solution est meilleure
                 if utilization_gap < best_gap or (utilization_gap == best_gap and num_stations < best_num_stations):
@@ -299,19 +301,19 @@ def _optimize_with_station_reduction(tasks, predecessors, weighted_processing_ti
                     }
                     best_gap = utilization_gap
                     best_num_stations = num_stations
-                    print(f"    *** Nouvelle meilleure solution ! ***")
+                    logger.debug("    *** Nouvelle meilleure solution ! ***")
             else:
-                print(f"    Pas de solution faisable avec {num_stations} stations")
+                logger.debug("    Pas de solution faisable avec %s stations", num_stations)
                 
         except Exception as e:
-            print(f"    Erreur avec {num_stations} stations : {str(e)}")
+            logger.debug("    Erreur avec %s stations : %s", num_stations, e)
             continue
     
     if best_solution is None:
-        print("Aucune solution trouvée, utilisation de l'heuristique de fallback")
+        logger.warning("Aucune solution trouvée, utilisation de l'heuristique de fallback")
         return _fallback_heuristic(models, tasks_data, cycle_time, weighted_processing_times, K_min)
     
-    print(f"Meilleure solution : {best_solution['num_stations']} stations, écart = {best_solution['utilization_gap']:.2f}%")
+    logger.debug("Meilleure solution : %s stations, écart = %.2f%%", best_solution['num_stations'], best_solution['utilization_gap'])
     
     return _format_results_step2(
         best_solution['assignment'], 
@@ -580,11 +582,11 @@ def _fallback_heuristic(models, tasks_data, cycle_time, weighted_processing_time
         "models_demand": list(models)
     }
 
-def generate_equilibrage_plus_plus_chart(results):
+def generate_equilibrage_plus_plus_chart(results, fmt="png", dpi=300, figsize=None):
     """
     Génère des graphiques pour visualiser l'équilibrage de la ligne mixte ++
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    fig, (ax1, ax2) = subplots(1, 2, figsize=figsize or (16, 6))
     
     # Couleurs pour ligne mixte ++ (tons verts/bleus)
     colors = ['#10B981', '#34D399', '#6EE7B7', '#A7F3D0', '#D1FAE5', '#ECFDF5']
@@ -661,16 +663,12 @@ def generate_equilibrage_plus_plus_chart(results):
         ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
                 label, ha='center', va='bottom', fontsize=9, fontweight='bold')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Conversion en base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    plt.close()
+    # Encodage de l'image
+    image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
     
-    return image_base64
+    return image_data
 
 def solve_mixed_assembly_line_equilibrage_plus_plus(tasks_data, models, cycle_time, optimize_balance=True, allow_station_reduction=False):
     """
@@ -684,9 +682,9 @@ def solve_mixed_assembly_line_equilibrage_plus_plus(tasks_data, models, cycle_ti
         if not tasks_data or not models or cycle_time <= 0:
             raise ValueError("Données d'entrée invalides")
 
-        print(f"=== ALGORITHME ÉQUILIBRAGE ++ SIMPLIFIÉ ===")
-        print(f"Optimisation activée : {optimize_balance}")
-        print(f"Temps de cycle : {cycle_time}")
+        logger.debug("=== ALGORITHME ÉQUILIBRAGE ++ SIMPLIFIÉ ===")
+        logger.debug("Optimisation activée : %s", optimize_balance)
+        logger.debug("Temps de cycle : %s", cycle_time)
 
         # Préparation des données
         tasks = [task['id'] for task in tasks_data]
@@ -715,22 +713,22 @@ def solve_mixed_assembly_line_equilibrage_plus_plus(tasks_data, models, cycle_ti
                 weighted_time += model_time * weight
             weighted_processing_times[task_id] = weighted_time
 
-        print(f"Temps pondérés calculés : {weighted_processing_times}")
+        logger.debug("Temps pondérés calculés : %s", weighted_processing_times)
 
         # ÉTAPE 1 : Trouver le nombre minimum de stations
-        print("\n=== ÉTAPE 1 : Nombre minimum de stations ===")
+        logger.debug("=== ÉTAPE 1 : Nombre minimum de stations ===")
         
         # Estimation du nombre minimum de stations nécessaires
         total_work = sum(weighted_processing_times.values())
         K_min = max(1, math.ceil(total_work / cycle_time))
-        print(f"Estimation K_min : {K_min} stations")
+        logger.debug("Estimation K_min : %s stations", K_min)
 
         # Recherche du nombre minimum réel par programmation linéaire
         min_stations_needed = None
         step1_assignment = None
         
         for K in range(K_min, len(tasks) + 1):
-            print(f"Test avec {K} stations...")
+            logger.debug("Test avec %s stations...", K)
             stations = list(range(1, K + 1))
             
             prob1 = LpProblem("MixedAssemblyLineScheduling_Step1", LpMinimize)
@@ -765,7 +763,7 @@ def solve_mixed_assembly_line_equilibrage_plus_plus(tasks_data, models, cycle_ti
             prob1.solve(PULP_CBC_CMD(msg=0, timeLimit=60))
             
             if LpStatus[prob1.status] == "Optimal":
-                print(f"✅ Solution trouvée avec {K} stations")
+                logger.debug("✅ Solution trouvée avec %s stations", K)
                 min_stations_needed = K
                 
                 step1_assignment = {}
@@ -775,35 +773,35 @@ def solve_mixed_assembly_line_equilibrage_plus_plus(tasks_data, models, cycle_ti
                             step1_assignment[i] = j
                 break
             else:
-                print(f"❌ Pas de solution avec {K} stations")
+                logger.debug("❌ Pas de solution avec %s stations", K)
 
         if min_stations_needed is None:
             raise ValueError("Aucune solution faisable trouvée")
 
-        print(f"Nombre minimum de stations nécessaires : {min_stations_needed}")
+        logger.debug("Nombre minimum de stations nécessaires : %s", min_stations_needed)
 
         # Si l'optimisation n'est pas activée, retourner le résultat de l'étape 1
         if not optimize_balance:
-            print("Optimisation désactivée, retour du résultat de l'étape 1")
+            logger.debug("Optimisation désactivée, retour du résultat de l'étape 1")
             return _format_results_step1(step1_assignment, min_stations_needed, models, tasks_data, cycle_time, weighted_processing_times, K_min)
 
         # ÉTAPE 2 : Optimisation de l'équilibrage avec nombre de stations fixe
-        print(f"\n=== ÉTAPE 2 : Optimisation de l'équilibrage ===")
-        print(f"Optimisation avec {min_stations_needed} stations...")
+        logger.debug("=== ÉTAPE 2 : Optimisation de l'équilibrage ===")
+        logger.debug("Optimisation avec %s stations...", min_stations_needed)
         
         stations_step2 = list(range(1, min_stations_needed + 1))
         solution = _solve_for_stations(tasks, stations_step2, predecessors, weighted_processing_times, cycle_time)
         
         if solution:
             gap = solution['gap']
-            print(f"Solution optimisée : écart = {gap:.2f}%")
+            logger.debug("Solution optimisée : écart = %.2f%%", gap)
             return _format_results_optimized(solution['assignment'], min_stations_needed, models, tasks_data, cycle_time, weighted_processing_times, K_min, gap, False)
         else:
-            print("Optimisation échouée, retour de l'étape 1")
+            logger.warning("Optimisation échouée, retour de l'étape 1")
             return _format_results_step1(step1_assignment, min_stations_needed, models, tasks_data, cycle_time, weighted_processing_times, K_min)
 
     except Exception as e:
-        print(f"Erreur dans l'algorithme : {str(e)}")
+        logger.exception("Erreur dans l'algorithme : %s", e)
         raise ValueError(f"Erreur lors de la résolution : {str(e)}")
 
 def _solve_for_stations(tasks, stations, predecessors, weighted_processing_times, cycle_time):
@@ -875,7 +873,7 @@ def _solve_for_stations(tasks, stations, predecessors, weighted_processing_times
         return None
         
     except Exception as e:
-        print(f"Erreur dans _solve_for_stations : {str(e)}")
+        logger.exception("Erreur dans _solve_for_stations : %s", e)
         return None
 
 def _format_results_optimized(assignment, num_stations, models, tasks_data, cycle_time, weighted_processing_times, K_min, utilization_gap, allow_station_reduction):
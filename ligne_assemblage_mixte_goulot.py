@@ -1,13 +1,12 @@
 from pulp import *
 from math import gcd
 from functools import reduce
-from typing import List, Dict, Optional
-import matplotlib.pyplot as plt
-import io
+from typing import List, Dict, Optional, Union
+from chart_utils import subplots, figure_bytes
 import base64
 import numpy as np
 
-def variation_goulot_algorithm(models_demand: List[int], task_times: List[List[float]], s1: float = 0.5, s2: float = 0.5, unite: str = "minutes") -> Dict:
+def variation_goulot_algorithm(models_demand: List[int], task_times: List[List[float]], s1: float = 0.5, s2: float = 0.5, unite: str = "minutes", return_bytes: bool = False) -> Dict:
     """
     Implémente l'algorithme de minimisation de la variation du goulot pour ligne d'assemblage mixte
     
@@ -17,6 +16,7 @@ def variation_goulot_algorithm(models_demand: List[int], task_times: List[List[f
         s1: Paramètre de lissage pour les contraintes de modèles
         s2: Paramètre de lissage pour les contraintes de capacité
         unite: Unité de temps
+        return_bytes: Graphique en octets PNG bruts plutôt qu'en base64
     
     Returns:
         Dict avec les résultats de l'optimisation
@@ -82,7 +82,7 @@ def variation_goulot_algorithm(models_demand: List[int], task_times: List[List[f
     metrics = calculate_goulot_metrics(sequence, models, t_ij, C_k, delta.varValue, N_j, N, s1, s2, status, unite)
     
     # Génération de la visualisation
-    chart_base64 = generate_goulot_chart(sequence, models, t_ij, C_k, unite, status)
+    chart_base64 = generate_goulot_chart(sequence, models, t_ij, C_k, unite, status, return_bytes)
     
     return {
         "sequence": sequence,
@@ -150,9 +150,9 @@ def calculate_goulot_metrics(sequence: List[int], models: tuple, t_ij: List[List
             "efficacite_lissage": 0
         }
 
-def generate_goulot_chart(sequence: List[int], models: tuple, t_ij: List[List[float]], C_k: float, unite: str, status: str) -> str:
+def generate_goulot_chart(sequence: List[int], models: tuple, t_ij: List[List[float]], C_k: float, unite: str, status: str, return_bytes: bool = False) -> Union[str, bytes]:
     """Génère un graphique d'analyse de la variation du goulot"""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    fig, (ax1, ax2) = subplots(2, 1, figsize=(14, 10))
     
     # Graphique 1: Séquence de production
     positions = list(range(1, len(sequence) + 1))
@@ -208,13 +208,10 @@ def generate_goulot_chart(sequence: List[int], models: tuple, t_ij: List[List[fl
     ax2.legend()
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Convertir en base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode()
-    plt.close()
-    
-    return image_base64 
\ No newline at end of file
+    # Octets PNG bruts pour les routes image, base64 pour les réponses JSON
+    image_data = figure_bytes(fig, "png", 300)
+    if return_bytes:
+        return image_data
+    return base64.b64encode(image_data).decode()
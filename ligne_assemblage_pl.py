@@ -1,11 +1,11 @@
 from pulp import *
 import numpy as np
-from typing import List, Dict, Optional
-import matplotlib.pyplot as plt
-import io
+from typing import List, Dict, Optional, Union
+import matplotlib
+from chart_utils import subplots, figure_bytes
 import base64
 
-def pl_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "minutes", task_names: Optional[Dict[int, str]] = None) -> Dict:
+def pl_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "minutes", task_names: Optional[Dict[int, str]] = None, return_bytes: bool = False, with_chart: bool = True) -> Dict:
     """
     Implémente l'algorithme PL (Programmation Linéaire) pour l'équilibrage optimal de ligne d'assemblage
     
@@ -13,6 +13,8 @@ def pl_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "minu
         task_tuples: Liste de tuples (tâche, prédécesseurs, durée)
         cycle_time: Temps de cycle de la ligne
         unite: Unité de temps
+        return_bytes: Graphique en octets PNG bruts plutôt qu'en base64
+        with_chart: False pour ne pas tracer le graphique (voir render_pl_chart)
     
     Returns:
         Dict avec les résultats de l'optimisation
@@ -101,17 +103,26 @@ def pl_algorithm(task_tuples: List[tuple], cycle_time: float, unite: str = "minu
     # Calcul des métriques
     metrics = calculate_metrics(stations_result, utilization_rates, processing_times, C, unite, K_min, status)
     
-    # Génération de la visualisation
-    chart_base64 = generate_pl_chart(stations_result, utilization_rates, processing_times, unite, status, task_names)
-    
-    return {
+    result = {
         "stations": stations_result,
         "metrics": metrics,
-        "graphique": chart_base64,
         "cycle_time": C,
         "unite": unite,
         "optimization_status": status
     }
+    
+    # Génération de la visualisation
+    if with_chart:
+        result["graphique"] = generate_pl_chart(stations_result, utilization_rates, processing_times, unite, status, task_names, return_bytes)
+    
+    return result
+
+def render_pl_chart(result: Dict, task_tuples: List[tuple], task_names: Optional[Dict[int, str]] = None, return_bytes: bool = True) -> Union[str, bytes]:
+    """Trace le graphique PL d'un résultat calculé avec with_chart=False"""
+    processing_times = {task[0]: task[2] for task in task_tuples}
+    utilization_rates = [station["utilization"] for station in result["stations"]]
+    return generate_pl_chart(result["stations"], utilization_rates, processing_times, result["unite"],
+                             result["optimization_status"], task_names, return_bytes)
 
 def calculate_metrics(stations: List[Dict], utilization_rates: List[float], processing_times: Dict, cycle_time: float, unite: str, theoretical_min: float, status: str) -> Dict:
     """Calcule les métriques de performance de l'équilibrage optimal"""
@@ -161,9 +172,9 @@ def calculate_metrics(stations: List[Dict], utilization_rates: List[float], proc
             "statut_optimisation": status
         }
 
-def generate_pl_chart(stations: List[Dict], utilization_rates: List[float], processing_times: Dict, unite: str, status: str, task_names: Optional[Dict[int, str]] = None) -> str:
+def generate_pl_chart(stations: List[Dict], utilization_rates: List[float], processing_times: Dict, unite: str, status: str, task_names: Optional[Dict[int, str]] = None, return_bytes: bool = False) -> Union[str, bytes]:
     """Génère un graphique des stations et de leur utilisation pour l'algorithme PL"""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
+    fig, (ax1, ax2) = subplots(2, 1, figsize=(12, 10))
     
     # Graphique 1: Taux d'utilisation par station
     station_numbers = [f"Station {station['id']}" for station in stations]
@@ -187,7 +198,7 @@ def generate_pl_chart(stations: List[Dict], utilization_rates: List[float], proc
     # Graphique 2: Temps de traitement par station avec barres empilées
     # Palette de couleurs pour les tâches
     all_task_ids = list(processing_times.keys())
-    task_colors = plt.cm.Set3(range(len(all_task_ids)))
+    task_colors = matplotlib.colormaps["Set3"](range(len(all_task_ids)))
     
     # Préparer les données pour les barres empilées
     station_data = {}
@@ -227,13 +238,10 @@ def generate_pl_chart(stations: List[Dict], utilization_rates: List[float], proc
     ax2.set_title('Charge de travail par station - Solution Optimale PL')
     ax2.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
     
-    plt.tight_layout()
-    
-    # Convertir en base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode()
-    plt.close()
+    fig.tight_layout()
     
-    return image_base64 
\ No newline at end of file
+    # Octets PNG bruts pour les routes image, base64 pour les réponses JSON
+    image_data = figure_bytes(fig, "png", 300)
+    if return_bytes:
+        return image_data
+    return base64.b64encode(image_data).decode()
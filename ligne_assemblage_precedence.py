@@ -1,6 +1,5 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import io
+from chart_utils import get_figure, figure_bytes
 import base64
 from typing import List, Dict, Optional, Union
 
@@ -30,16 +29,12 @@ def _hierarchy_pos(G, root, width=1., vert_gap=0.2, vert_loc=0, xcenter=0.5, pos
                                 parent=root, parsed=parsed)
     return pos
 
-def create_precedence_diagram(task_tuples: List[tuple], unite: str = "minutes") -> Dict:
+def build_precedence_graph(task_tuples: List[tuple], unite: str = "minutes") -> tuple:
     """
-    Crée un diagramme de précédence et retourne les données d'analyse
-    
-    Args:
-        task_tuples: Liste de tuples (tâche, prédécesseurs, durée)
-        unite: Unité de temps
+    Construit le graphe de précédence (sans rien tracer)
     
     Returns:
-        Dict avec les métriques et le graphique encodé
+        (graphe, libellés des nœuds, durées des tâches, nœud racine)
     """
     G = nx.DiGraph()
     
@@ -65,18 +60,31 @@ def create_precedence_diagram(task_tuples: List[tuple], unite: str = "minutes")
         elif root_node == 0:
             G.add_edge(root_node, task_id)
 
+    return G, node_labels, task_durations, root_node
+
+def create_precedence_diagram(task_tuples: List[tuple], unite: str = "minutes", return_bytes: bool = False, with_chart: bool = True) -> Dict:
+    """
+    Crée un diagramme de précédence et retourne les données d'analyse
+    
+    Args:
+        task_tuples: Liste de tuples (tâche, prédécesseurs, durée)
+        unite: Unité de temps
+        return_bytes: Graphique en octets PNG bruts plutôt qu'en base64
+        with_chart: False pour ne pas tracer le graphique (voir render_precedence_png)
+    
+    Returns:
+        Dict avec les métriques et le graphique encodé
+    """
+    G, node_labels, task_durations, root_node = build_precedence_graph(task_tuples, unite)
+
     # Calculer les métriques
     metrics = calculate_metrics(G, task_durations, unite)
     
-    # Générer le graphique
-    image_base64 = generate_precedence_chart(G, node_labels, root_node)
-    
     # Calculer le chemin critique et sa durée
     critical_path = find_critical_path(G, task_durations)
     critical_duration = sum(task_durations.get(task, 0) for task in critical_path)
     
-    return {
-        "graphique": image_base64,
+    result = {
         "metrics": metrics,
         "nombre_taches": len(task_tuples),
         "nombre_relations": G.number_of_edges(),
@@ -88,6 +96,17 @@ def create_precedence_diagram(task_tuples: List[tuple], unite: str = "minutes")
         "niveau_parallelisme_max": 1,
         "taches_details": []
     }
+    
+    # Générer le graphique
+    if with_chart:
+        result["graphique"] = generate_precedence_chart(G, node_labels, root_node, return_bytes)
+    
+    return result
+
+def render_precedence_png(task_tuples: List[tuple], unite: str = "minutes") -> bytes:
+    """Trace uniquement le diagramme de précédence (octets PNG)"""
+    G, node_labels, _, root_node = build_precedence_graph(task_tuples, unite)
+    return generate_precedence_chart(G, node_labels, root_node, return_bytes=True)
 
 def calculate_metrics(G: nx.DiGraph, task_durations: Dict, unite: str) -> Dict:
     """Calcule les métriques du diagramme de précédence"""
@@ -148,10 +167,11 @@ def find_critical_path(G: nx.DiGraph, task_durations: Dict) -> List:
     except:
         return []
 
-def generate_precedence_chart(G: nx.DiGraph, node_labels: Dict, root_node) -> str:
+def generate_precedence_chart(G: nx.DiGraph, node_labels: Dict, root_node, return_bytes: bool = False) -> Union[str, bytes]:
     """Génère le graphique de précédence et retourne l'image encodée en base64"""
-    plt.figure(figsize=(12, 8))
-    plt.clf()
+    # Axes couvrant toute la figure (ce que nx.draw crée sur une figure vide)
+    fig = get_figure((12, 8))
+    ax = fig.add_axes((0, 0, 1, 1))
     
     # Calculer les positions
     pos = hierarchy_pos(G, root_node)
@@ -160,24 +180,21 @@ def generate_precedence_chart(G: nx.DiGraph, node_labels: Dict, root_node) -> st
     nx.draw(G, pos=pos, with_labels=True, arrows=True, 
             node_color='lightblue', node_size=1500, 
             font_size=10, font_weight='bold',
-            edge_color='gray', arrowsize=20)
+            edge_color='gray', arrowsize=20, ax=ax)
     
     # Ajouter les labels avec durées
     for node, (x, y) in pos.items():
         if node != 0 and node in node_labels:  # Ignorer le nœud racine factice
-            plt.text(x, y, node_labels[node], horizontalalignment='center',
-                    verticalalignment='center', fontsize=9, 
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-    
-    plt.title("Diagramme de Précédence des Tâches", fontsize=14, fontweight='bold')
-    plt.axis('off')
-    plt.tight_layout()
-    
-    # Convertir en base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode()
-    plt.close()
-    
-    return image_base64 
\ No newline at end of file
+            ax.text(x, y, node_labels[node], horizontalalignment='center',
+                   verticalalignment='center', fontsize=9, 
+                   bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+    
+    ax.set_title("Diagramme de Précédence des Tâches", fontsize=14, fontweight='bold')
+    ax.axis('off')
+    fig.tight_layout()
+    
+    # Octets PNG bruts pour les routes image, base64 pour les réponses JSON
+    image_data = figure_bytes(fig, "png", 300)
+    if return_bytes:
+        return image_data
+    return base64.b64encode(image_data).decode()
@@ -1,9 +1,7 @@
-import matplotlib.pyplot as plt
+from chart_utils import subplots, figure_bytes
 import matplotlib
 matplotlib.use('Agg')
 import numpy as np
-import io
-import base64
 
 def buffer_buzzacott_algorithm(alpha1, alpha2, b_inv_1, b_inv_2, buffer_size, production, jours_annee, profit_unitaire):
     """
@@ -79,11 +77,11 @@ def buffer_buzzacott_algorithm(alpha1, alpha2, b_inv_1, b_inv_2, buffer_size, pr
 
     return results
 
-def generate_buffer_buzzacott_chart(results):
+def generate_buffer_buzzacott_chart(results, fmt="png", dpi=300, figsize=None):
     """
     Génère des graphiques pour visualiser l'analyse Buffer Buzzacott
     """
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+    fig, ((ax1, ax2), (ax3, ax4)) = subplots(2, 2, figsize=figsize or (14, 10))
     
     # Couleurs pour ligne de transfert (tons rouges)
     colors = ['#dc2626', '#ef4444', '#f87171', '#fca5a5', '#fecaca', '#fee2e2']
@@ -163,16 +161,12 @@ def generate_buffer_buzzacott_chart(results):
         ax4.text(bar.get_x() + bar.get_width()/2., height + max(values)*0.01,
                 f'{val:.4f}', ha='center', va='bottom', fontsize=9)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Conversion en base64
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-    plt.close()
+    # Encodage de l'image
+    image_data = figure_bytes(fig, fmt, dpi, tight=figsize is None)
     
-    return image_base64
+    return image_data
 
 def solve_buffer_buzzacott(data):
     """
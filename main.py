@@ -1,13 +1,37 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Request, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.datastructures import Headers
+from fastapi.responses import ORJSONResponse, Response, FileResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import List
-import matplotlib.pyplot as plt
+from fastapi.routing import APIRoute
+from fastapi.exceptions import RequestValidationError
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, ValidationError
+from typing import List, Literal, Optional, Union
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.font_manager import FontProperties
+from matplotlib.collections import PathCollection
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
 import io
 import base64
 import os
+import json
+import logging
+import hashlib
+import tempfile
+import orjson
+import asyncio
+import threading
+import bisect
+import functools
+import inspect
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from collections import defaultdict
+from operator import itemgetter
 
 import spt
 import edd
@@ -30,22 +54,102 @@ import ligne_transfert_buffer_buzzacott
 import flowshop_machines
 from validation import validate_jobs_data, validate_johnson_data, validate_johnson_modifie_data, ExtendedRequest, FlexibleFlowshopRequest, JohnsonRequest, JohnsonModifieRequest, SmithRequest, JobshopSPTRequest
 from agenda_utils import generer_agenda_json
+from chart_utils import IMAGE_MEDIA_TYPES, subplots, figure_bytes, add_bars
+from cache_utils import LRUCache, DiskCache, payload_key
 from fms_sac_a_dos import solve_fms_sac_a_dos, generate_fms_sac_a_dos_chart, FMSSacADosRequest
-from fms_sac_a_dos_pl import fms_sac_a_dos_pl, generate_fms_sac_a_dos_pl_chart
+from fms_sac_a_dos_pl import fms_sac_a_dos_pl, generate_fms_sac_a_dos_pl_chart, FMSSacADosPLRequest
 from fms_sac_a_dos_glouton import solve_fms_sac_a_dos_glouton, generate_fms_sac_a_dos_glouton_chart, FMSSacADosGloutonRequest
 from fms_lots_production_glouton import solve_fms_lots_production_glouton, generate_fms_lots_production_glouton_chart, FMSLotsProductionGloutonRequest
-from fms_lots_production_mip import solve_fms_lots_production_mip, generate_fms_lots_production_mip_chart, FMSLotsProductionMIPRequest
+from fms_lots_production_mip import solve_fms_lots_production_mip, solve_fms_lots_production_mip_warm, problem_structure, generate_fms_lots_production_mip_chart, FMSLotsProductionMIPRequest
 from fms_lots_chargement_heuristique import solve_fms_lots_chargement_heuristique, generate_fms_lots_chargement_heuristique_chart, FMSLotsChargementHeuristiqueRequest
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
 
+# ----------- Décodage JSON rapide (orjson) -----------
+
+class ORJSONRequest(Request):
+    """Requête dont le corps JSON est décodé par orjson plutôt que par le module json"""
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    """Route FastAPI qui transmet une ORJSONRequest au gestionnaire"""
+    def get_route_handler(self):
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request):
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+# ----------- Compression des réponses -----------
+
+# Contenus déjà compressés (PNG/WebP, classeurs Excel) : inutile de les regzipper (le SVG, textuel, l'est)
+UNCOMPRESSED_PASSTHROUGH = ("image/png", "image/webp", "application/vnd.openxmlformats")
+
+class SelectiveGZipResponder(GZipResponder):
+    async def send_with_gzip(self, message):
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith(UNCOMPRESSED_PASSTHROUGH):
+                # Traité comme déjà encodé : le corps est transmis tel quel
+                self.content_encoding_set = True
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip pour les réponses JSON, sans recompresser images ni fichiers Excel"""
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = SelectiveGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+# ----------- CORS -----------
+
+# Origines autorisées, ex. CORS_ORIGINS="https://app.example.com,http://localhost:3000" (toutes par défaut)
+CORS_ORIGINS = [origin.strip() for origin in os.environ.get("CORS_ORIGINS", "*").split(",") if origin.strip()]
+
+# Routes internes (sondes de disponibilité) servies sans traitement CORS
+CORS_EXEMPT_PATHS = ("/health",)
+
+# Fichiers statiques (Gantt publiés) : chargés par <img src>, requêtes sans CORS côté navigateur
+CORS_EXEMPT_PREFIXES = ("/static/",)
+
+class SelectiveCORSMiddleware(CORSMiddleware):
+    """CORS pour les routes de l'API, court-circuité pour les routes internes et les fichiers statiques"""
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and (scope["path"] in CORS_EXEMPT_PATHS or scope["path"].startswith(CORS_EXEMPT_PREFIXES)):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Réponses JSON sérialisées par orjson (plus rapide que json sur les gros résultats)
+app = FastAPI(default_response_class=ORJSONResponse)
+app.router.route_class = ORJSONRoute
+
+# Aucun cookie n'est utilisé : pas de credentials (incompatibles avec l'origine "*")
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    SelectiveCORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=6)
+
+# Gantt publiés sous /static/gantt : URL stable dérivée du contenu, servie ensuite par StaticFiles
+# (sans passer par les routes) et mise en cache par le navigateur ou un CDN. Répertoire hors du dépôt
+# (GANTT_STATIC_DIR pour le changer), monté avant /static qui masquerait sinon ses fichiers
+GANTT_STATIC_DIR = os.environ.get("GANTT_STATIC_DIR") or os.path.join(tempfile.gettempdir(), "gantt_static")
+try:
+    GANTT_STATIC_FILES = DiskCache(GANTT_STATIC_DIR, max_bytes=512 * 1024 * 1024)
+    app.mount("/static/gantt", StaticFiles(directory=GANTT_STATIC_DIR), name="static_gantt")
+except OSError as e:
+    logger.warning("Publication des Gantt sous /static désactivée (%s): %s", GANTT_STATIC_DIR, e)
+    GANTT_STATIC_FILES = None
 
 # Servir les fichiers statiques (images Gantt)
 try:
@@ -53,39 +157,439 @@ try:
     os.makedirs(static_dir, exist_ok=True)  # Créer le dossier s'il n'existe pas
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 except Exception as e:
-    print(f"Attention: Impossible de configurer les fichiers statiques: {e}")
+    logger.warning("Attention: Impossible de configurer les fichiers statiques: %s", e)
+
+@app.get("/health")
+def health():
+    """Sonde de disponibilité (reverse proxy, orchestrateur)"""
+    return {"status": "ok"}
+
+# ----------- Exécution des résolutions -----------
+
+# Pool de processus pour les résolutions et graphiques coûteux en CPU (contourne le GIL)
+# SOLVER_PROCESSES permet de le réduire quand plusieurs workers gunicorn partagent la machine
+POOL_WORKERS = int(os.environ.get("SOLVER_PROCESSES", os.cpu_count()))
+EXECUTOR = concurrent.futures.ProcessPoolExecutor(max_workers=POOL_WORKERS)
+_executor_pid = os.getpid()
+_executor_lock = threading.Lock()
+
+def replace_broken_executor(broken):
+    """
+    Recrée le pool s'il s'agit toujours de `broken` : un processus mort (ou un résultat impossible
+    à renvoyer) rend le pool définitivement inutilisable, toutes les soumissions suivantes échoueraient
+    """
+    global EXECUTOR
+    with _executor_lock:
+        if EXECUTOR is broken:
+            logger.warning("Pool de processus inutilisable : recréation")
+            EXECUTOR = concurrent.futures.ProcessPoolExecutor(max_workers=POOL_WORKERS)
+            broken.shutdown(wait=False, cancel_futures=True)
+
+def submit(fn, *args, **kwargs):
+    """Soumet fn(*args, **kwargs) au pool, recréé s'il est cassé (seule la tâche fautive échoue)"""
+    executor = EXECUTOR
+    try:
+        fut = executor.submit(fn, *args, **kwargs)
+    except BrokenProcessPool:
+        replace_broken_executor(executor)
+        executor = EXECUTOR
+        fut = executor.submit(fn, *args, **kwargs)
+
+    def check_pool(f):
+        if not f.cancelled() and isinstance(f.exception(), BrokenProcessPool):
+            replace_broken_executor(executor)
+    fut.add_done_callback(check_pool)
+    return fut
+
+async def run_in_pool(fn, *args, **kwargs):
+    """Exécute fn(*args, **kwargs) dans le pool de processus sans bloquer la boucle d'événements"""
+    return await asyncio.wrap_future(submit(fn, *args, **kwargs))
+
+# Résolutions en cours, indexées par la clé canonique de la requête
+_pending: dict[str, concurrent.futures.Future] = {}
+_pending_lock = threading.Lock()
+
+def dedup_key(endpoint, request):
+    """Clé canonique identifiant une requête pour un endpoint donné"""
+    if isinstance(request, BaseModel):
+        # Ordre des champs fixé par le modèle : JSON déjà canonique, sérialisé par pydantic-core
+        return endpoint + ":" + request.model_dump_json()
+    return endpoint + ":" + json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+
+def file_key(endpoint, file_content):
+    """Clé d'un fichier importé : endpoint + empreinte blake2b de son contenu"""
+    return endpoint + ":" + hashlib.blake2b(file_content, digest_size=16).hexdigest()
+
+@app.on_event("startup")
+def reset_worker_state():
+    """
+    Avec gunicorn --preload, main est importé une seule fois avant le fork des workers :
+    chaque worker recrée son propre pool et repart sans résolution en cours héritée
+    """
+    global EXECUTOR, _executor_pid, _executor_lock, _pending_lock
+    if _executor_pid != os.getpid():
+        EXECUTOR = concurrent.futures.ProcessPoolExecutor(max_workers=POOL_WORKERS)
+        _executor_pid = os.getpid()
+        _executor_lock = threading.Lock()
+        _pending.clear()
+        _pending_lock = threading.Lock()
+
+def solve_dedup(key, fn, *args, **kwargs):
+    """Lance fn(*args) ou réutilise la résolution identique déjà en cours"""
+    with _pending_lock:
+        fut = _pending.get(key)
+        if fut is None:
+            fut = submit(fn, *args, **kwargs)
+            _pending[key] = fut
+            fut.add_done_callback(lambda f: _pending.pop(key, None))
+    return fut
+
+def with_base64_chart(result):
+    """Copie du résultat dont le graphique (octets PNG) est encodé en base64 pour la réponse JSON"""
+    return {**result, "graphique": base64.b64encode(result["graphique"]).decode()}
+
+async def with_rendered_chart(result, generator, *args, **kwargs):
+    """Copie du résultat (calculé sans graphique) complétée par le graphique base64, rendu à la demande"""
+    image_data = await render_chart(generator, *args, **kwargs)
+    return {**result, "graphique": base64.b64encode(image_data).decode()}
+
+def full_payload(result, image_base64):
+    """Réunit le résultat et le graphique PNG (base64) dans une seule réponse"""
+    return {"result": result, "chart_png_b64": image_base64}
+
+# Images déjà rendues, indexées par générateur + résultat du solveur (~32 Mio au plus)
+CHART_CACHE = LRUCache(max_entries=128, max_bytes=32 * 1024 * 1024)
+
+# Résultats récents des algorithmes, partagés entre un endpoint et ses variantes /gantt, /chart et /full
+RESULT_CACHE = LRUCache(max_entries=256)
+
+async def solve_cached(key, fn, *args, **kwargs):
+    """Résout fn(*args) dans le pool ou réutilise le résultat d'une requête identique récente (ou en cours)"""
+    digest = payload_key(key)
+    result = RESULT_CACHE.get(digest)
+    if result is None:
+        result = await asyncio.wrap_future(solve_dedup(key, fn, *args, **kwargs))
+        RESULT_CACHE.put(digest, result)
+    return result
+
+async def solve_args_cached(endpoint, fn, *args):
+    """
+    solve_cached avec une clé tirée des seuls arguments du solveur : les champs d'affichage de la requête
+    (unité, noms non transmis au solveur) ne forcent pas une nouvelle résolution
+    """
+    return await solve_cached(dedup_key(endpoint, args), fn, *args)
+
+async def render_chart(generator, *args, **kwargs):
+    """
+    Rend un graphique (octets de l'image) dans le pool, en réutilisant l'image si le même résultat a déjà été tracé
+    ou en attendant le tracé identique déjà en cours (requêtes simultanées)
+    """
+    key = payload_key([generator.__module__, generator.__name__, args, kwargs])
+    image_data = CHART_CACHE.get(key)
+    if image_data is None:
+        image_data = await asyncio.wrap_future(solve_dedup("chart:" + key.hex(), generator, *args, **kwargs))
+        CHART_CACHE.put(key, image_data)
+    return image_data
+
+# ----------- Gestion des erreurs des endpoints -----------
+
+def endpoint_error(fn, e, status, detail_prefix):
+    """
+    HTTPException correspondant à l'exception e de l'endpoint fn (à appeler dans le bloc except) :
+    les erreurs des parsings et exports Excel, levées dans le pool, gardent leur statut et leur message
+    """
+    if isinstance(e, excel_import.ExcelImportError):
+        return HTTPException(status_code=400, detail=str(e))
+    logger.exception("%s failed", fn.__name__)
+    if isinstance(e, excel_import.ExcelExportError):
+        return HTTPException(status_code=500, detail=str(e))
+    return HTTPException(status_code=status, detail=f"{detail_prefix}{e}")
+
+def endpoint(status=500, detail_prefix=""):
+    """Convertit toute exception d'un endpoint en HTTPException et la journalise"""
+    def deco(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    raise endpoint_error(fn, e, status, detail_prefix)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                try:
+                    return fn(*args, **kwargs)
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    raise endpoint_error(fn, e, status, detail_prefix)
+        return wrapper
+    return deco
+
+# ----------- Validation des requêtes -----------
+
+# Modèles déjà validés, indexés par modèle + empreinte du corps brut
+VALIDATED_BODIES = LRUCache(max_entries=512)
+
+def cached_body(model):
+    """
+    Dépendance : valide le corps JSON en `model`, en réutilisant l'instance d'un corps
+    identique récent (ex. /spt puis /spt/gantt avec le même JSON). Les instances sont
+    partagées entre requêtes : les endpoints ne doivent pas les modifier.
+    """
+    async def dependency(http_request: Request):
+        raw = await http_request.body()
+        key = (model.__name__, hashlib.blake2b(raw, digest_size=16).digest())
+        instance = VALIDATED_BODIES.get(key)
+        if instance is None:
+            try:
+                instance = model.model_validate_json(raw)
+            except ValidationError as e:
+                # Même format d'erreur 422 que la validation native de FastAPI
+                errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+                raise RequestValidationError(errors, body=raw)
+            VALIDATED_BODIES.put(key, instance)
+        return instance
+    return dependency
+
+# ----------- Cache HTTP des graphiques -----------
+
+def chart_size(dpi: Optional[int] = Query(None, ge=36, le=300),
+               width: Optional[int] = Query(None, ge=100, le=4000),
+               height: Optional[int] = Query(None, ge=100, le=4000)):
+    """
+    Résolution et dimensions (pixels) demandées pour le graphique, ex. ?dpi=72&width=600&height=400 pour une vignette ;
+    width et height vont ensemble (422 si un seul des deux est fourni)
+    """
+    if (width is None) != (height is None):
+        missing = "height" if height is None else "width"
+        raise RequestValidationError([{"type": "missing", "loc": ("query", missing), "input": None,
+                                       "msg": "width et height doivent être fournis ensemble"}])
+    size = {}
+    if dpi is not None:
+        size["dpi"] = dpi
+    if width is not None:
+        size["width"] = width
+        size["height"] = height
+    return size
+
+@functools.cache
+def default_dpi(generator):
+    """Résolution par défaut (paramètre dpi) d'un générateur de graphique"""
+    return inspect.signature(generator).parameters["dpi"].default
+
+def chart_size_kwargs(generator, size):
+    """
+    Paramètres dpi / figsize de generator pour la taille demandée (voir chart_size) : sans ?dpi=,
+    width et height sont convertis en pouces avec la résolution par défaut du générateur (figure non recadrée
+    quand figsize est donné : l'image fait exactement width x height pixels)
+    """
+    kwargs = {}
+    if "dpi" in size:
+        kwargs["dpi"] = size["dpi"]
+    if "width" in size:
+        dpi = size.get("dpi") or default_dpi(generator)
+        kwargs["figsize"] = (size["width"] / dpi, size["height"] / dpi)
+    return kwargs
+
+# À incrémenter quand le rendu ou les algorithmes changent : invalide les ETag déjà distribués
+CHART_ETAG_VERSION = 2
+
+def chart_etag(endpoint, request, size=None):
+    """ETag dérivé du contenu canonique de la requête (les graphiques sont déterministes)"""
+    endpoint = f"{endpoint}&v={CHART_ETAG_VERSION}"
+    if size:
+        endpoint = f"{endpoint}&size={sorted(size.items())}"
+    digest = hashlib.blake2b(dedup_key(endpoint, request).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+def is_not_modified(http_request, etag):
+    """Vrai si le client possède déjà cette version (en-tête If-None-Match)"""
+    if_none_match = http_request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+# Images déjà servies, écrites sur disque (tmpfs si disponible) et partagées par tous les workers
+CHART_FILES_DIR = os.environ.get("CHART_CACHE_DIR") or os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "chart_cache")
+try:
+    CHART_FILES = DiskCache(CHART_FILES_DIR, max_bytes=256 * 1024 * 1024)
+except OSError as e:
+    logger.warning("Cache disque des graphiques désactivé (%s): %s", CHART_FILES_DIR, e)
+    CHART_FILES = None
+
+
+def accept_quality(accept, media_type):
+    """Valeur q accordée à un type MIME par l'en-tête Accept (la plage la plus précise l'emporte)"""
+    main_type = media_type.split("/")[0]
+    best = (-1, 0.0)
+    for item in accept.split(","):
+        media_range, *params = [part.strip() for part in item.split(";")]
+        if media_range == media_type:
+            precision = 2
+        elif media_range == f"{main_type}/*":
+            precision = 1
+        elif media_range == "*/*":
+            precision = 0
+        else:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        best = max(best, (precision, quality))
+    return best[1]
+
+def negotiated_format(http_request, fmt=None):
+    """
+    Format explicite (?fmt=) sinon PNG ; SVG uniquement si l'en-tête Accept le classe strictement
+    au-dessus de image/png (un navigateur qui accepte aussi image/* reçoit donc du PNG)
+    """
+    if fmt is not None:
+        return fmt
+    accept = http_request.headers.get("accept", "")
+    if accept_quality(accept, "image/svg+xml") > accept_quality(accept, "image/png"):
+        return "svg"
+    return "png"
+
+def chart_headers(etag):
+    """ETag et cache privé, connexion conservée"""
+    return {"ETag": etag, "Cache-Control": "private, max-age=300", "Connection": "keep-alive"}
+
+def cached_chart_response(http_request, etag, fmt="png"):
+    """
+    304 si le client possède déjà cette version, sinon l'image déjà rendue sur disque
+    (envoyée par FileResponse, sans repasser par la résolution ni le tracé) ; None s'il faut la rendre
+    """
+    if is_not_modified(http_request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if CHART_FILES is None:
+        return None
+    # Un Gantt SVG trop gros a pu être servi en PNG (voir gantt_format)
+    found = CHART_FILES.find(etag.strip('"'), (fmt, "png") if fmt == "svg" else (fmt,))
+    if found is None:
+        return None
+    path, stat_result, suffix = found
+    CHART_FILES.touch(path)
+    return FileResponse(path, media_type=IMAGE_MEDIA_TYPES[suffix], stat_result=stat_result, headers=chart_headers(etag))
+
+def chart_response(image_data, etag, fmt="png"):
+    """Réponse image complète (Content-Length), écrite ensuite sur disque pour les requêtes suivantes"""
+    background = BackgroundTask(CHART_FILES.put, etag.strip('"'), fmt, image_data) if CHART_FILES is not None else None
+    return Response(content=image_data, media_type=IMAGE_MEDIA_TYPES[fmt], headers=chart_headers(etag), background=background)
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+def xlsx_response(content, filename):
+    """Classeur Excel (octets déjà en mémoire) envoyé en une seule écriture avec Content-Length"""
+    return Response(content=content, media_type=XLSX_MEDIA_TYPE,
+                    headers={"Content-Disposition": f"attachment; filename={filename}"})
 
 # ----------- Gantt utilitaire -----------
 
+# Pas 'ronds' du cadrillage, triés : valeurs usuelles jusqu'à 1000, multiples de 1000,
+# puis décades 1-2-5 pour les très longs horizons
+NICE_TIME_STEPS = sorted({1, 2, 5, 10, 15, 20, 25, 30, 40, 50, 75, 100, 150, 200, 250, 300, 350, 400, 450, 500, 750, 1000,
+                          2000, 5000, 10000, 20000, 50000, 100000}
+                         | {v * 10 ** k for k in range(5, 10) for v in (1, 2, 5)})
+
 def get_nice_time_intervals(max_time):
     """
     Retourne des intervalles de temps 'ronds' pour le cadrillage
     """
-    # Valeurs rondes prédéfinies
-    nice_values = [1, 2, 5, 10, 15, 20, 25, 30, 40, 50, 75, 100, 150, 200, 250, 300, 350, 400, 450, 500, 750, 1000]
-    
-    # Trouver la valeur qui donne environ 10-20 divisions
-    target_divisions = 15  # Nombre idéal de divisions
-    ideal_step = max_time / target_divisions
-    
-    # Trouver la valeur ronde la plus proche
-    best_step = nice_values[0]
-    for value in nice_values:
-        if value >= ideal_step:
-            best_step = value
-            break
-        best_step = value  # Garder la dernière valeur si aucune n'est assez grande
-    
-    # Si max_time est très grand, multiplier par des facteurs
-    if best_step < ideal_step and max_time > 1000:
-        multipliers = [2, 5, 10, 20, 50, 100]
-        for mult in multipliers:
-            candidate = best_step * mult
-            if candidate >= ideal_step:
-                best_step = candidate
-                break
-    
-    return best_step
+    # Plus petit pas rond donnant au plus ~15 divisions
+    ideal_step = max_time / 15
+    return NICE_TIME_STEPS[min(bisect.bisect_left(NICE_TIME_STEPS, ideal_step), len(NICE_TIME_STEPS) - 1)]
+
+def index_map(names):
+    """
+    Position de chaque nom dans la liste (première occurrence, comme list.index)
+    """
+    positions = {}
+    for i, name in enumerate(names or []):
+        positions.setdefault(name, i)
+    return positions
+
+def add_label_paths(ax, labels, prop, **kwargs):
+    """
+    Étiquettes [(centre x, y, largeur de la barre, texte)] tracées comme contours de glyphes :
+    une PathCollection par texte distinct plutôt qu'un artiste Text (mis en forme au rendu) par barre.
+    Les étiquettes plus larges que leur barre sont omises. À appeler une fois la mise en page fixée.
+    """
+    fig = ax.figure
+    x_min, x_max = ax.get_xlim()
+    # Points typographiques par unité de temps sur l'axe x
+    points_per_unit = fig.get_figwidth() * ax.get_position().width * 72 / abs(x_max - x_min)
+    # Chemins en points, mis à l'échelle de la résolution effective au moment du rendu
+    points_to_display = Affine2D().scale(1 / 72) + fig.dpi_scale_trans
+    groups = defaultdict(list)
+    paths = {}
+    for x, y, width, text in labels:
+        entry = paths.get(text)
+        if entry is None:
+            path = TextPath((0, 0), text, prop=prop)
+            extents = path.get_extents()
+            # Glyphes centrés sur l'origine (alignement center/center) ; largeur mesurée une seule fois par texte
+            entry = paths[text] = (path.transformed(Affine2D().translate(-(extents.x0 + extents.x1) / 2,
+                                                                         -(extents.y0 + extents.y1) / 2)),
+                                   extents.width)
+        if entry[1] <= width * points_per_unit:
+            groups[text].append((x, y))
+    for text, offsets in groups.items():
+        ax.add_collection(PathCollection([paths[text][0]], offsets=offsets, offset_transform=ax.transData,
+                                         transform=points_to_display, linewidths=0, **kwargs), autolim=False)
+
+# Palette et polices des diagrammes de Gantt, construites une seule fois
+GANTT_COLORS = ("#4f46e5", "#f59e0b", "#10b981", "#ef4444", "#6366f1", "#8b5cf6", "#14b8a6", "#f97316",
+                "#06b6d4", "#84cc16", "#f43f5e", "#8b5a2b", "#6b7280", "#ec4899", "#3b82f6", "#22c55e")
+GANTT_SETUP_COLORS = GANTT_COLORS[:8]
+GANTT_JOB_FONT = FontProperties(size=9, weight="bold")
+GANTT_DUE_FONT = FontProperties(size=8, weight="bold")
+
+# Résolution par défaut des routes /gantt (?hires=1 pour GANTT_HIRES_DPI)
+GANTT_DPI = 100
+GANTT_HIRES_DPI = 300
+
+# Au-delà, les segments contigus d'un même job sont fusionnés avant le tracé
+GANTT_MERGE_MIN_TASKS = 500
+
+# Au-delà, les noms des jobs sont tracés en contours groupés par texte (add_label_paths)
+GANTT_LABEL_PATHS_MIN_TASKS = 100
+
+# Au-delà, pas de légende des jobs (illisible et masquant des barres sur un planning chargé)
+GANTT_LEGEND_MAX_TASKS = 200
+
+# Résolution maximale selon le nombre de barres : le coût du tracé Agg croît comme dpi²
+GANTT_DPI_STEPS = ((64, 300), (256, 150))
+
+def gantt_dpi(task_count, max_dpi=300):
+    """Résolution du Gantt : pleine jusqu'à 64 barres, 150 dpi jusqu'à 256, 100 dpi au-delà (sans dépasser max_dpi)"""
+    for limit, dpi in GANTT_DPI_STEPS:
+        if task_count < limit:
+            return min(dpi, max_dpi)
+    return min(100, max_dpi)
+
+# Clé de tri des tâches (job, début, durée) par début, évaluée en C (sans frame Python par tâche)
+task_start = itemgetter(1)
+
+def merge_segments(tasks):
+    """Fusionne les tâches (job, début, durée) contiguës d'un même job sur une machine"""
+    merged = []
+    for job, start, duration in sorted(tasks, key=task_start):
+        if merged and merged[-1][0] == job and abs(merged[-1][1] + merged[-1][2] - start) < 1e-9:
+            merged[-1] = (job, merged[-1][1], merged[-1][2] + duration)
+        else:
+            merged.append((job, start, duration))
+    return merged
 
 def create_gantt_figure(result, title: str, unite="heures", job_names=None, machine_names=None, due_dates=None):
     """
@@ -94,31 +598,33 @@ def create_gantt_figure(result, title: str, unite="heures", job_names=None, mach
     import matplotlib.patches as patches
     import numpy as np
     
+    job_positions = index_map(job_names)
+    
+    # Tâches de chaque machine en tuples (job, début, durée) ; accepte aussi les dicts {"job", "start", "duration"}
+    machines = {m: [t if isinstance(t, tuple) else (t["job"], t["start"], t["duration"]) for t in tasks]
+                for m, tasks in result["machines"].items()}
+    # Longs plannings : une barre (et une étiquette) par suite de segments contigus d'un même job
+    if sum(len(tasks) for tasks in machines.values()) > GANTT_MERGE_MIN_TASKS:
+        machines = {m: merge_segments(tasks) for m, tasks in machines.items()}
+    
     # Calculer la taille optimale selon le nombre de machines
-    num_machines = len(result["machines"])
+    num_machines = len(machines)
     fig_height = max(4, num_machines * 0.8 + 2)
-    fig, ax = plt.subplots(figsize=(14, fig_height))
+    fig, ax = subplots(figsize=(14, fig_height))
     
     # Style professionnel
     ax.set_facecolor('#f8f9fa')
     fig.patch.set_facecolor('white')
     
     # Couleurs différentes pour chaque tâche
-    colors = ["#4f46e5", "#f59e0b", "#10b981", "#ef4444", "#6366f1", "#8b5cf6", "#14b8a6", "#f97316", 
-              "#06b6d4", "#84cc16", "#f43f5e", "#8b5a2b", "#6b7280", "#ec4899", "#3b82f6", "#22c55e"]
+    colors = GANTT_COLORS
     
     # Trier les machines par index pour un affichage cohérent
-    sorted_machines = sorted(result["machines"].items(), key=lambda x: int(x[0]))
+    sorted_machines = sorted(machines.items(), key=lambda x: int(x[0]))
     
     # Hauteur des barres
     bar_height = 0.6
     
-    # Calculer le temps maximum pour définir la grille
-    max_time = 0
-    for m, tasks in result["machines"].items():
-        for t in tasks:
-            max_time = max(max_time, t["start"] + t["duration"])
-    
     # Créer un mapping des dates dues vers les couleurs des tâches
     due_date_colors = {}
     if due_dates:
@@ -127,36 +633,44 @@ def create_gantt_figure(result, title: str, unite="heures", job_names=None, mach
                 job_color = colors[job_idx % len(colors)]
                 due_date_colors[due_date] = (job_color, job_idx)
     
-    # Dessiner les tâches
+    # Dessiner les tâches (une ligne par machine, dans l'ordre trié) : toutes les barres
+    # dans une seule collection, toutes les ombres dans une autre ; le temps maximum
+    # (pour la grille) est relevé dans le même passage
+    max_time = 0
+    row_labels = []
+    bars, bar_colors, job_labels = [], [], []
     for m_idx, (m, tasks) in enumerate(sorted_machines):
         label = machine_names[int(m)] if machine_names and int(m) < len(machine_names) else f"Machine {int(m)}"
+        row_labels.append(label)
         
         if len(tasks) == 0:
             # Machine vide : afficher une ligne vide mais visible
-            ax.barh(label, 0, left=0, color='#e9ecef', alpha=0.5, height=0.2, 
+            ax.barh(m_idx, 0, left=0, color='#e9ecef', alpha=0.5, height=0.2, 
                    edgecolor='#6c757d', linewidth=0.5)
-        else:
-            # Machine avec tâches : afficher avec couleurs différentes par tâche
-            for t in tasks:
-                job_idx = t["job"] if isinstance(t["job"], int) else job_names.index(t["job"])
-                job_label = job_names[job_idx] if job_names else f"J{job_idx}"
-                
-                # Couleur différente pour chaque tâche
-                color = colors[job_idx % len(colors)]
-                
-                # Créer la barre avec bordure
-                bar = ax.barh(label, t["duration"], left=t["start"], color=color, 
-                             height=bar_height, edgecolor='white', linewidth=1.5, alpha=0.9)
-                
-                # Ajouter une ombre subtile
-                shadow = ax.barh(label, t["duration"], left=t["start"] + 0.1, color='black', 
-                               height=bar_height, alpha=0.1, zorder=0)
-                
-                # Texte du job avec style amélioré
-                text_color = 'white'
-                ax.text(t["start"] + t["duration"] / 2, label, job_label,
-                       va="center", ha="center", color=text_color, fontsize=9, 
-                       fontweight='bold', zorder=10)
+            continue
+        
+        y0 = m_idx - bar_height / 2
+        for job, start, duration in tasks:
+            job_idx = job if isinstance(job, int) else job_positions[job]
+            max_time = max(max_time, start + duration)
+            bars.append((start, y0, duration, bar_height))
+            # Couleur différente pour chaque tâche
+            bar_colors.append(colors[job_idx % len(colors)])
+            job_labels.append((start + duration / 2, m_idx, duration, job_names[job_idx] if job_names else f"J{job_idx}"))
+    
+    if bars:
+        # Barres avec bordure blanche
+        add_bars(ax, bars, facecolors=bar_colors, edgecolor='white', linewidth=1.5, alpha=0.9)
+        # Ajouter une ombre subtile
+        add_bars(ax, [(x + 0.1, y, w, h) for x, y, w, h in bars], facecolors='black', alpha=0.1, zorder=0)
+    
+    # Texte du job avec style amélioré (gros plannings : tracé groupé après la mise en page)
+    batch_labels = len(job_labels) > GANTT_LABEL_PATHS_MIN_TASKS
+    if not batch_labels:
+        for x, y, _, job_label in job_labels:
+            ax.text(x, y, job_label, va="center", ha="center", color='white',
+                   fontproperties=GANTT_JOB_FONT, zorder=10)
+    ax.set_yticks(range(len(row_labels)), row_labels)
 
     # Créer un cadrillage avec coloration des cases selon les dates dues
     if max_time > 0:
@@ -213,7 +727,7 @@ def create_gantt_figure(result, title: str, unite="heures", job_names=None, mach
                     
                     # Ajouter le texte de la date due au-dessus de Machine 0
                     ax.text(due_date, y_position, text,
-                           ha='center', va='center', fontsize=8, fontweight='bold',
+                           ha='center', va='center', fontproperties=GANTT_DUE_FONT,
                            color='white', rotation=0, zorder=11,
                            bbox=bbox_props)
                 
@@ -234,7 +748,7 @@ def create_gantt_figure(result, title: str, unite="heures", job_names=None, mach
     ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
     
     # Créer la légende pour les tâches (si on a les noms des jobs)
-    if job_names and len(job_names) <= 8:  # Limiter la légende si trop de jobs
+    if job_names and len(job_names) <= 8 and len(job_labels) < GANTT_LEGEND_MAX_TASKS:  # Limiter la légende si trop de jobs ou de tâches
         legend_elements = []
         for i, job_name in enumerate(job_names):
             # Utiliser la même logique de couleur que pour les barres
@@ -246,13 +760,17 @@ def create_gantt_figure(result, title: str, unite="heures", job_names=None, mach
                  frameon=True, fancybox=True, shadow=True, fontsize=9)
     
     # Ajuster les marges
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Ajouter une bordure autour du graphique
     for spine in ax.spines.values():
         spine.set_edgecolor('#dee2e6')
         spine.set_linewidth(1)
     
+    # Noms des jobs des gros plannings, maintenant que la mise en page est fixée
+    if batch_labels:
+        add_label_paths(ax, job_labels, GANTT_JOB_FONT, facecolors='white', zorder=10)
+    
     return fig
 
 def create_gantt_figure_with_setup(result, title: str, unite="heures", job_names=None, machine_names=None, due_dates=None):
@@ -260,8 +778,9 @@ def create_gantt_figure_with_setup(result, title: str, unite="heures", job_names
     Fonction de Gantt spécialisée pour afficher les temps de setup en rouge pâle
     AVEC le même visuel que create_gantt_figure (due dates en haut, cadrillage rond)
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
-    colors = ["#4f46e5", "#f59e0b", "#10b981", "#ef4444", "#6366f1", "#8b5cf6", "#14b8a6", "#f97316"]
+    job_positions = index_map(job_names)
+    fig, ax = subplots(figsize=(12, 6))
+    colors = GANTT_SETUP_COLORS
     setup_color = "#ffcccb"  # Rouge pâle pour les temps de setup
 
     # Trier les machines par index pour un affichage cohérent
@@ -273,28 +792,39 @@ def create_gantt_figure_with_setup(result, title: str, unite="heures", job_names
         for t in tasks:
             max_time = max(max_time, t["start"] + t["duration"])
     
+    # Lignes numériques (une par machine) : barres des tâches et des setups dans deux collections
+    row_labels = []
+    task_bars, task_colors, setup_bars = [], [], []
     for m_idx, (m, tasks) in enumerate(sorted_machines):
         label = machine_names[int(m)] if machine_names and int(m) < len(machine_names) else f"Machine {int(m)}"
+        row_labels.append(label)
         
         if len(tasks) == 0:
             # Machine vide : afficher une ligne vide mais visible
-            ax.barh(label, 0, left=0, color='lightgray', alpha=0.3, height=0.1)
-        else:
-            # Machine avec tâches : afficher normalement
-            for t in tasks:
-                if t.get("type") == "setup":
-                    # Temps de setup : rouge pâle
-                    ax.barh(label, t["duration"], left=t["start"], color=setup_color, alpha=0.8)
-                    ax.text(t["start"] + t["duration"] / 2, label, "Setup",
-                            va="center", ha="center", color="darkred", fontsize=7, weight="bold")
-                else:
-                    # Tâche normale : couleur selon le job
-                    job_idx = t["job"] if isinstance(t["job"], int) else job_names.index(t["job"])
-                    job_label = job_names[job_idx] if job_names else f"J{job_idx}"
-                    color = colors[job_idx % len(colors)]
-                    ax.barh(label, t["duration"], left=t["start"], color=color)
-                    ax.text(t["start"] + t["duration"] / 2, label, job_label,
-                            va="center", ha="center", color="white", fontsize=8)
+            ax.barh(m_idx, 0, left=0, color='lightgray', alpha=0.3, height=0.1)
+            continue
+        
+        for t in tasks:
+            bar = (t["start"], m_idx - 0.4, t["duration"], 0.8)
+            if t.get("type") == "setup":
+                # Temps de setup : rouge pâle
+                setup_bars.append(bar)
+                ax.text(t["start"] + t["duration"] / 2, m_idx, "Setup",
+                        va="center", ha="center", color="darkred", fontsize=7, weight="bold")
+            else:
+                # Tâche normale : couleur selon le job
+                job_idx = t["job"] if isinstance(t["job"], int) else job_positions[t["job"]]
+                job_label = job_names[job_idx] if job_names else f"J{job_idx}"
+                task_bars.append(bar)
+                task_colors.append(colors[job_idx % len(colors)])
+                ax.text(t["start"] + t["duration"] / 2, m_idx, job_label,
+                        va="center", ha="center", color="white", fontsize=8)
+    
+    if task_bars:
+        add_bars(ax, task_bars, facecolors=task_colors, edgecolor='face', linewidth=0)
+    if setup_bars:
+        add_bars(ax, setup_bars, facecolors=setup_color, alpha=0.8, edgecolor='face', linewidth=0)
+    ax.set_yticks(range(len(row_labels)), row_labels)
 
     # Ajouter le cadrillage avec des valeurs rondes (comme create_gantt_figure)
     if max_time > 0:
@@ -353,361 +883,438 @@ def create_gantt_figure_with_setup(result, title: str, unite="heures", job_names
     ax.set_xlabel(f"Temps ({unite})")
     ax.invert_yaxis()
     ax.set_title(title)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
+# Au-delà, un SVG (plusieurs éléments par tâche) devient plus lourd et plus lent à afficher que le PNG
+GANTT_SVG_MAX_TASKS = 500
+
+def gantt_format(fmt, task_count):
+    """Format effectif du Gantt : les gros plannings restent en PNG même si le SVG est demandé"""
+    if fmt == "svg" and task_count >= GANTT_SVG_MAX_TASKS:
+        return "png"
+    return fmt
+
+def render_gantt_image(result, title: str, fmt="png", dpi=300, **kwargs) -> bytes:
+    """
+    Trace le diagramme de Gantt sur la figure réutilisable du thread et retourne l'image (PNG par défaut) ;
+    dpi est un maximum, abaissé pour les gros plannings (gantt_dpi)
+    """
+    dpi = gantt_dpi(sum(len(tasks) for tasks in result["machines"].values()), dpi)
+    return figure_bytes(create_gantt_figure(result, title, **kwargs), fmt, dpi, tight=False)
+
+def gantt_vega_spec(result, title: str, unite="heures", job_names=None, machine_names=None, due_dates=None):
+    """
+    Spécification Vega-Lite du diagramme de Gantt (mêmes données que create_gantt_figure),
+    tracée par le client : barres par machine, noms des jobs, dates dues en traits verticaux
+    """
+    job_positions = index_map(job_names)
+    machines = []
+    tasks = []
+    for m, machine_tasks in sorted(result["machines"].items(), key=lambda x: int(x[0])):
+        machine = machine_names[int(m)] if machine_names and int(m) < len(machine_names) else f"Machine {int(m)}"
+        machines.append(machine)
+        for t in machine_tasks:
+            job, start, duration = t if isinstance(t, tuple) else (t["job"], t["start"], t["duration"])
+            if isinstance(job, int):
+                job = job_names[job] if job_names and job < len(job_names) else f"J{job}"
+            tasks.append({"machine": machine, "job": job, "start": start, "end": start + duration})
+    
+    # Une couleur par job, dans l'ordre de la palette du Gantt PNG
+    jobs = list(job_positions) or sorted({t["job"] for t in tasks})
+    color = {"field": "job", "type": "nominal", "title": "Job",
+             "scale": {"domain": jobs, "range": [GANTT_COLORS[i % len(GANTT_COLORS)] for i in range(len(jobs))]}}
+    y = {"field": "machine", "type": "nominal", "title": None, "sort": machines}
+    layers = [
+        {"data": {"values": tasks},
+         "mark": {"type": "bar", "stroke": "white", "strokeWidth": 1.5, "opacity": 0.9},
+         "encoding": {"y": y,
+                      "x": {"field": "start", "type": "quantitative", "title": f"Temps ({unite})"},
+                      "x2": {"field": "end"},
+                      "color": color,
+                      "tooltip": [{"field": "job"}, {"field": "machine"}, {"field": "start"}, {"field": "end"}]}},
+        {"data": {"values": tasks},
+         "transform": [{"calculate": "(datum.start + datum.end) / 2", "as": "center"}],
+         "mark": {"type": "text", "color": "white", "fontWeight": "bold", "fontSize": 9},
+         "encoding": {"y": y, "x": {"field": "center", "type": "quantitative"}, "text": {"field": "job"}}},
+    ]
+    due = [{"job": job_names[i] if job_names and i < len(job_names) else f"J{i}", "due_date": d}
+           for i, d in enumerate(due_dates or []) if d and d > 0]
+    if due:
+        layers.append({"data": {"values": due},
+                       "mark": {"type": "rule", "strokeDash": [6, 4], "strokeWidth": 2},
+                       "encoding": {"x": {"field": "due_date", "type": "quantitative"}, "color": color,
+                                    "tooltip": [{"field": "job"}, {"field": "due_date", "title": "Date due"}]}})
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": title,
+        "width": "container",
+        "height": max(4, len(machines) * 0.8 + 2) * 40,
+        "layer": layers,
+    }
+
+# ----------- Diagrammes de Gantt -----------
+
+def flowshop_layout(result, request):
+    """Gantt d'un flowshop : le résultat est déjà groupé par machine"""
+    return result, request.machine_names, request.due_dates
+
+def planification_by_name(machines, machine_names):
+    """Tâches de chaque machine d'un flowshop indexées par le nom de la machine (clés "0", "1", ... ou entières)"""
+    return {machine_names[int(m)]: tasks for m, tasks in machines.items()}
+
+def planification_named_machines(machines, machine_names):
+    """Comme planification_by_name, en ignorant les clés qui ne désignent pas une machine nommée (index hors liste)"""
+    planification = {}
+    for m, tasks in machines.items():
+        try:
+            index = int(m)
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < len(machine_names):
+            planification[machine_names[index]] = tasks
+    return planification
+
+def smith_layout(result, request):
+    """Gantt de Smith : une seule machine, dates dues lues dans les jobs ([durée, date due])"""
+    return result, ["Machine 1"], [job[1] for job in request.jobs]
+
+def schedule_machines(schedule, machine_names, setup_schedule=None):
+    """Tâches (job, début, durée) d'un planning jobshop et setups éventuels, regroupées par index de machine et triées par début"""
+    machine_positions = index_map(machine_names)
+    machines_dict = defaultdict(list)
+    for t in schedule:
+        m_idx = machine_positions[t["machine"]]
+        machines_dict[m_idx].append((t["job"], t["start"], t["duration"] if "duration" in t else t["end"] - t["start"]))
+    for setup in setup_schedule or []:
+        m_idx = machine_positions[setup["machine"]]
+        machines_dict[m_idx].append((f"{setup['from_job']}→{setup['to_job']}", setup["start"], setup["duration"]))
+    for tasks in machines_dict.values():
+        tasks.sort(key=task_start)
+    return machines_dict
+
+def jobshop_layout(result, request):
+    """Gantt d'un jobshop : tâches (et setups éventuels) regroupées par machine, triées par début"""
+    machines_dict = schedule_machines(result["schedule"], request.machine_names, result.get("setup_schedule"))
+    return {"machines": machines_dict}, request.machine_names, request.due_dates
+
+def gantt_renderer(name, title, solver, validate=None, layout=flowshop_layout):
+    """
+    Résout la requête via le cache partagé avec /<name> (solver(request) -> (fonction, *arguments))
+    et trace son Gantt : render(request, fmt, dpi) -> (octets de l'image, format effectif)
+    """
+    async def render(request, fmt, dpi):
+        if validate is not None:
+            validate(request)
+        fn, *args = solver(request)
+        result = await solve_args_cached(name, fn, *args)
+        gantt, machine_names, due_dates = layout(result, request)
+        fmt = gantt_format(fmt, sum(len(tasks) for tasks in gantt["machines"].values()))
+        image_data = await render_chart(render_gantt_image, gantt, title,
+                                        fmt=fmt,
+                                        dpi=dpi,
+                                        unite=request.unite,
+                                        job_names=request.job_names,
+                                        machine_names=machine_names,
+                                        due_dates=due_dates)
+        return image_data, fmt
+
+    return render
+
+async def gantt_png_response(result, title, hires=False, filename=None, **kwargs):
+    """
+    Gantt PNG d'un planning déjà calculé (routes d'import Excel) : tracé dans le pool via render_chart,
+    à GANTT_DPI ou GANTT_HIRES_DPI (?hires=1), éventuellement proposé en téléchargement
+    """
+    image_data = await render_chart(render_gantt_image, result, title,
+                                    dpi=GANTT_HIRES_DPI if hires else GANTT_DPI, **kwargs)
+    headers = {"Content-Disposition": f"attachment; filename={filename}"} if filename else None
+    return Response(content=image_data, media_type="image/png", headers=headers)
+
+def make_gantt_endpoint(name, title, request_cls, solver, validate=None, layout=flowshop_layout):
+    """
+    Route /<name>/gantt : Gantt de la requête (voir gantt_renderer), avec ETag/304
+    """
+    render = gantt_renderer(name, title, solver, validate, layout)
+
+    @endpoint(status=400)
+    async def run_gantt(http_request: Request, fmt: Optional[Literal["png", "webp", "svg"]] = None,
+                        hires: bool = False, request: request_cls = Depends(cached_body(request_cls))):
+        fmt = negotiated_format(http_request, fmt)
+        dpi = GANTT_HIRES_DPI if hires else GANTT_DPI
+        etag = chart_etag(f"{name}/gantt?fmt={fmt}&dpi={dpi}", request)
+        cached = cached_chart_response(http_request, etag, fmt)
+        if cached is not None:
+            cached.headers["Vary"] = "Accept"
+            return cached
+        image_data, fmt = await render(request, fmt, dpi)
+        response = chart_response(image_data, etag, fmt)
+        response.headers["Vary"] = "Accept"
+        return response
+
+    run_gantt.__name__ = run_gantt.__qualname__ = f"run_{name.replace('/', '_')}_gantt"
+    return run_gantt
+
+def make_gantt_url_endpoint(name, title, request_cls, solver, validate=None, layout=flowshop_layout):
+    """
+    Route /<name>/gantt/url : publie le Gantt sous /static/gantt/<empreinte>.<format> (tracé seulement
+    s'il n'y est pas déjà) et renvoie son URL, à charger ensuite en GET comme un fichier statique
+    """
+    render = gantt_renderer(name, title, solver, validate, layout)
+
+    @endpoint(status=400)
+    async def run_gantt_url(fmt: Literal["png", "webp", "svg"] = "png", hires: bool = False,
+                            request: request_cls = Depends(cached_body(request_cls))):
+        if GANTT_STATIC_FILES is None:
+            raise HTTPException(status_code=503, detail="Publication des diagrammes de Gantt indisponible")
+        dpi = GANTT_HIRES_DPI if hires else GANTT_DPI
+        key = chart_etag(f"{name}/gantt?fmt={fmt}&dpi={dpi}", request).strip('"')
+        # Un Gantt SVG trop gros a pu être publié en PNG (voir gantt_format)
+        found = GANTT_STATIC_FILES.find(key, (fmt, "png") if fmt == "svg" else (fmt,))
+        if found is not None:
+            # Pas de touch() : StaticFiles dérive son ETag de la date de modification
+            fmt = found[2]
+        else:
+            image_data, fmt = await render(request, fmt, dpi)
+            # Écriture avant la réponse : le fichier doit exister quand le client le demande
+            await asyncio.to_thread(GANTT_STATIC_FILES.put, key, fmt, image_data)
+        return {"url": f"/static/gantt/{key}.{fmt}"}
+
+    run_gantt_url.__name__ = run_gantt_url.__qualname__ = f"run_{name.replace('/', '_')}_gantt_url"
+    return run_gantt_url
+
+# (nom de l'algorithme, titre, modèle de requête, résolution, validation, mise en forme)
+GANTT_ENDPOINTS = [
+    ("jobshop/spt", "Diagramme de Gantt - Jobshop SPT", JobshopSPTRequest,
+     lambda r: (jobshop_spt.planifier_jobshop_spt, r.job_names, r.machine_names, r.jobs_data, r.due_dates),
+     None, jobshop_layout),
+    ("jobshop/edd", "Diagramme de Gantt - Jobshop EDD", JobshopSPTRequest,
+     lambda r: (jobshop_edd.planifier_jobshop_edd, r.job_names, r.machine_names, r.jobs_data, r.due_dates),
+     None, jobshop_layout),
+    ("jobshop/contraintes", "Diagramme de Gantt - Jobshop Contraintes (CP)", JobshopSPTRequest,
+     lambda r: (jobshop_contraintes.planifier_jobshop_contraintes, r.job_names, r.machine_names, r.jobs_data,
+                r.due_dates, r.setup_times, r.release_times),
+     None, jobshop_layout),
+    ("spt", "Diagramme de Gantt - Flowshop SPT", ExtendedRequest,
+     lambda r: (spt.schedule, r.jobs_data, r.due_dates),
+     lambda r: validate_jobs_data(r.jobs_data, r.due_dates), flowshop_layout),
+    ("edd", "Diagramme de Gantt - Flowshop EDD", ExtendedRequest,
+     lambda r: (edd.schedule, r.jobs_data, r.due_dates),
+     lambda r: validate_jobs_data(r.jobs_data, r.due_dates), flowshop_layout),
+    ("johnson", "Diagramme de Gantt - Johnson", JohnsonRequest,
+     lambda r: (johnson.schedule, r.jobs_data, r.due_dates),
+     lambda r: validate_johnson_data(r.jobs_data, r.due_dates, r.job_names), flowshop_layout),
+    ("johnson_modifie", "Diagramme de Gantt - Johnson modifié", JohnsonModifieRequest,
+     lambda r: (johnson_modifie.schedule, r.jobs_data, r.due_dates),
+     lambda r: validate_johnson_modifie_data(r.jobs_data, r.due_dates, r.job_names), flowshop_layout),
+    ("smith", "Diagramme de Gantt - Smith", SmithRequest,
+     lambda r: (smith.smith_algorithm, r.jobs),
+     None, smith_layout),
+    # Mode flowshop classique uniquement (machines_per_stage = None : une machine par étape)
+    ("contraintes", "Diagramme de Gantt - Contraintes (CP)", ExtendedRequest,
+     lambda r: (contraintes.flowshop_contraintes, r.jobs_data, r.due_dates, r.job_names, r.machine_names, None),
+     lambda r: validate_jobs_data(r.jobs_data, r.due_dates), flowshop_layout),
+]
+
+def make_gantt_spec_endpoint(name, title, request_cls, solver, validate=None, layout=flowshop_layout):
+    """
+    Route /<name>/gantt.json : même planning que /<name>/gantt (cache partagé),
+    renvoyé en spécification Vega-Lite à tracer côté client, sans matplotlib
+    """
+    @endpoint(status=400)
+    async def run_gantt_spec(request: request_cls = Depends(cached_body(request_cls))):
+        if validate is not None:
+            validate(request)
+        fn, *args = solver(request)
+        result = await solve_args_cached(name, fn, *args)
+        gantt, machine_names, due_dates = layout(result, request)
+        return gantt_vega_spec(gantt, title,
+                               unite=request.unite,
+                               job_names=request.job_names,
+                               machine_names=machine_names,
+                               due_dates=due_dates)
+
+    run_gantt_spec.__name__ = run_gantt_spec.__qualname__ = f"run_{name.replace('/', '_')}_gantt_spec"
+    return run_gantt_spec
+
+for name, title, request_cls, solver, validate, layout in GANTT_ENDPOINTS:
+    app.post(f"/{name}/gantt")(make_gantt_endpoint(name, title, request_cls, solver, validate, layout))
+    app.post(f"/{name}/gantt.json")(make_gantt_spec_endpoint(name, title, request_cls, solver, validate, layout))
+    app.post(f"/{name}/gantt/url")(make_gantt_url_endpoint(name, title, request_cls, solver, validate, layout))
+
 # ----------- Jobshop SPT -----------
 
 @app.post("/jobshop/spt")
-def run_jobshop_spt(request: JobshopSPTRequest):
-    try:
-        result = jobshop_spt.planifier_jobshop_spt(request.job_names, request.machine_names, request.jobs_data, request.due_dates)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/jobshop/spt/gantt")
-def run_jobshop_spt_gantt(request: JobshopSPTRequest):
-    try:
-        result = jobshop_spt.planifier_jobshop_spt(request.job_names, request.machine_names, request.jobs_data, request.due_dates)
-        machines_dict = {}
-        for t in result["schedule"]:
-            m_idx = request.machine_names.index(t["machine"])
-            machines_dict.setdefault(m_idx, []).append({
-                "job": t["job"],
-                "start": t["start"],
-                "duration": t["end"] - t["start"]
-            })
-        result_formatted = {"machines": machines_dict}
-        fig = create_gantt_figure(result_formatted, "Diagramme de Gantt - Jobshop SPT",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_jobshop_spt(request: JobshopSPTRequest = Depends(cached_body(JobshopSPTRequest))):
+    result = await solve_args_cached("jobshop/spt", jobshop_spt.planifier_jobshop_spt, request.job_names, request.machine_names, request.jobs_data, request.due_dates)
+    return result
 
 # ----------- Jobshop EDD -----------
 
 @app.post("/jobshop/edd")
-def run_jobshop_edd(request: JobshopSPTRequest):
-    try:
-        result = jobshop_edd.planifier_jobshop_edd(request.job_names, request.machine_names, request.jobs_data, request.due_dates)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/jobshop/edd/gantt")
-def run_jobshop_edd_gantt(request: JobshopSPTRequest):
-    try:
-        result = jobshop_edd.planifier_jobshop_edd(request.job_names, request.machine_names, request.jobs_data, request.due_dates)
-        machines_dict = {}
-        for t in result["schedule"]:
-            m_idx = request.machine_names.index(t["machine"])
-            machines_dict.setdefault(m_idx, []).append({
-                "job": t["job"],
-                "start": t["start"],
-                "duration": t["end"] - t["start"]
-            })
-        result_formatted = {"machines": machines_dict}
-        fig = create_gantt_figure(result_formatted, "Diagramme de Gantt - Jobshop EDD",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_jobshop_edd(request: JobshopSPTRequest = Depends(cached_body(JobshopSPTRequest))):
+    result = await solve_args_cached("jobshop/edd", jobshop_edd.planifier_jobshop_edd, request.job_names, request.machine_names, request.jobs_data, request.due_dates)
+    return result
 
 # ----------- Jobshop Contraintes -----------
 
 @app.post("/jobshop/contraintes")
-def run_jobshop_contraintes(request: JobshopSPTRequest):
-    try:
-        result = jobshop_contraintes.planifier_jobshop_contraintes(
-            request.job_names, 
-            request.machine_names, 
-            request.jobs_data, 
-            request.due_dates,
-            request.setup_times,
-            request.release_times
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/jobshop/contraintes/gantt")
-def run_jobshop_contraintes_gantt(request: JobshopSPTRequest):
-    try:
-        result = jobshop_contraintes.planifier_jobshop_contraintes(
-            request.job_names, 
-            request.machine_names, 
-            request.jobs_data, 
-            request.due_dates,
-            request.setup_times,
-            request.release_times
-        )
-        machines_dict = {}
-        
-        # Ajouter les tâches normales
-        for t in result["schedule"]:
-            m_idx = request.machine_names.index(t["machine"])
-            machines_dict.setdefault(m_idx, []).append({
-                "job": t["job"],
-                "start": t["start"],
-                "duration": t["duration"] if "duration" in t else t["end"] - t["start"],
-                "type": "task"
-            })
-        
-        # Ajouter les temps de setup s'ils existent
-        if "setup_schedule" in result and result["setup_schedule"]:
-            for setup in result["setup_schedule"]:
-                m_idx = request.machine_names.index(setup["machine"])
-                machines_dict.setdefault(m_idx, []).append({
-                    "job": f"{setup['from_job']}→{setup['to_job']}",
-                    "start": setup["start"],
-                    "duration": setup["duration"],
-                    "type": "setup"
-                })
-        
-        # Trier les tâches par temps de début pour chaque machine
-        for m_idx in machines_dict:
-            machines_dict[m_idx].sort(key=lambda x: x["start"])
-        
-        result_formatted = {"machines": machines_dict}
-        
-        # Utiliser la fonction Gantt STANDARD pour un rendu visuel identique à SPT/EDD
-        fig = create_gantt_figure(result_formatted, "Diagramme de Gantt - Jobshop Contraintes (CP)",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_jobshop_contraintes(request: JobshopSPTRequest = Depends(cached_body(JobshopSPTRequest))):
+    result = await solve_args_cached(
+        "jobshop/contraintes",
+        jobshop_contraintes.planifier_jobshop_contraintes,
+        request.job_names, 
+        request.machine_names, 
+        request.jobs_data, 
+        request.due_dates,
+        request.setup_times,
+        request.release_times
+    )
+    return result
 
 # ----------- Jobshop Import/Export -----------
 
 @app.post("/jobshop/spt/import-excel")
+@endpoint(status=400)
 async def import_jobshop_spt_excel(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_jobshop_excel(file_content)
-        
-        # Appeler l'algorithme SPT directement avec les données parsées
-        result = jobshop_spt.planifier_jobshop_spt(
-            parsed_data["job_names"], 
-            parsed_data["machine_names"], 
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"]
-        )
-        
-        # Ajouter les données parsées au résultat pour l'affichage frontend
-        result.update({
-            "imported_data": parsed_data
-        })
-        
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("jobshop/excel", file_content), excel_import.parse_jobshop_excel, file_content)
+    
+    # Appeler l'algorithme SPT directement avec les données parsées (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("jobshop/spt/excel", file_content),
+        jobshop_spt.planifier_jobshop_spt,
+        parsed_data["job_names"], 
+        parsed_data["machine_names"], 
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"]
+    )
+    
+    # Ajouter les données parsées au résultat pour l'affichage frontend
+    return {**result, "imported_data": parsed_data}
 
 @app.post("/jobshop/spt/import-excel-gantt")
-async def import_jobshop_spt_excel_gantt(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_jobshop_excel(file_content)
-        
-        # Appeler l'algorithme SPT pour obtenir les résultats
-        result = jobshop_spt.planifier_jobshop_spt(
-            parsed_data["job_names"], 
-            parsed_data["machine_names"], 
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"]
-        )
-        
-        # Créer le diagramme de Gantt
-        machines_dict = {}
-        for t in result["schedule"]:
-            m_idx = parsed_data["machine_names"].index(t["machine"])
-            machines_dict.setdefault(m_idx, []).append({
-                "job": t["job"],
-                "start": t["start"],
-                "duration": t["end"] - t["start"]
-            })
-        
-        result_formatted = {"machines": machines_dict}
-        fig = create_gantt_figure(result_formatted, "Diagramme de Gantt - Jobshop SPT (Import Excel)",
-                                  unite=parsed_data["unite"],
-                                  job_names=parsed_data["job_names"],
-                                  machine_names=parsed_data["machine_names"],
-                                  due_dates=parsed_data["due_dates"])
-        
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def import_jobshop_spt_excel_gantt(file: UploadFile = File(...), hires: bool = False):
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("jobshop/excel", file_content), excel_import.parse_jobshop_excel, file_content)
+    
+    # Appeler l'algorithme SPT pour obtenir les résultats (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("jobshop/spt/excel", file_content),
+        jobshop_spt.planifier_jobshop_spt,
+        parsed_data["job_names"], 
+        parsed_data["machine_names"], 
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"]
+    )
+    
+    # Créer le diagramme de Gantt (tâches et setups éventuels regroupés par machine)
+    machines_dict = schedule_machines(result["schedule"], parsed_data["machine_names"], result.get("setup_schedule"))
+    result_formatted = {"machines": machines_dict}
+    return await gantt_png_response(result_formatted, "Diagramme de Gantt - Jobshop SPT (Import Excel)",
+                                    hires=hires,
+                                    unite=parsed_data["unite"],
+                                    job_names=parsed_data["job_names"],
+                                    machine_names=parsed_data["machine_names"],
+                                    due_dates=parsed_data["due_dates"])
 
 @app.post("/jobshop/edd/import-excel")
+@endpoint(status=400)
 async def import_jobshop_edd_excel(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_jobshop_excel(file_content)
-        
-        # Appeler l'algorithme EDD directement avec les données parsées
-        result = jobshop_edd.planifier_jobshop_edd(
-            parsed_data["job_names"], 
-            parsed_data["machine_names"], 
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"]
-        )
-        
-        # Ajouter les données parsées au résultat pour l'affichage frontend
-        result.update({
-            "imported_data": parsed_data
-        })
-        
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("jobshop/excel", file_content), excel_import.parse_jobshop_excel, file_content)
+    
+    # Appeler l'algorithme EDD directement avec les données parsées (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("jobshop/edd/excel", file_content),
+        jobshop_edd.planifier_jobshop_edd,
+        parsed_data["job_names"], 
+        parsed_data["machine_names"], 
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"]
+    )
+    
+    # Ajouter les données parsées au résultat pour l'affichage frontend
+    return {**result, "imported_data": parsed_data}
 
 @app.post("/jobshop/edd/import-excel-gantt")
-async def import_jobshop_edd_excel_gantt(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_jobshop_excel(file_content)
-        
-        # Appeler l'algorithme EDD pour obtenir les résultats
-        result = jobshop_edd.planifier_jobshop_edd(
-            parsed_data["job_names"], 
-            parsed_data["machine_names"], 
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"]
-        )
-        
-        # Créer le diagramme de Gantt
-        machines_dict = {}
-        for t in result["schedule"]:
-            m_idx = parsed_data["machine_names"].index(t["machine"])
-            machines_dict.setdefault(m_idx, []).append({
-                "job": t["job"],
-                "start": t["start"],
-                "duration": t["end"] - t["start"]
-            })
-        
-        result_formatted = {"machines": machines_dict}
-        fig = create_gantt_figure(result_formatted, "Diagramme de Gantt - Jobshop EDD (Import Excel)",
-                                  unite=parsed_data["unite"],
-                                  job_names=parsed_data["job_names"],
-                                  machine_names=parsed_data["machine_names"],
-                                  due_dates=parsed_data["due_dates"])
-        
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def import_jobshop_edd_excel_gantt(file: UploadFile = File(...), hires: bool = False):
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("jobshop/excel", file_content), excel_import.parse_jobshop_excel, file_content)
+    
+    # Appeler l'algorithme EDD pour obtenir les résultats (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("jobshop/edd/excel", file_content),
+        jobshop_edd.planifier_jobshop_edd,
+        parsed_data["job_names"], 
+        parsed_data["machine_names"], 
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"]
+    )
+    
+    # Créer le diagramme de Gantt (tâches et setups éventuels regroupés par machine)
+    machines_dict = schedule_machines(result["schedule"], parsed_data["machine_names"], result.get("setup_schedule"))
+    result_formatted = {"machines": machines_dict}
+    return await gantt_png_response(result_formatted, "Diagramme de Gantt - Jobshop EDD (Import Excel)",
+                                    hires=hires,
+                                    unite=parsed_data["unite"],
+                                    job_names=parsed_data["job_names"],
+                                    machine_names=parsed_data["machine_names"],
+                                    due_dates=parsed_data["due_dates"])
 
 @app.post("/jobshop/contraintes/import-excel")
+@endpoint(status=400)
 async def import_jobshop_contraintes_excel(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_jobshop_excel(file_content)
-        
-        # Appeler l'algorithme Contraintes directement avec les données parsées
-        result = jobshop_contraintes.planifier_jobshop_contraintes(
-            parsed_data["job_names"], 
-            parsed_data["machine_names"], 
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"],
-            setup_times=None,  # Valeurs par défaut
-            release_times=None
-        )
-        
-        # Ajouter les données parsées au résultat pour l'affichage frontend
-        result.update({
-            "imported_data": parsed_data
-        })
-        
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("jobshop/excel", file_content), excel_import.parse_jobshop_excel, file_content)
+    
+    # Appeler l'algorithme Contraintes directement avec les données parsées (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("jobshop/contraintes/excel", file_content),
+        jobshop_contraintes.planifier_jobshop_contraintes,
+        parsed_data["job_names"], 
+        parsed_data["machine_names"], 
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"],
+        setup_times=None,  # Valeurs par défaut
+        release_times=None
+    )
+    
+    # Ajouter les données parsées au résultat pour l'affichage frontend
+    return {**result, "imported_data": parsed_data}
 
 @app.post("/jobshop/contraintes/import-excel-gantt")
-async def import_jobshop_contraintes_excel_gantt(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_jobshop_excel(file_content)
-        
-        # Appeler l'algorithme Contraintes pour obtenir les résultats
-        result = jobshop_contraintes.planifier_jobshop_contraintes(
-            parsed_data["job_names"], 
-            parsed_data["machine_names"], 
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"],
-            setup_times=None,  # Valeurs par défaut
-            release_times=None
-        )
-        
-        # Créer le diagramme de Gantt avec setups mais rendu visuel standard
-        machines_dict = {}
-        
-        # Ajouter les tâches normales
-        for t in result["schedule"]:
-            m_idx = parsed_data["machine_names"].index(t["machine"])
-            machines_dict.setdefault(m_idx, []).append({
-                "job": t["job"],
-                "start": t["start"],
-                "duration": t["duration"] if "duration" in t else t["end"] - t["start"],
-                "type": "task"
-            })
-        
-        # Ajouter les temps de setup s'ils existent
-        if "setup_schedule" in result and result["setup_schedule"]:
-            for setup in result["setup_schedule"]:
-                m_idx = parsed_data["machine_names"].index(setup["machine"])
-                machines_dict.setdefault(m_idx, []).append({
-                    "job": f"{setup['from_job']}→{setup['to_job']}",
-                    "start": setup["start"],
-                    "duration": setup["duration"],
-                    "type": "setup"
-                })
-        
-        # Trier les tâches par temps de début pour chaque machine
-        for m_idx in machines_dict:
-            machines_dict[m_idx].sort(key=lambda x: x["start"])
-        
-        result_formatted = {"machines": machines_dict}
-        fig = create_gantt_figure(result_formatted, "Diagramme de Gantt - Jobshop Contraintes (Import Excel)",
-                                  unite=parsed_data["unite"],
-                                  job_names=parsed_data["job_names"],
-                                  machine_names=parsed_data["machine_names"],
-                                  due_dates=parsed_data["due_dates"])
-        
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def import_jobshop_contraintes_excel_gantt(file: UploadFile = File(...), hires: bool = False):
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("jobshop/excel", file_content), excel_import.parse_jobshop_excel, file_content)
+    
+    # Appeler l'algorithme Contraintes pour obtenir les résultats (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("jobshop/contraintes/excel", file_content),
+        jobshop_contraintes.planifier_jobshop_contraintes,
+        parsed_data["job_names"], 
+        parsed_data["machine_names"], 
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"],
+        setup_times=None,  # Valeurs par défaut
+        release_times=None
+    )
+    
+    # Créer le diagramme de Gantt (tâches et setups éventuels regroupés par machine)
+    machines_dict = schedule_machines(result["schedule"], parsed_data["machine_names"], result.get("setup_schedule"))
+    result_formatted = {"machines": machines_dict}
+    return await gantt_png_response(result_formatted, "Diagramme de Gantt - Jobshop Contraintes (Import Excel)",
+                                    hires=hires,
+                                    unite=parsed_data["unite"],
+                                    job_names=parsed_data["job_names"],
+                                    machine_names=parsed_data["machine_names"],
+                                    due_dates=parsed_data["due_dates"])
 
 # Modèle pour l'export Jobshop
 class JobshopExportDataRequest(BaseModel):
@@ -717,797 +1324,541 @@ class JobshopExportDataRequest(BaseModel):
     machine_names: List[str]
     unite: str = "heures"
 
+@endpoint(status=400)
+async def export_jobshop_excel(request: JobshopExportDataRequest, filename: str):
+    """
+    Classeur Excel des données d'un jobshop (commun aux exports SPT, EDD et Contraintes),
+    généré dans le pool et réutilisé pour une requête identique
+    """
+    # Convertir les données au format avec séquence pour l'export (les jobs n'ont pas tous le même nombre de tâches)
+    formatted_jobs_data = [
+        [{'sequence': sequence, 'machine': int(machine), 'duration': float(duration)}
+         for sequence, (machine, duration) in enumerate(job_tasks, 1)]
+        for job_tasks in request.jobs_data
+    ]
+    
+    excel_content = await solve_cached(
+        dedup_key("jobshop/export-excel", request),
+        excel_import.export_jobshop_data_to_excel,
+        formatted_jobs_data,
+        request.due_dates,
+        request.job_names,
+        request.machine_names,
+        request.unite
+    )
+    
+    return xlsx_response(excel_content, filename)
+
 @app.post("/jobshop/spt/export-excel")
-def export_jobshop_spt_data_to_excel(request: JobshopExportDataRequest):
-    try:
-        # Convertir les données au format avec séquence pour l'export
-        formatted_jobs_data = []
-        for job_tasks in request.jobs_data:
-            job_formatted = []
-            for sequence, (machine, duration) in enumerate(job_tasks, 1):
-                job_formatted.append({
-                    'sequence': sequence,
-                    'machine': int(machine),
-                    'duration': float(duration)
-                })
-            formatted_jobs_data.append(job_formatted)
-        
-        excel_content = excel_import.export_jobshop_data_to_excel(
-            formatted_jobs_data,
-            request.due_dates,
-            request.job_names,
-            request.machine_names,
-            request.unite
-        )
-        
-        return StreamingResponse(
-            io.BytesIO(excel_content),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=jobshop_spt_export.xlsx"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def export_jobshop_spt_data_to_excel(request: JobshopExportDataRequest):
+    return await export_jobshop_excel(request, "jobshop_spt_export.xlsx")
 
 @app.post("/jobshop/edd/export-excel")
-def export_jobshop_edd_data_to_excel(request: JobshopExportDataRequest):
-    try:
-        # Convertir les données au format avec séquence pour l'export
-        formatted_jobs_data = []
-        for job_tasks in request.jobs_data:
-            job_formatted = []
-            for sequence, (machine, duration) in enumerate(job_tasks, 1):
-                job_formatted.append({
-                    'sequence': sequence,
-                    'machine': int(machine),
-                    'duration': float(duration)
-                })
-            formatted_jobs_data.append(job_formatted)
-        
-        excel_content = excel_import.export_jobshop_data_to_excel(
-            formatted_jobs_data,
-            request.due_dates,
-            request.job_names,
-            request.machine_names,
-            request.unite
-        )
-        
-        return StreamingResponse(
-            io.BytesIO(excel_content),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=jobshop_edd_export.xlsx"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def export_jobshop_edd_data_to_excel(request: JobshopExportDataRequest):
+    return await export_jobshop_excel(request, "jobshop_edd_export.xlsx")
 
 @app.post("/jobshop/contraintes/export-excel")
-def export_jobshop_contraintes_data_to_excel(request: JobshopExportDataRequest):
-    try:
-        # Convertir les données au format avec séquence pour l'export
-        formatted_jobs_data = []
-        for job_tasks in request.jobs_data:
-            job_formatted = []
-            for sequence, (machine, duration) in enumerate(job_tasks, 1):
-                job_formatted.append({
-                    'sequence': sequence,
-                    'machine': int(machine),
-                    'duration': float(duration)
-                })
-            formatted_jobs_data.append(job_formatted)
-        
-        excel_content = excel_import.export_jobshop_data_to_excel(
-            formatted_jobs_data,
-            request.due_dates,
-            request.job_names,
-            request.machine_names,
-            request.unite
-        )
-        
-        return StreamingResponse(
-            io.BytesIO(excel_content),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=jobshop_contraintes_export.xlsx"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def export_jobshop_contraintes_data_to_excel(request: JobshopExportDataRequest):
+    return await export_jobshop_excel(request, "jobshop_contraintes_export.xlsx")
 
 # ----------- Algorithme SPT -----------
 
 @app.post("/spt")
-def run_spt(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        result = spt.schedule(request.jobs_data, request.due_dates)
-        return {
-            "makespan": result["makespan"],
-            "flowtime": result["flowtime"],
-            "retard_cumule": result["retard_cumule"],
-            "completion_times": result["completion_times"],
-            "planification": {request.machine_names[int(m)]: tasks for m, tasks in result["machines"].items()}
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/spt/gantt")
-def run_spt_gantt(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        result = spt.schedule(request.jobs_data, request.due_dates)
-        fig = create_gantt_figure(result, "Diagramme de Gantt - Flowshop SPT",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_spt(request: ExtendedRequest = Depends(cached_body(ExtendedRequest))):
+    validate_jobs_data(request.jobs_data, request.due_dates)
+    result = await solve_args_cached("spt", spt.schedule, request.jobs_data, request.due_dates)
+    return {
+        "makespan": result["makespan"],
+        "flowtime": result["flowtime"],
+        "retard_cumule": result["retard_cumule"],
+        "completion_times": result["completion_times"],
+        "planification": planification_by_name(result["machines"], request.machine_names)
+    }
 
 @app.post("/spt/agenda")
-def run_spt_agenda(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        result = spt.schedule(request.jobs_data, request.due_dates)
-        agenda_json = generer_agenda_json(
-            result=result,
-            start_datetime_str=request.agenda_start_datetime,
-            opening_hours=request.opening_hours,
-            weekend_days=request.weekend_days,
-            jours_feries=request.jours_feries,
-            unite=request.unite,
-            machine_names=request.machine_names,
-            job_names=request.job_names
-        )
-        return JSONResponse(content=agenda_json)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_spt_agenda(request: ExtendedRequest = Depends(cached_body(ExtendedRequest))):
+    validate_jobs_data(request.jobs_data, request.due_dates)
+    result = await solve_args_cached("spt", spt.schedule, request.jobs_data, request.due_dates)
+    agenda_json = generer_agenda_json(
+        result=result,
+        start_datetime_str=request.agenda_start_datetime,
+        opening_hours=request.opening_hours,
+        weekend_days=request.weekend_days,
+        jours_feries=request.jours_feries,
+        unite=request.unite,
+        machine_names=request.machine_names,
+        job_names=request.job_names
+    )
+    # Agenda déjà composé de types JSON natifs : ORJSONResponse directe, sans le parcours de jsonable_encoder
+    return ORJSONResponse(agenda_json)
 
 # ----------- EDD -----------
 
 @app.post("/edd")
-def run_edd(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        result = edd.schedule(request.jobs_data, request.due_dates)
-        return {
-            "makespan": result["makespan"],
-            "flowtime": result["flowtime"],
-            "retard_cumule": result["retard_cumule"],
-            "completion_times": result["completion_times"],
-            "planification": {request.machine_names[int(m)]: tasks for m, tasks in result["machines"].items()}
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/edd/gantt")
-def run_edd_gantt(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        result = edd.schedule(request.jobs_data, request.due_dates)
-        fig = create_gantt_figure(result, "Diagramme de Gantt - Flowshop EDD",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_edd(request: ExtendedRequest = Depends(cached_body(ExtendedRequest))):
+    validate_jobs_data(request.jobs_data, request.due_dates)
+    result = await solve_args_cached("edd", edd.schedule, request.jobs_data, request.due_dates)
+    return {
+        "makespan": result["makespan"],
+        "flowtime": result["flowtime"],
+        "retard_cumule": result["retard_cumule"],
+        "completion_times": result["completion_times"],
+        "planification": planification_by_name(result["machines"], request.machine_names)
+    }
 
 # ----------- Johnson -----------
 
 @app.post("/johnson")
-def run_johnson(request: JohnsonRequest):
-    try:
-        validate_johnson_data(request.jobs_data, request.due_dates, request.job_names)
-        result = johnson.schedule(request.jobs_data, request.due_dates)
-        return {
-            "sequence": result["sequence"],
-            "makespan": result["makespan"],
-            "flowtime": result["flowtime"],
-            "retard_cumule": result["retard_cumule"],
-            "completion_times": result["completion_times"],
-            "planification": {request.machine_names[int(m)]: tasks for m, tasks in result["machines"].items()}
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/johnson/gantt")
-def run_johnson_gantt(request: JohnsonRequest):
-    try:
-        validate_johnson_data(request.jobs_data, request.due_dates, request.job_names)
-        result = johnson.schedule(request.jobs_data, request.due_dates)
-        fig = create_gantt_figure(result, "Diagramme de Gantt - Johnson",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_johnson(request: JohnsonRequest = Depends(cached_body(JohnsonRequest))):
+    validate_johnson_data(request.jobs_data, request.due_dates, request.job_names)
+    result = await solve_args_cached("johnson", johnson.schedule, request.jobs_data, request.due_dates)
+    return {
+        "sequence": result["sequence"],
+        "makespan": result["makespan"],
+        "flowtime": result["flowtime"],
+        "retard_cumule": result["retard_cumule"],
+        "completion_times": result["completion_times"],
+        "planification": planification_by_name(result["machines"], request.machine_names)
+    }
 
 # ----------- Johnson Modifié -----------
 
 @app.post("/johnson_modifie")
-def run_johnson_modifie(request: JohnsonModifieRequest):
-    try:
-        validate_johnson_modifie_data(request.jobs_data, request.due_dates, request.job_names)
-        result = johnson_modifie.schedule(request.jobs_data, request.due_dates)
-        return {
-            "sequence": result["sequence"],
-            "makespan": result["makespan"],
-            "flowtime": result["flowtime"],
-            "retard_cumule": result["retard_cumule"],
-            "completion_times": result["completion_times"],
-            "planification": {request.machine_names[int(m)]: tasks for m, tasks in result["machines"].items()}
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/johnson_modifie/gantt")
-def run_johnson_modifie_gantt(request: JohnsonModifieRequest):
-    try:
-        validate_johnson_modifie_data(request.jobs_data, request.due_dates, request.job_names)
-        result = johnson_modifie.schedule(request.jobs_data, request.due_dates)
-        fig = create_gantt_figure(result, "Diagramme de Gantt - Johnson modifié",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_johnson_modifie(request: JohnsonModifieRequest = Depends(cached_body(JohnsonModifieRequest))):
+    validate_johnson_modifie_data(request.jobs_data, request.due_dates, request.job_names)
+    result = await solve_args_cached("johnson_modifie", johnson_modifie.schedule, request.jobs_data, request.due_dates)
+    return {
+        "sequence": result["sequence"],
+        "makespan": result["makespan"],
+        "flowtime": result["flowtime"],
+        "retard_cumule": result["retard_cumule"],
+        "completion_times": result["completion_times"],
+        "planification": planification_by_name(result["machines"], request.machine_names)
+    }
 
 # ----------- Smith -----------
 
 @app.post("/smith")
-def run_smith(request: SmithRequest):
-    try:
-        result = smith.smith_algorithm(request.jobs)
-        return {
-            "sequence": result["sequence"],
-            "makespan": result["makespan"],
-            "flowtime": result["flowtime"],
-            "retard_cumule": result["retard_cumule"],
-            "completion_times": result["completion_times"],
-            "planification": {"Machine 0": result["machines"]["0"]},
-            "N": result.get("N", 0),
-            "cumulative_delay": result["cumulative_delay"]
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/smith/gantt")
-def run_smith_gantt(request: SmithRequest):
-    try:
-        result = smith.smith_algorithm(request.jobs)
-        
-        # Extraire les due dates des jobs (format: [[durée, due_date], ...])
-        due_dates = [job[1] for job in request.jobs]
-        
-        # Utiliser create_gantt_figure comme tous les autres algorithmes
-        fig = create_gantt_figure(result, "Diagramme de Gantt - Smith",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=["Machine 1"],  # Smith utilise une seule machine
-                                  due_dates=due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_smith(request: SmithRequest = Depends(cached_body(SmithRequest))):
+    result = await solve_args_cached("smith", smith.smith_algorithm, request.jobs)
+    return {
+        "sequence": result["sequence"],
+        "makespan": result["makespan"],
+        "flowtime": result["flowtime"],
+        "retard_cumule": result["retard_cumule"],
+        "completion_times": result["completion_times"],
+        "planification": {"Machine 0": result["machines"]["0"]},
+        "N": result.get("N", 0),
+        "cumulative_delay": result["cumulative_delay"]
+    }
 
 # ----------- Contraintes -----------
 
 @app.post("/contraintes")
-def run_contraintes(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        
-        # Mode flowshop classique uniquement (une machine par étape)
-        result = contraintes.flowshop_contraintes(
-            request.jobs_data, 
-            request.due_dates,
-            request.job_names, 
-            request.machine_names,
-            None  # machines_per_stage = None pour flowshop classique
-        )
-        
-        # Ajuster les noms pour les machines
-        machine_names_to_use = request.machine_names or [f"Machine {i+1}" for i in range(len(request.jobs_data[0]))]
-        return {
-            "makespan": result["makespan"],
-            "flowtime": result["flowtime"],
-            "retard_cumule": result["retard_cumule"],
-            "completion_times": result["completion_times"],
-            "planification": {machine_names_to_use[int(m)]: tasks for m, tasks in result["machines"].items() if str(m).isdigit() and int(m) < len(machine_names_to_use)},
-            "raw_machines": result["machines"],
-            "gantt_url": result.get("gantt_url")
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-@app.post("/contraintes/gantt")
-def run_contraintes_gantt(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        
-        # Mode flowshop classique uniquement (une machine par étape)
-        result = contraintes.flowshop_contraintes(
-            request.jobs_data, 
-            request.due_dates,
-            request.job_names, 
-            request.machine_names,
-            None  # machines_per_stage = None pour flowshop classique
-        )
-        
-        fig = create_gantt_figure(result, "Diagramme de Gantt - Contraintes (CP)",
-                                  unite=request.unite,
-                                  job_names=request.job_names,
-                                  machine_names=request.machine_names,
-                                  due_dates=request.due_dates)
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_contraintes(request: ExtendedRequest = Depends(cached_body(ExtendedRequest))):
+    validate_jobs_data(request.jobs_data, request.due_dates)
+    
+    # Mode flowshop classique uniquement (une machine par étape)
+    result = await solve_args_cached(
+        "contraintes",
+        contraintes.flowshop_contraintes,
+        request.jobs_data, 
+        request.due_dates,
+        request.job_names, 
+        request.machine_names,
+        None  # machines_per_stage = None pour flowshop classique
+    )
+    
+    # Ajuster les noms pour les machines
+    machine_names_to_use = request.machine_names or [f"Machine {i+1}" for i in range(len(request.jobs_data[0]))]
+    return {
+        "makespan": result["makespan"],
+        "flowtime": result["flowtime"],
+        "retard_cumule": result["retard_cumule"],
+        "completion_times": result["completion_times"],
+        "planification": planification_named_machines(result["machines"], machine_names_to_use),
+        "raw_machines": result["machines"],
+        "gantt_url": result.get("gantt_url")
+    }
 
 @app.post("/contraintes/agenda")
-def run_contraintes_agenda(request: ExtendedRequest):
-    try:
-        validate_jobs_data(request.jobs_data, request.due_dates)
-        result = contraintes.schedule(request.jobs_data, request.due_dates)
-        
-        # Paramètres par défaut si pas fournis
-        start_datetime = getattr(request, 'agenda_start_datetime', None) or "2025-06-01T08:00:00"
-        opening_hours = getattr(request, 'opening_hours', None) or {"start": "08:00", "end": "17:00"}
-        weekend_days = getattr(request, 'weekend_days', None) or ["samedi", "dimanche"]
-        jours_feries = getattr(request, 'jours_feries', None) or []
-        due_date_times = getattr(request, 'due_date_times', None) or []
-        pauses = getattr(request, 'pauses', None) or [{"start": "12:00", "end": "13:00", "name": "Pause déjeuner"}]
-        
-        agenda_data = generer_agenda_json(
-            result, 
-            start_datetime, 
-            opening_hours, 
-            weekend_days, 
-            jours_feries, 
-            request.unite,
-            request.machine_names,
-            request.job_names,
-            pauses
-        )
-        
-        # Ajouter les informations de due dates
-        agenda_data["due_dates"] = {
-            request.job_names[i]: request.due_dates[i] for i in range(len(request.job_names))
-        }
-        agenda_data["due_date_times"] = due_date_times
-        
-        return agenda_data
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_contraintes_agenda(request: ExtendedRequest = Depends(cached_body(ExtendedRequest))):
+    validate_jobs_data(request.jobs_data, request.due_dates)
+    result = await solve_cached(dedup_key("contraintes/agenda", request), contraintes.schedule, request.jobs_data, request.due_dates)
+    
+    # Paramètres par défaut si pas fournis
+    start_datetime = getattr(request, 'agenda_start_datetime', None) or "2025-06-01T08:00:00"
+    opening_hours = getattr(request, 'opening_hours', None) or {"start": "08:00", "end": "17:00"}
+    weekend_days = getattr(request, 'weekend_days', None) or ["samedi", "dimanche"]
+    jours_feries = getattr(request, 'jours_feries', None) or []
+    due_date_times = getattr(request, 'due_date_times', None) or []
+    pauses = getattr(request, 'pauses', None) or [{"start": "12:00", "end": "13:00", "name": "Pause déjeuner"}]
+    
+    agenda_data = generer_agenda_json(
+        result, 
+        start_datetime, 
+        opening_hours, 
+        weekend_days, 
+        jours_feries, 
+        request.unite,
+        request.machine_names,
+        request.job_names,
+        pauses
+    )
+    
+    # Ajouter les informations de due dates
+    agenda_data["due_dates"] = {
+        request.job_names[i]: request.due_dates[i] for i in range(len(request.job_names))
+    }
+    agenda_data["due_date_times"] = due_date_times
+    
+    return ORJSONResponse(agenda_data)
 
 # ----------- Flowshop Machines Multiples -----------
 
+def render_flowshop_mm_gantt(request, result, fmt="png", dpi=300):
+    """Gantt du flowshop à machines multiples pour une solution déjà calculée (figure du thread courant)"""
+    fig = flowshop_machines.create_gantt_chart(
+        request.jobs_data, 
+        request.due_dates,
+        machine_names=request.machine_names,
+        stage_names=request.stage_names,
+        machines_per_stage=request.machines_per_stage,
+        machine_priorities=request.machine_priorities,
+        result=result
+    )
+    return figure_bytes(fig, fmt, dpi, tight=False)
+
+def solve_flowshop_mm(request):
+    """Résolution (partagée via RESULT_CACHE) d'une requête flowshop à machines multiples"""
+    return solve_cached(
+        dedup_key("flowshop/machines_multiples", request),
+        flowshop_machines.solve_flexible_flowshop,
+        request.jobs_data, 
+        request.due_dates,
+        machine_names=request.machine_names,
+        stage_names=request.stage_names,
+        machines_per_stage=request.machines_per_stage,
+        machine_priorities=request.machine_priorities
+    )
+
 @app.post("/flowshop/machines_multiples")
-def run_flowshop_machines_multiples(request: FlexibleFlowshopRequest):
-    try:
-        result = flowshop_machines.solve_flexible_flowshop(
-            request.jobs_data, 
-            request.due_dates,
-            machine_names=request.machine_names,
-            stage_names=request.stage_names,
-            machines_per_stage=request.machines_per_stage,
-            machine_priorities=request.machine_priorities
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_flowshop_machines_multiples(request: FlexibleFlowshopRequest = Depends(cached_body(FlexibleFlowshopRequest))):
+    return await solve_flowshop_mm(request)
 
 @app.post("/flowshop/machines_multiples/gantt")
-def run_flowshop_machines_multiples_gantt(request: FlexibleFlowshopRequest):
-    try:
-        # Utiliser la fonction de création de Gantt intégrée avec le visuel standardisé
-        fig = flowshop_machines.create_gantt_chart(
-            request.jobs_data, 
-            request.due_dates,
-            machine_names=request.machine_names,
-            stage_names=request.stage_names,
-            machines_per_stage=request.machines_per_stage,
-            machine_priorities=request.machine_priorities
-        )
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_flowshop_machines_multiples_gantt(http_request: Request, fmt: Optional[Literal["png", "webp", "svg"]] = None, hires: bool = False, request: FlexibleFlowshopRequest = Depends(cached_body(FlexibleFlowshopRequest))):
+    fmt = negotiated_format(http_request, fmt)
+    dpi = GANTT_HIRES_DPI if hires else GANTT_DPI
+    etag = chart_etag(f"flowshop/machines_multiples/gantt?fmt={fmt}&dpi={dpi}", request)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        cached.headers["Vary"] = "Accept"
+        return cached
+    # Solution partagée avec /flowshop/machines_multiples, tracée avec le visuel standardisé
+    result = await solve_flowshop_mm(request)
+    fmt = gantt_format(fmt, sum(len(job) for job in request.jobs_data))
+    image_data = await render_chart(render_flowshop_mm_gantt, request, result, fmt, dpi)
+    response = chart_response(image_data, etag, fmt)
+    response.headers["Vary"] = "Accept"
+    return response
 
 @app.post("/flowshop/machines_multiples/agenda")
-def run_flowshop_machines_multiples_agenda(request: FlexibleFlowshopRequest):
-    try:
-        result = flowshop_machines.solve_flexible_flowshop(
-            request.jobs_data, 
-            request.due_dates,
-            machine_names=request.machine_names,
-            stage_names=request.stage_names,
-            machines_per_stage=request.machines_per_stage,
-            machine_priorities=request.machine_priorities
-        )
-        
-        # Paramètres par défaut si pas fournis
-        start_datetime = getattr(request, 'agenda_start_datetime', None) or "2025-06-01T08:00:00"
-        opening_hours = getattr(request, 'opening_hours', None) or {"start": "08:00", "end": "17:00"}
-        weekend_days = getattr(request, 'weekend_days', None) or ["samedi", "dimanche"]
-        jours_feries = getattr(request, 'jours_feries', None) or []
-        due_date_times = getattr(request, 'due_date_times', None) or []
-        pauses = getattr(request, 'pauses', None) or [{"start": "12:00", "end": "13:00", "name": "Pause déjeuner"}]
-        
-        agenda_data = generer_agenda_json(
-            result, 
-            start_datetime, 
-            opening_hours, 
-            weekend_days, 
-            jours_feries, 
-            request.unite,
-            request.machine_names,
-            request.job_names,
-            pauses
-        )
-        
-        # Ajouter les informations de due dates
-        agenda_data["due_dates"] = {
-            request.job_names[i]: request.due_dates[i] for i in range(len(request.job_names))
-        }
-        agenda_data["due_date_times"] = due_date_times
-        
-        return agenda_data
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_flowshop_machines_multiples_agenda(request: FlexibleFlowshopRequest = Depends(cached_body(FlexibleFlowshopRequest))):
+    result = await solve_flowshop_mm(request)
+    
+    # Paramètres par défaut si pas fournis
+    start_datetime = getattr(request, 'agenda_start_datetime', None) or "2025-06-01T08:00:00"
+    opening_hours = getattr(request, 'opening_hours', None) or {"start": "08:00", "end": "17:00"}
+    weekend_days = getattr(request, 'weekend_days', None) or ["samedi", "dimanche"]
+    jours_feries = getattr(request, 'jours_feries', None) or []
+    due_date_times = getattr(request, 'due_date_times', None) or []
+    pauses = getattr(request, 'pauses', None) or [{"start": "12:00", "end": "13:00", "name": "Pause déjeuner"}]
+    
+    agenda_data = generer_agenda_json(
+        result, 
+        start_datetime, 
+        opening_hours, 
+        weekend_days, 
+        jours_feries, 
+        request.unite,
+        request.machine_names,
+        request.job_names,
+        pauses
+    )
+    
+    # Ajouter les informations de due dates
+    agenda_data["due_dates"] = {
+        request.job_names[i]: request.due_dates[i] for i in range(len(request.job_names))
+    }
+    agenda_data["due_date_times"] = due_date_times
+    
+    return ORJSONResponse(agenda_data)
 
 # ----------- FlowshopMM Import/Export -----------
 
 @app.post("/flowshop/machines_multiples/import-excel")
+@endpoint(status=400)
 async def import_flowshop_mm_excel(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_mm_excel(file_content)
-        
-        # Appeler l'algorithme FlowshopMM directement avec les données parsées
-        result = flowshop_machines.solve_flexible_flowshop(
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"],
-            machine_names=parsed_data["stage_names"],
-            stage_names=parsed_data["stage_names"],
-            machines_per_stage=parsed_data["machines_per_stage"],
-            machine_priorities=parsed_data["machine_priorities"]
-        )
-        
-        # Ajouter les données parsées au résultat pour l'affichage frontend
-        result.update({
-            "imported_data": parsed_data
-        })
-        
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/machines_multiples/excel", file_content), excel_import.parse_flowshop_mm_excel, file_content)
+    
+    # Appeler l'algorithme FlowshopMM directement avec les données parsées (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("flowshop/machines_multiples/solve/excel", file_content),
+        flowshop_machines.solve_flexible_flowshop,
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"],
+        machine_names=parsed_data["stage_names"],
+        stage_names=parsed_data["stage_names"],
+        machines_per_stage=parsed_data["machines_per_stage"],
+        machine_priorities=parsed_data["machine_priorities"]
+    )
+    
+    # Ajouter les données parsées au résultat pour l'affichage frontend
+    return {**result, "imported_data": parsed_data}
 
 @app.post("/flowshop/machines_multiples/import-excel-gantt")
-async def import_flowshop_mm_excel_gantt(file: UploadFile = File(...)):
-    try:
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_mm_excel(file_content)
-        
-        # Appeler l'algorithme FlowshopMM pour obtenir les résultats
-        result = flowshop_machines.solve_flexible_flowshop(
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"],
-            machine_names=parsed_data["stage_names"],
-            stage_names=parsed_data["stage_names"],
-            machines_per_stage=parsed_data["machines_per_stage"],
-            machine_priorities=parsed_data["machine_priorities"]
-        )
-        
-        # Créer le diagramme de Gantt
-        fig = create_gantt_figure(result, "Diagramme de Gantt - FlowshopMM (Import Excel)",
-                                  unite=parsed_data["unite"],
-                                  job_names=parsed_data["job_names"],
-                                  machine_names=parsed_data["stage_names"],
-                                  due_dates=parsed_data["due_dates"])
-        
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
+@endpoint(status=400)
+async def import_flowshop_mm_excel_gantt(file: UploadFile = File(...), hires: bool = False):
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/machines_multiples/excel", file_content), excel_import.parse_flowshop_mm_excel, file_content)
+    
+    # Appeler l'algorithme FlowshopMM pour obtenir les résultats (résultat partagé entre l'import et son Gantt)
+    result = await solve_cached(
+        file_key("flowshop/machines_multiples/solve/excel", file_content),
+        flowshop_machines.solve_flexible_flowshop,
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"],
+        machine_names=parsed_data["stage_names"],
+        stage_names=parsed_data["stage_names"],
+        machines_per_stage=parsed_data["machines_per_stage"],
+        machine_priorities=parsed_data["machine_priorities"]
+    )
+    
+    # Créer le diagramme de Gantt
+    return await gantt_png_response(result, "Diagramme de Gantt - FlowshopMM (Import Excel)",
+                                    hires=hires,
+                                    unite=parsed_data["unite"],
+                                    job_names=parsed_data["job_names"],
+                                    machine_names=parsed_data["stage_names"],
+                                    due_dates=parsed_data["due_dates"])
 
 
+# ----------- Ligne d'assemblage - Précédence -----------
 
+def normalize_predecessors(predecessors):
+    """None, [] ou "" -> None ; liste à un seul élément -> cet élément"""
+    # Cas le plus fréquent (liste) traité en premier, sans comparaisons à [] ni à ""
+    if isinstance(predecessors, list):
+        if len(predecessors) == 1:
+            return predecessors[0]
+        return predecessors or None
+    if predecessors == "":
+        return None
+    return predecessors
+
+def normalize_tasks(tasks_data):
+    """Convertit les tâches reçues (dicts) en tuples (id, prédécesseurs, durée)"""
+    return [(task.get("id"), normalize_predecessors(task.get("predecessors")), task.get("duration"))
+            for task in tasks_data]
+
+def parse_tasks(tasks_data):
+    """Tuples (id, prédécesseurs, durée) et nom de chaque tâche indexé par id, en un seul parcours"""
+    task_tuples = []
+    task_names = {}
+    for task in tasks_data:
+        task_id = task.get("id")
+        task_tuples.append((task_id, normalize_predecessors(task.get("predecessors")), task.get("duration")))
+        task_names[task_id] = task.get("name", f"Tâche {task_id}")
+    return task_tuples, task_names
+
+class PrecedenceRequest(BaseModel):
+    tasks_data: List[dict] = []  # Format: [{"id": 1, "name": "Tâche 1", "duration": 20, "predecessors": None}]
+    unite: str = "minutes"
 
-# ----------- Ligne d'assemblage - Précédence -----------
+class LigneAssemblageRequest(PrecedenceRequest):
+    cycle_time: Union[int, float] = 70  # Entier conservé tel quel dans le résultat
+    seed: Optional[int] = None  # COMSOAL uniquement : None = nouveau tirage à chaque appel
 
-class PrecedenceRequest:
-    def __init__(self, tasks_data: List[dict], unite: str = "minutes"):
-        self.tasks_data = tasks_data
-        self.unite = unite
+    @functools.cached_property
+    def parsed_tasks(self):
+        """
+        (task_tuples, task_names) calculés une seule fois : cached_body partage l'instance entre les requêtes
+        au corps identique (ex. /lpt puis /lpt/chart)
+        """
+        return parse_tasks(self.tasks_data)
 
 @app.post("/ligne_assemblage/precedence")
-def run_precedence_analysis(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        unite = request.get("unite", "minutes")
-        
-        # Convertir les données de tâches en tuples
-        task_tuples = []
-        for task in tasks_data:
-            task_id = task.get("id")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            # Convertir predecessors None en None, sinon garder la valeur
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_precedence.create_precedence_diagram(task_tuples, unite)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_precedence_analysis(request: PrecedenceRequest = Depends(cached_body(PrecedenceRequest)), chart: bool = True):
+    """?chart=false : métriques seules, sans tracer le diagramme"""
+    tasks_data = request.tasks_data
+    unite = request.unite
+    
+    # Convertir les données de tâches en tuples
+    task_tuples = normalize_tasks(tasks_data)
+    
+    solve = solve_cached(dedup_key("ligne_assemblage/precedence", request), ligne_assemblage_precedence.create_precedence_diagram, task_tuples, unite, with_chart=False)
+    if not chart:
+        return await solve
+    # Le diagramme ne dépend que des tâches : métriques et tracé sont calculés en parallèle dans le pool
+    outcomes = await asyncio.gather(
+        solve,
+        render_chart(ligne_assemblage_precedence.render_precedence_png, task_tuples, unite),
+        return_exceptions=True
+    )
+    # Erreur de la résolution en priorité, comme lorsque les deux étaient enchaînés
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    result, image_data = outcomes
+    return {**result, "graphique": base64.b64encode(image_data).decode()}
 
 @app.post("/ligne_assemblage/precedence/diagram")
-def run_precedence_diagram(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        unite = request.get("unite", "minutes")
-        
-        # Convertir les données de tâches en tuples
-        task_tuples = []
-        for task in tasks_data:
-            task_id = task.get("id")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_precedence.create_precedence_diagram(task_tuples, unite)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(result["graphique"])
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_precedence_diagram(http_request: Request, request: PrecedenceRequest = Depends(cached_body(PrecedenceRequest))):
+    etag = chart_etag("ligne_assemblage/precedence/diagram", request)
+    cached = cached_chart_response(http_request, etag)
+    if cached is not None:
+        return cached
+    tasks_data = request.tasks_data
+    unite = request.unite
+    
+    # Convertir les données de tâches en tuples
+    task_tuples = normalize_tasks(tasks_data)
+    
+    # Seul le tracé est nécessaire : les métriques ne sont pas calculées
+    image_data = await render_chart(ligne_assemblage_precedence.render_precedence_png, task_tuples, unite)
+    
+    # Retourner directement les octets PNG
+    return chart_response(image_data, etag)
 
 @app.post("/ligne_assemblage/comsoal")
-def run_comsoal_analysis(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        cycle_time = request.get("cycle_time", 70)
-        unite = request.get("unite", "minutes")
-        seed = request.get("seed", None)
-        
-        # Convertir les données de tâches en tuples et extraire les noms
-        task_tuples = []
-        task_names = {}
-        for task in tasks_data:
-            task_id = task.get("id")
-            task_name = task.get("name", f"Tâche {task_id}")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            task_names[task_id] = task_name
-            
-            # Convertir predecessors None en None, sinon garder la valeur
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_comsoal.comsoal_algorithm(task_tuples, cycle_time, unite, seed, task_names)
+@endpoint(status=400)
+async def run_comsoal_analysis(request: LigneAssemblageRequest = Depends(cached_body(LigneAssemblageRequest)), chart: bool = True):
+    """?chart=false : résultat seul, sans tracer le graphique"""
+    cycle_time = request.cycle_time
+    unite = request.unite
+    seed = request.seed
+    
+    # Tâches converties en tuples et noms extraits (une fois par corps de requête)
+    task_tuples, task_names = request.parsed_tasks
+    
+    if seed is None:
+        # Tirage aléatoire : chaque appel doit produire une nouvelle solution
+        result = await run_in_pool(ligne_assemblage_comsoal.comsoal_algorithm, task_tuples, cycle_time, unite, seed, task_names, with_chart=False)
+    else:
+        result = await solve_cached(dedup_key("ligne_assemblage/comsoal", request), ligne_assemblage_comsoal.comsoal_algorithm, task_tuples, cycle_time, unite, seed, task_names, with_chart=False)
+    if not chart:
         return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await with_rendered_chart(result, ligne_assemblage_comsoal.render_station_chart, result, task_tuples, task_names)
 
 @app.post("/ligne_assemblage/comsoal/chart")
-def run_comsoal_chart(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        cycle_time = request.get("cycle_time", 70)
-        unite = request.get("unite", "minutes")
-        seed = request.get("seed", None)
-        
-        # Convertir les données de tâches en tuples et extraire les noms
-        task_tuples = []
-        task_names = {}
-        for task in tasks_data:
-            task_id = task.get("id")
-            task_name = task.get("name", f"Tâche {task_id}")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            task_names[task_id] = task_name
-            
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_comsoal.comsoal_algorithm(task_tuples, cycle_time, unite, seed, task_names)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(result["graphique"])
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_comsoal_chart(http_request: Request, request: LigneAssemblageRequest = Depends(cached_body(LigneAssemblageRequest))):
+    cycle_time = request.cycle_time
+    unite = request.unite
+    seed = request.seed
+    
+    # Tâches converties en tuples et noms extraits (une fois par corps de requête)
+    task_tuples, task_names = request.parsed_tasks
+    
+    etag = chart_etag("ligne_assemblage/comsoal/chart", request) if seed is not None else None
+    cached = cached_chart_response(http_request, etag) if etag else None
+    if cached is not None:
+        return cached
+    
+    if seed is None:
+        # Tirage aléatoire : chaque appel doit produire une nouvelle solution
+        result = await run_in_pool(ligne_assemblage_comsoal.comsoal_algorithm, task_tuples, cycle_time, unite, seed, task_names, with_chart=False)
+    else:
+        result = await solve_cached(dedup_key("ligne_assemblage/comsoal", request), ligne_assemblage_comsoal.comsoal_algorithm, task_tuples, cycle_time, unite, seed, task_names, with_chart=False)
+    image_data = await render_chart(ligne_assemblage_comsoal.render_station_chart, result, task_tuples, task_names)
+    
+    # Retourner directement les octets PNG
+    if etag is None:
+        return Response(content=image_data, media_type="image/png")
+    return chart_response(image_data, etag)
 
 @app.post("/ligne_assemblage/lpt")
-def run_lpt_analysis(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        cycle_time = request.get("cycle_time", 70)
-        unite = request.get("unite", "minutes")
-        
-        # Convertir les données de tâches en tuples et extraire les noms
-        task_tuples = []
-        task_names = {}
-        for task in tasks_data:
-            task_id = task.get("id")
-            task_name = task.get("name", f"Tâche {task_id}")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            task_names[task_id] = task_name
-            
-            # Convertir predecessors None en None, sinon garder la valeur
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_lpt.lpt_algorithm(task_tuples, cycle_time, unite, task_names)
+@endpoint(status=400)
+async def run_lpt_analysis(request: LigneAssemblageRequest = Depends(cached_body(LigneAssemblageRequest)), chart: bool = True):
+    """?chart=false : résultat seul, sans tracer le graphique"""
+    cycle_time = request.cycle_time
+    unite = request.unite
+    
+    # Tâches converties en tuples et noms extraits (une fois par corps de requête)
+    task_tuples, task_names = request.parsed_tasks
+    
+    result = await solve_cached(dedup_key("ligne_assemblage/lpt", request), ligne_assemblage_lpt.lpt_algorithm, task_tuples, cycle_time, unite, task_names, with_chart=False)
+    if not chart:
         return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await with_rendered_chart(result, ligne_assemblage_lpt.render_station_chart, result, task_tuples, task_names)
 
 @app.post("/ligne_assemblage/lpt/chart")
-def run_lpt_chart(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        cycle_time = request.get("cycle_time", 70)
-        unite = request.get("unite", "minutes")
-        
-        # Convertir les données de tâches en tuples et extraire les noms
-        task_tuples = []
-        task_names = {}
-        for task in tasks_data:
-            task_id = task.get("id")
-            task_name = task.get("name", f"Tâche {task_id}")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            task_names[task_id] = task_name
-            
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_lpt.lpt_algorithm(task_tuples, cycle_time, unite, task_names)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(result["graphique"])
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_lpt_chart(http_request: Request, request: LigneAssemblageRequest = Depends(cached_body(LigneAssemblageRequest))):
+    etag = chart_etag("ligne_assemblage/lpt/chart", request)
+    cached = cached_chart_response(http_request, etag)
+    if cached is not None:
+        return cached
+    cycle_time = request.cycle_time
+    unite = request.unite
+    
+    # Tâches converties en tuples et noms extraits (une fois par corps de requête)
+    task_tuples, task_names = request.parsed_tasks
+    
+    result = await solve_cached(dedup_key("ligne_assemblage/lpt", request), ligne_assemblage_lpt.lpt_algorithm, task_tuples, cycle_time, unite, task_names, with_chart=False)
+    image_data = await render_chart(ligne_assemblage_lpt.render_station_chart, result, task_tuples, task_names)
+    
+    # Retourner directement les octets PNG
+    return chart_response(image_data, etag)
 
 @app.post("/ligne_assemblage/pl")
-def run_pl_analysis(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        cycle_time = request.get("cycle_time", 70)
-        unite = request.get("unite", "minutes")
-        
-        # Convertir les données de tâches en tuples et extraire les noms
-        task_tuples = []
-        task_names = {}
-        for task in tasks_data:
-            task_id = task.get("id")
-            task_name = task.get("name", f"Tâche {task_id}")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            task_names[task_id] = task_name
-            
-            # Convertir predecessors None en None, sinon garder la valeur
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_pl.pl_algorithm(task_tuples, cycle_time, unite, task_names)
+@endpoint(status=400)
+async def run_pl_analysis(request: LigneAssemblageRequest = Depends(cached_body(LigneAssemblageRequest)), chart: bool = True):
+    """?chart=false : résultat seul, sans tracer le graphique"""
+    cycle_time = request.cycle_time
+    unite = request.unite
+    
+    # Tâches converties en tuples et noms extraits (une fois par corps de requête)
+    task_tuples, task_names = request.parsed_tasks
+    
+    result = await solve_cached(dedup_key("ligne_assemblage/pl", request), ligne_assemblage_pl.pl_algorithm, task_tuples, cycle_time, unite, task_names, with_chart=False)
+    if not chart:
         return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await with_rendered_chart(result, ligne_assemblage_pl.render_pl_chart, result, task_tuples, task_names)
 
 @app.post("/ligne_assemblage/pl/chart")
-def run_pl_chart(request: dict):
-    try:
-        tasks_data = request.get("tasks_data", [])
-        cycle_time = request.get("cycle_time", 70)
-        unite = request.get("unite", "minutes")
-        
-        # Convertir les données de tâches en tuples et extraire les noms
-        task_tuples = []
-        task_names = {}
-        for task in tasks_data:
-            task_id = task.get("id")
-            task_name = task.get("name", f"Tâche {task_id}")
-            predecessors = task.get("predecessors")
-            duration = task.get("duration")
-            
-            task_names[task_id] = task_name
-            
-            if predecessors is None or predecessors == [] or predecessors == "":
-                predecessors = None
-            elif isinstance(predecessors, list) and len(predecessors) == 1:
-                predecessors = predecessors[0]
-            
-            task_tuples.append((task_id, predecessors, duration))
-        
-        result = ligne_assemblage_pl.pl_algorithm(task_tuples, cycle_time, unite, task_names)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(result["graphique"])
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_pl_chart(http_request: Request, request: LigneAssemblageRequest = Depends(cached_body(LigneAssemblageRequest))):
+    etag = chart_etag("ligne_assemblage/pl/chart", request)
+    cached = cached_chart_response(http_request, etag)
+    if cached is not None:
+        return cached
+    cycle_time = request.cycle_time
+    unite = request.unite
+    
+    # Tâches converties en tuples et noms extraits (une fois par corps de requête)
+    task_tuples, task_names = request.parsed_tasks
+    
+    result = await solve_cached(dedup_key("ligne_assemblage/pl", request), ligne_assemblage_pl.pl_algorithm, task_tuples, cycle_time, unite, task_names, with_chart=False)
+    image_data = await render_chart(ligne_assemblage_pl.render_pl_chart, result, task_tuples, task_names)
+    
+    # Retourner directement les octets PNG
+    return chart_response(image_data, etag)
 
 # ===== IMPORT/EXPORT EXCEL POUR LIGNE D'ASSEMBLAGE =====
 
@@ -1518,921 +1869,829 @@ class LigneAssemblageExportDataRequest(BaseModel):
     format_type: str = "ligne_assemblage"
 
 @app.post("/ligne_assemblage/pl/export-excel")
+@endpoint(detail_prefix="Erreur lors de l'export: ")
 def export_ligne_assemblage_pl_data_to_excel(request: LigneAssemblageExportDataRequest):
-    try:
-        # Utiliser la fonction d'export spécialisée pour ligne d'assemblage
-        return excel_import.export_ligne_assemblage_to_excel(
-            request.tasks_data,
-            request.cycle_time,
-            request.unite,
-            "PL"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+    # Utiliser la fonction d'export spécialisée pour ligne d'assemblage
+    return excel_import.export_ligne_assemblage_to_excel(
+        request.tasks_data,
+        request.cycle_time,
+        request.unite,
+        "PL"
+    )
 
 @app.post("/ligne_assemblage/lpt/export-excel")
+@endpoint(detail_prefix="Erreur lors de l'export: ")
 def export_ligne_assemblage_lpt_data_to_excel(request: LigneAssemblageExportDataRequest):
-    try:
-        return excel_import.export_ligne_assemblage_to_excel(
-            request.tasks_data,
-            request.cycle_time,
-            request.unite,
-            "LPT"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+    return excel_import.export_ligne_assemblage_to_excel(
+        request.tasks_data,
+        request.cycle_time,
+        request.unite,
+        "LPT"
+    )
 
 @app.post("/ligne_assemblage/comsoal/export-excel")
+@endpoint(detail_prefix="Erreur lors de l'export: ")
 def export_ligne_assemblage_comsoal_data_to_excel(request: LigneAssemblageExportDataRequest):
-    try:
-        return excel_import.export_ligne_assemblage_to_excel(
-            request.tasks_data,
-            request.cycle_time,
-            request.unite,
-            "COMSOAL"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+    return excel_import.export_ligne_assemblage_to_excel(
+        request.tasks_data,
+        request.cycle_time,
+        request.unite,
+        "COMSOAL"
+    )
 
 @app.post("/ligne_assemblage/pl/import-excel")
+@endpoint(status=400, detail_prefix="Erreur lors de l'import: ")
 async def import_ligne_assemblage_pl_excel(file: UploadFile = File(...), format_type: str = "ligne_assemblage"):
-    try:
-        # Lire le fichier Excel et parser selon le format ligne d'assemblage
-        result = await excel_import.parse_ligne_assemblage_excel(file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Erreur lors de l'import: {str(e)}")
+    # Lire le fichier Excel et parser selon le format ligne d'assemblage
+    result = await excel_import.parse_ligne_assemblage_excel(file)
+    return result
 
 @app.post("/ligne_assemblage/lpt/import-excel")
+@endpoint(status=400, detail_prefix="Erreur lors de l'import: ")
 async def import_ligne_assemblage_lpt_excel(file: UploadFile = File(...), format_type: str = "ligne_assemblage"):
-    try:
-        result = await excel_import.parse_ligne_assemblage_excel(file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Erreur lors de l'import: {str(e)}")
+    result = await excel_import.parse_ligne_assemblage_excel(file)
+    return result
 
 @app.post("/ligne_assemblage/comsoal/import-excel")
+@endpoint(status=400, detail_prefix="Erreur lors de l'import: ")
 async def import_ligne_assemblage_comsoal_excel(file: UploadFile = File(...), format_type: str = "ligne_assemblage"):
-    try:
-        result = await excel_import.parse_ligne_assemblage_excel(file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Erreur lors de l'import: {str(e)}")
+    result = await excel_import.parse_ligne_assemblage_excel(file)
+    return result
+
+class GoulotRequest(BaseModel):
+    models_demand: List[int] = [4, 6]  # Demande par modèle et par période
+    task_times: List[List[Union[int, float]]] = [[3, 3], [2, 3]]  # Temps des tâches au poste goulot, par modèle
+    s1: Union[int, float] = 0.5
+    s2: Union[int, float] = 0.5
+    unite: str = "minutes"
 
 @app.post("/ligne_assemblage_mixte/goulot")
-def run_goulot_analysis(request: dict):
-    try:
-        models_demand = request.get("models_demand", [4, 6])
-        task_times = request.get("task_times", [[3, 3], [2, 3]])
-        s1 = request.get("s1", 0.5)
-        s2 = request.get("s2", 0.5)
-        unite = request.get("unite", "minutes")
-        
-        result = ligne_assemblage_mixte_goulot.variation_goulot_algorithm(models_demand, task_times, s1, s2, unite)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_goulot_analysis(request: GoulotRequest = Depends(cached_body(GoulotRequest))):
+    models_demand = request.models_demand
+    task_times = request.task_times
+    s1 = request.s1
+    s2 = request.s2
+    unite = request.unite
+    
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/goulot", request), ligne_assemblage_mixte_goulot.variation_goulot_algorithm, models_demand, task_times, s1, s2, unite, return_bytes=True)
+    return with_base64_chart(result)
 
 @app.post("/ligne_assemblage_mixte/goulot/chart")
-def run_goulot_chart(request: dict):
-    try:
-        models_demand = request.get("models_demand", [4, 6])
-        task_times = request.get("task_times", [[3, 3], [2, 3]])
-        s1 = request.get("s1", 0.5)
-        s2 = request.get("s2", 0.5)
-        unite = request.get("unite", "minutes")
-        
-        result = ligne_assemblage_mixte_goulot.variation_goulot_algorithm(models_demand, task_times, s1, s2, unite)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(result["graphique"])
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_goulot_chart(http_request: Request, request: GoulotRequest = Depends(cached_body(GoulotRequest))):
+    etag = chart_etag("ligne_assemblage_mixte/goulot/chart", request)
+    cached = cached_chart_response(http_request, etag)
+    if cached is not None:
+        return cached
+    models_demand = request.models_demand
+    task_times = request.task_times
+    s1 = request.s1
+    s2 = request.s2
+    unite = request.unite
+    
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/goulot", request), ligne_assemblage_mixte_goulot.variation_goulot_algorithm, models_demand, task_times, s1, s2, unite, return_bytes=True)
+    
+    # Retourner directement les octets PNG
+    return chart_response(result["graphique"], etag)
 
 @app.post("/ligne_assemblage_mixte/equilibrage")
-def run_equilibrage_analysis(request: dict):
-    try:
-        result = ligne_assemblage_mixte_equilibrage.solve_mixed_assembly_line(request)
-        return result
-    except Exception as e:
-        print(f"Error in equilibrage: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Erreur algorithme équilibrage: {str(e)}")
+@endpoint(detail_prefix="Erreur algorithme équilibrage: ")
+async def run_equilibrage_analysis(request: dict):
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/equilibrage", request), ligne_assemblage_mixte_equilibrage.solve_mixed_assembly_line, request)
+    return result
 
 @app.post("/ligne_assemblage_mixte/equilibrage/chart")
-def run_equilibrage_chart(request: dict):
-    try:
-        result = ligne_assemblage_mixte_equilibrage.solve_mixed_assembly_line(request)
-        
-        # Générer le graphique
-        image_base64 = ligne_assemblage_mixte_equilibrage.generate_equilibrage_chart(result)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(image_base64)
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_equilibrage_chart(request: dict, http_request: Request, fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"ligne_assemblage_mixte/equilibrage/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/equilibrage", request), ligne_assemblage_mixte_equilibrage.solve_mixed_assembly_line, request)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(ligne_assemblage_mixte_equilibrage.generate_equilibrage_chart, result, fmt=fmt, **chart_size_kwargs(ligne_assemblage_mixte_equilibrage.generate_equilibrage_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/ligne_assemblage_mixte/equilibrage/full")
+@endpoint(detail_prefix="Erreur algorithme équilibrage: ")
+async def run_equilibrage_full(request: dict):
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/equilibrage", request), ligne_assemblage_mixte_equilibrage.solve_mixed_assembly_line, request)
+    image_data = await render_chart(ligne_assemblage_mixte_equilibrage.generate_equilibrage_chart, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 @app.post("/ligne_assemblage_mixte/equilibrage_plus_plus")
-def run_equilibrage_plus_plus_analysis(request: dict):
-    try:
-        result = ligne_assemblage_mixte_equilibrage_plus_plus.solve_mixed_assembly_line_plus_plus(request)
-        return result
-    except Exception as e:
-        print(f"Error in equilibrage++: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Erreur algorithme équilibrage++: {str(e)}")
+@endpoint(detail_prefix="Erreur algorithme équilibrage++: ")
+async def run_equilibrage_plus_plus_analysis(request: dict):
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/equilibrage_plus_plus", request), ligne_assemblage_mixte_equilibrage_plus_plus.solve_mixed_assembly_line_plus_plus, request)
+    return result
 
 @app.post("/ligne_assemblage_mixte/equilibrage_plus_plus/chart")
-def run_equilibrage_plus_plus_chart(request: dict):
-    try:
-        result = ligne_assemblage_mixte_equilibrage_plus_plus.solve_mixed_assembly_line_plus_plus(request)
-        
-        # Générer le graphique
-        image_base64 = ligne_assemblage_mixte_equilibrage_plus_plus.generate_equilibrage_plus_plus_chart(result)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(image_base64)
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_equilibrage_plus_plus_chart(request: dict, http_request: Request, fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"ligne_assemblage_mixte/equilibrage_plus_plus/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/equilibrage_plus_plus", request), ligne_assemblage_mixte_equilibrage_plus_plus.solve_mixed_assembly_line_plus_plus, request)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(ligne_assemblage_mixte_equilibrage_plus_plus.generate_equilibrage_plus_plus_chart, result, fmt=fmt, **chart_size_kwargs(ligne_assemblage_mixte_equilibrage_plus_plus.generate_equilibrage_plus_plus_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/ligne_assemblage_mixte/equilibrage_plus_plus/full")
+@endpoint(detail_prefix="Erreur algorithme équilibrage++: ")
+async def run_equilibrage_plus_plus_full(request: dict):
+    result = await solve_cached(dedup_key("ligne_assemblage_mixte/equilibrage_plus_plus", request), ligne_assemblage_mixte_equilibrage_plus_plus.solve_mixed_assembly_line_plus_plus, request)
+    image_data = await render_chart(ligne_assemblage_mixte_equilibrage_plus_plus.generate_equilibrage_plus_plus_chart, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 @app.post("/ligne_transfert/buffer_buzzacott")
-def run_buffer_buzzacott_analysis(request: dict):
-    try:
-        result = ligne_transfert_buffer_buzzacott.solve_buffer_buzzacott(request)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_buffer_buzzacott_analysis(request: dict):
+    result = await solve_cached(dedup_key("ligne_transfert/buffer_buzzacott", request), ligne_transfert_buffer_buzzacott.solve_buffer_buzzacott, request)
+    return result
 
 @app.post("/ligne_transfert/buffer_buzzacott/chart")
-def run_buffer_buzzacott_chart(request: dict):
-    try:
-        result = ligne_transfert_buffer_buzzacott.solve_buffer_buzzacott(request)
-        
-        # Générer le graphique
-        image_base64 = ligne_transfert_buffer_buzzacott.generate_buffer_buzzacott_chart(result)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(image_base64)
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def run_buffer_buzzacott_chart(request: dict, http_request: Request, fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"ligne_transfert/buffer_buzzacott/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    result = await solve_cached(dedup_key("ligne_transfert/buffer_buzzacott", request), ligne_transfert_buffer_buzzacott.solve_buffer_buzzacott, request)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(ligne_transfert_buffer_buzzacott.generate_buffer_buzzacott_chart, result, fmt=fmt, **chart_size_kwargs(ligne_transfert_buffer_buzzacott.generate_buffer_buzzacott_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/ligne_transfert/buffer_buzzacott/full")
+@endpoint(status=400)
+async def run_buffer_buzzacott_full(request: dict):
+    result = await solve_cached(dedup_key("ligne_transfert/buffer_buzzacott", request), ligne_transfert_buffer_buzzacott.solve_buffer_buzzacott, request)
+    image_data = await render_chart(ligne_transfert_buffer_buzzacott.generate_buffer_buzzacott_chart, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 # ----------- FMS Sac à Dos -----------
 
 @app.post("/fms/sac_a_dos")
-def run_fms_sac_a_dos_analysis(request: dict):
-    try:
-        print(f"Received request: {request}")  # Debug
-        fms_request = FMSSacADosRequest(**request)
-        print("Request validation successful")  # Debug
-        result = solve_fms_sac_a_dos(fms_request)
-        print("Algorithm execution successful")  # Debug
-        return result
-    except Exception as e:
-        print(f"Error in FMS endpoint: {str(e)}")  # Debug
-        import traceback
-        traceback.print_exc()  # Debug
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_sac_a_dos_analysis(request: FMSSacADosRequest = Depends(cached_body(FMSSacADosRequest))):
+    result = await solve_cached(dedup_key("fms/sac_a_dos", request), solve_fms_sac_a_dos, request)
+    return result
 
 @app.post("/fms/sac_a_dos/chart")
-def run_fms_sac_a_dos_chart(request: dict):
-    try:
-        print(f"Received chart request: {request}")
-        fms_request = FMSSacADosRequest(**request)
-        result = solve_fms_sac_a_dos(fms_request)
-        
-        # Générer le graphique
-        image_base64 = generate_fms_sac_a_dos_chart(result)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(image_base64)
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        print(f"Error in FMS chart: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_sac_a_dos_chart(http_request: Request, request: FMSSacADosRequest = Depends(cached_body(FMSSacADosRequest)), fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"fms/sac_a_dos/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    result = await solve_cached(dedup_key("fms/sac_a_dos", request), solve_fms_sac_a_dos, request)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(generate_fms_sac_a_dos_chart, result, fmt=fmt, **chart_size_kwargs(generate_fms_sac_a_dos_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/fms/sac_a_dos/full")
+@endpoint()
+async def run_fms_sac_a_dos_full(request: FMSSacADosRequest = Depends(cached_body(FMSSacADosRequest))):
+    result = await solve_cached(dedup_key("fms/sac_a_dos", request), solve_fms_sac_a_dos, request)
+    image_data = await render_chart(generate_fms_sac_a_dos_chart, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 # ----------- FMS Sac à Dos PL -----------
 
 @app.post("/fms/sac_a_dos_pl")
-def run_fms_sac_a_dos_pl_analysis(request: dict):
-    try:
-        print(f"Received request: {request}")
-        print("Request validation successful")
-        
-        result = fms_sac_a_dos_pl(
-            vente_unite=request["vente_unite"],
-            cout_mp_unite=request["cout_mp_unite"],
-            demande_periode=request["demande_periode"],
-            temps_fabrication_unite=request["temps_fabrication_unite"],
-            cout_op=request["cout_op"],
-            capacite_max=request["capacite_max"],
-            noms_produits=request["noms_produits"],
-            unite=request["unite"]
-        )
-        print("Algorithm execution successful")
-        return result
-    except Exception as e:
-        print(f"Error in FMS PL: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_sac_a_dos_pl_analysis(request: FMSSacADosPLRequest = Depends(cached_body(FMSSacADosPLRequest))):
+    pl_args = request.model_dump()
+    result = await solve_cached(
+        dedup_key("fms/sac_a_dos_pl", pl_args),
+        fms_sac_a_dos_pl, **pl_args
+    )
+    return result
 
 @app.post("/fms/sac_a_dos_pl/chart")
-def run_fms_sac_a_dos_pl_chart(request: dict):
-    try:
-        print(f"Received PL chart request: {request}")
-        buffer = generate_fms_sac_a_dos_pl_chart(
-            vente_unite=request["vente_unite"],
-            cout_mp_unite=request["cout_mp_unite"],
-            demande_periode=request["demande_periode"],
-            temps_fabrication_unite=request["temps_fabrication_unite"],
-            cout_op=request["cout_op"],
-            capacite_max=request["capacite_max"],
-            noms_produits=request["noms_produits"],
-            unite=request["unite"]
-        )
-        return StreamingResponse(buffer, media_type="image/png")
-    except Exception as e:
-        print(f"Error in FMS PL chart: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_sac_a_dos_pl_chart(http_request: Request, request: FMSSacADosPLRequest = Depends(cached_body(FMSSacADosPLRequest)), fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"fms/sac_a_dos_pl/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    pl_args = request.model_dump()
+    # Résolution partagée avec /fms/sac_a_dos_pl si une requête identique est en cours
+    result = await solve_cached(
+        dedup_key("fms/sac_a_dos_pl", pl_args),
+        fms_sac_a_dos_pl, **pl_args
+    )
+    image_data = await render_chart(generate_fms_sac_a_dos_pl_chart, result=result, fmt=fmt, **chart_size_kwargs(generate_fms_sac_a_dos_pl_chart, size), **pl_args)
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/fms/sac_a_dos_pl/full")
+@endpoint()
+async def run_fms_sac_a_dos_pl_full(request: FMSSacADosPLRequest = Depends(cached_body(FMSSacADosPLRequest))):
+    pl_args = request.model_dump()
+    result = await solve_cached(dedup_key("fms/sac_a_dos_pl", pl_args), fms_sac_a_dos_pl, **pl_args)
+    image_data = await render_chart(generate_fms_sac_a_dos_pl_chart, result=result, **pl_args)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 # ----------- FMS Sac à Dos Glouton -----------
 
 @app.post("/fms/sac_a_dos_glouton")
-def run_fms_sac_a_dos_glouton_analysis(request: dict):
-    try:
-        print(f"Received glouton request: {request}")
-        fms_request = FMSSacADosGloutonRequest(**request)
-        print("Glouton request validation successful")
-        result = solve_fms_sac_a_dos_glouton(fms_request)
-        print("Glouton algorithm execution successful")
-        return result
-    except Exception as e:
-        print(f"Error in FMS glouton endpoint: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_sac_a_dos_glouton_analysis(request: FMSSacADosGloutonRequest = Depends(cached_body(FMSSacADosGloutonRequest))):
+    result = await solve_cached(dedup_key("fms/sac_a_dos_glouton", request), solve_fms_sac_a_dos_glouton, request)
+    return result
 
 @app.post("/fms/sac_a_dos_glouton/chart")
-def run_fms_sac_a_dos_glouton_chart(request: dict):
-    try:
-        print(f"Received glouton chart request: {request}")
-        fms_request = FMSSacADosGloutonRequest(**request)
-        result = solve_fms_sac_a_dos_glouton(fms_request)
-        
-        # Générer le graphique
-        image_base64 = generate_fms_sac_a_dos_glouton_chart(result)
-        
-        # Décoder l'image base64 et la retourner comme réponse image
-        image_data = base64.b64decode(image_base64)
-        buf = io.BytesIO(image_data)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        print(f"Error in FMS glouton chart: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_sac_a_dos_glouton_chart(http_request: Request, request: FMSSacADosGloutonRequest = Depends(cached_body(FMSSacADosGloutonRequest)), fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"fms/sac_a_dos_glouton/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    result = await solve_cached(dedup_key("fms/sac_a_dos_glouton", request), solve_fms_sac_a_dos_glouton, request)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(generate_fms_sac_a_dos_glouton_chart, result, fmt=fmt, **chart_size_kwargs(generate_fms_sac_a_dos_glouton_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/fms/sac_a_dos_glouton/full")
+@endpoint()
+async def run_fms_sac_a_dos_glouton_full(request: FMSSacADosGloutonRequest = Depends(cached_body(FMSSacADosGloutonRequest))):
+    result = await solve_cached(dedup_key("fms/sac_a_dos_glouton", request), solve_fms_sac_a_dos_glouton, request)
+    image_data = await render_chart(generate_fms_sac_a_dos_glouton_chart, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 # ----------- FMS Lots de Production Glouton -----------
 
 @app.post("/fms/lots_production_glouton")
-def run_fms_lots_production_glouton_analysis(request: dict):
-    try:
-        print(f"Received lots production glouton request: {request}")
-        fms_request = FMSLotsProductionGloutonRequest(**request)
-        print("Lots production glouton request validation successful")
-        result = solve_fms_lots_production_glouton(fms_request)
-        print("Lots production glouton algorithm execution successful")
-        return result
-    except Exception as e:
-        print(f"Error in FMS lots production glouton endpoint: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_lots_production_glouton_analysis(request: FMSLotsProductionGloutonRequest = Depends(cached_body(FMSLotsProductionGloutonRequest))):
+    result = await solve_cached(dedup_key("fms/lots_production_glouton", request), solve_fms_lots_production_glouton, request)
+    return result
 
 @app.post("/fms/lots_production_glouton/chart")
-def run_fms_lots_production_glouton_chart(request: dict):
-    try:
-        print(f"Received lots production glouton chart request: {request}")
-        fms_request = FMSLotsProductionGloutonRequest(**request)
-        
-        # Générer le graphique directement
-        img_buffer = generate_fms_lots_production_glouton_chart(fms_request)
-        
-        return StreamingResponse(img_buffer, media_type="image/png")
-    except Exception as e:
-        print(f"Error in FMS lots production glouton chart: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_lots_production_glouton_chart(http_request: Request, request: FMSLotsProductionGloutonRequest = Depends(cached_body(FMSLotsProductionGloutonRequest)), fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"fms/lots_production_glouton/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    result = await solve_cached(dedup_key("fms/lots_production_glouton", request), solve_fms_lots_production_glouton, request)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(generate_fms_lots_production_glouton_chart, request, result, fmt=fmt, **chart_size_kwargs(generate_fms_lots_production_glouton_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/fms/lots_production_glouton/full")
+@endpoint()
+async def run_fms_lots_production_glouton_full(request: FMSLotsProductionGloutonRequest = Depends(cached_body(FMSLotsProductionGloutonRequest))):
+    result = await solve_cached(dedup_key("fms/lots_production_glouton", request), solve_fms_lots_production_glouton, request)
+    image_data = await render_chart(generate_fms_lots_production_glouton_chart, request, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 # ----------- FMS Lots de Production MIP -----------
 
+# Dernière solution optimale par (warm_start_id, structure du problème), conservée dans le processus principal
+# et transmise explicitement au solveur : le démarrage à chaud ne dépend pas du processus du pool qui résout
+MIP_WARM_STARTS = LRUCache(max_entries=64)
+
+async def solve_lots_production_mip(request: FMSLotsProductionMIPRequest, warm_start_id: Optional[str]):
+    """Résolution partagée par les trois routes (même clé de cache pour une même requête et un même warm_start_id)"""
+    if warm_start_id is None:
+        return await solve_cached(dedup_key("fms/lots_production_mip", request), solve_fms_lots_production_mip, request)
+    structure = (warm_start_id, *problem_structure(request))
+    result, solution = await solve_cached(
+        dedup_key(f"fms/lots_production_mip?warm_start_id={warm_start_id}", request),
+        solve_fms_lots_production_mip_warm, request, MIP_WARM_STARTS.get(structure)
+    )
+    if solution is not None:
+        MIP_WARM_STARTS.put(structure, solution)
+    return result
+
 @app.post("/fms/lots_production_mip")
-def run_fms_lots_production_mip_analysis(request: dict):
-    try:
-        print(f"Received lots production MIP request: {request}")
-        fms_request = FMSLotsProductionMIPRequest(**request)
-        print("Lots production MIP request validation successful")
-        result = solve_fms_lots_production_mip(fms_request)
-        print("Lots production MIP algorithm execution successful")
-        return result
-    except Exception as e:
-        print(f"Error in FMS lots production MIP endpoint: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_lots_production_mip_analysis(request: FMSLotsProductionMIPRequest = Depends(cached_body(FMSLotsProductionMIPRequest)), warm_start_id: Optional[str] = None):
+    result = await solve_lots_production_mip(request, warm_start_id)
+    return result
 
 @app.post("/fms/lots_production_mip/chart")
-def run_fms_lots_production_mip_chart(request: dict):
-    try:
-        print(f"Received lots production MIP chart request: {request}")
-        fms_request = FMSLotsProductionMIPRequest(**request)
-        
-        # Générer le graphique directement
-        img_buffer = generate_fms_lots_production_mip_chart(fms_request)
-        
-        return StreamingResponse(img_buffer, media_type="image/png")
-    except Exception as e:
-        print(f"Error in FMS lots production MIP chart: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_lots_production_mip_chart(http_request: Request, request: FMSLotsProductionMIPRequest = Depends(cached_body(FMSLotsProductionMIPRequest)), fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size), warm_start_id: Optional[str] = None):
+    key = f"fms/lots_production_mip/chart?fmt={fmt}" if warm_start_id is None else f"fms/lots_production_mip/chart?fmt={fmt}&warm_start_id={warm_start_id}"
+    etag = chart_etag(key, request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    # Résolution partagée avec /fms/lots_production_mip si une requête identique est en cours
+    result = await solve_lots_production_mip(request, warm_start_id)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(generate_fms_lots_production_mip_chart, request, result, fmt=fmt, **chart_size_kwargs(generate_fms_lots_production_mip_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/fms/lots_production_mip/full")
+@endpoint()
+async def run_fms_lots_production_mip_full(request: FMSLotsProductionMIPRequest = Depends(cached_body(FMSLotsProductionMIPRequest)), warm_start_id: Optional[str] = None):
+    result = await solve_lots_production_mip(request, warm_start_id)
+    image_data = await render_chart(generate_fms_lots_production_mip_chart, request, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 # ----------- FMS Lots de Chargement Heuristique -----------
 
 @app.post("/fms/lots_chargement_heuristique")
-def run_fms_lots_chargement_heuristique_analysis(request: dict):
-    try:
-        print(f"Received lots chargement heuristique request: {request}")
-        fms_request = FMSLotsChargementHeuristiqueRequest(**request)
-        print("Lots chargement heuristique request validation successful")
-        result = solve_fms_lots_chargement_heuristique(fms_request)
-        print("Lots chargement heuristique algorithm execution successful")
-        return result
-    except Exception as e:
-        print(f"Error in FMS lots chargement heuristique endpoint: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_lots_chargement_heuristique_analysis(request: FMSLotsChargementHeuristiqueRequest = Depends(cached_body(FMSLotsChargementHeuristiqueRequest))):
+    result = await solve_cached(dedup_key("fms/lots_chargement_heuristique", request), solve_fms_lots_chargement_heuristique, request)
+    return result
 
 @app.post("/fms/lots_chargement_heuristique/chart")
-def run_fms_lots_chargement_heuristique_chart(request: dict):
-    try:
-        print(f"Received lots chargement heuristique chart request: {request}")
-        fms_request = FMSLotsChargementHeuristiqueRequest(**request)
-        
-        # Générer le graphique directement
-        img_buffer = generate_fms_lots_chargement_heuristique_chart(fms_request)
-        
-        return StreamingResponse(img_buffer, media_type="image/png")
-    except Exception as e:
-        print(f"Error in FMS lots chargement heuristique chart: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+@endpoint()
+async def run_fms_lots_chargement_heuristique_chart(http_request: Request, request: FMSLotsChargementHeuristiqueRequest = Depends(cached_body(FMSLotsChargementHeuristiqueRequest)), fmt: Literal["png", "webp"] = "png", size: dict = Depends(chart_size)):
+    etag = chart_etag(f"fms/lots_chargement_heuristique/chart?fmt={fmt}", request, size)
+    cached = cached_chart_response(http_request, etag, fmt)
+    if cached is not None:
+        return cached
+    result = await solve_cached(dedup_key("fms/lots_chargement_heuristique", request), solve_fms_lots_chargement_heuristique, request)
+    
+    # Générer le graphique (réutilisé si ce résultat a déjà été tracé)
+    image_data = await render_chart(generate_fms_lots_chargement_heuristique_chart, request, result, fmt=fmt, **chart_size_kwargs(generate_fms_lots_chargement_heuristique_chart, size))
+    
+    return chart_response(image_data, etag, fmt)
+
+@app.post("/fms/lots_chargement_heuristique/full")
+@endpoint()
+async def run_fms_lots_chargement_heuristique_full(request: FMSLotsChargementHeuristiqueRequest = Depends(cached_body(FMSLotsChargementHeuristiqueRequest))):
+    result = await solve_cached(dedup_key("fms/lots_chargement_heuristique", request), solve_fms_lots_chargement_heuristique, request)
+    image_data = await render_chart(generate_fms_lots_chargement_heuristique_chart, request, result)
+    return full_payload(result, base64.b64encode(image_data).decode())
 
 # ----------- Import Excel -----------
 
+EXCEL_EXTENSIONS = frozenset({".xlsx", ".xls"})
+
+def require_excel(file: UploadFile):
+    """HTTPException 400 si le fichier envoyé n'a pas une extension Excel (.xlsx ou .xls, casse ignorée)"""
+    if os.path.splitext(file.filename or "")[1].lower() not in EXCEL_EXTENSIONS:
+        raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
+
 @app.post("/flowshop/import-excel")
+@endpoint(detail_prefix="Erreur lors de l'import: ")
 async def import_flowshop_excel(file: UploadFile = File(...)):
     """Import de données flowshop depuis un fichier Excel"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire le contenu du fichier
-        file_content = await file.read()
-        
-        # Parser le fichier Excel
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        return {
-            "success": True,
-            "message": f"Fichier '{file.filename}' importé avec succès",
-            "data": parsed_data
-        }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import: {str(e)}")
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire le contenu du fichier
+    file_content = await file.read()
+    
+    # Parser le fichier Excel
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    return {
+        "success": True,
+        "message": f"Fichier '{file.filename}' importé avec succès",
+        "data": parsed_data
+    }
 
 @app.get("/flowshop/template/{template_type}")
+@endpoint(detail_prefix="Erreur lors de la génération du template: ")
 async def download_flowshop_template(template_type: str):
     """Téléchargement des templates Excel pour flowshop"""
-    try:
-        if template_type not in ["exemple", "vide"]:
-            raise HTTPException(status_code=400, detail="Type de template invalide. Utilisez 'exemple' ou 'vide'")
-        
-        # Générer le template
-        template_content = excel_import.create_flowshop_template(template_type)
-        
-        # Nom du fichier
-        filename = f"Template_Flowshop_{template_type.capitalize()}.xlsx"
-        
-        # Créer la réponse
-        response = StreamingResponse(
-            io.BytesIO(template_content),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-        
-        return response
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la génération du template: {str(e)}")
+    if template_type not in ["exemple", "vide"]:
+        raise HTTPException(status_code=400, detail="Type de template invalide. Utilisez 'exemple' ou 'vide'")
+    
+    # Générer le template
+    template_content = await solve_cached(dedup_key("flowshop/template", template_type), excel_import.create_flowshop_template, template_type)
+    
+    # Nom du fichier
+    filename = f"Template_Flowshop_{template_type.capitalize()}.xlsx"
+    
+    # Créer la réponse (contenu fixe par type : mis en cache par le navigateur et les proxys)
+    response = xlsx_response(template_content, filename)
+    response.headers["Cache-Control"] = "public, max-age=86400"
+    
+    return response
 
 @app.post("/spt/import-excel")
+@endpoint(detail_prefix="Erreur lors de l'import et du traitement: ")
 async def import_spt_excel(file: UploadFile = File(...)):
     """Import de données SPT depuis un fichier Excel et exécution de l'algorithme"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Valider les données
-        validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme SPT
-        result = spt.schedule(parsed_data["jobs_data"], parsed_data["due_dates"])
-        
-        return {
-            "success": True,
-            "message": f"Fichier '{file.filename}' importé et traité avec succès",
-            "imported_data": {
-                "job_names": parsed_data["job_names"],
-                "machine_names": parsed_data["machine_names"],
-                "jobs_data": parsed_data["jobs_data"],
-                "due_dates": parsed_data["due_dates"],
-                "unite": parsed_data["unite"],
-                "jobs_count": len(parsed_data["jobs_data"]),
-                "machines_count": len(parsed_data["machine_names"])
-            },
-            "results": {
-                "makespan": result["makespan"],
-                "flowtime": result["flowtime"],
-                "retard_cumule": result["retard_cumule"],
-                "completion_times": result["completion_times"],
-                "planification": {parsed_data["machine_names"][int(m)]: tasks for m, tasks in result["machines"].items()}
-            }
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Valider les données
+    validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme SPT
+    result = await solve_cached(file_key("spt/excel", file_content), spt.schedule, parsed_data["jobs_data"], parsed_data["due_dates"])
+    
+    return {
+        "success": True,
+        "message": f"Fichier '{file.filename}' importé et traité avec succès",
+        "imported_data": {
+            "job_names": parsed_data["job_names"],
+            "machine_names": parsed_data["machine_names"],
+            "jobs_data": parsed_data["jobs_data"],
+            "due_dates": parsed_data["due_dates"],
+            "unite": parsed_data["unite"],
+            "jobs_count": len(parsed_data["jobs_data"]),
+            "machines_count": len(parsed_data["machine_names"])
+        },
+        "results": {
+            "makespan": result["makespan"],
+            "flowtime": result["flowtime"],
+            "retard_cumule": result["retard_cumule"],
+            "completion_times": result["completion_times"],
+            "planification": planification_by_name(result["machines"], parsed_data["machine_names"])
         }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et du traitement: {str(e)}")
+    }
 
 @app.post("/spt/import-excel-gantt")
-async def import_spt_excel_gantt(file: UploadFile = File(...)):
+@endpoint(detail_prefix="Erreur lors de l'import et de la génération du Gantt: ")
+async def import_spt_excel_gantt(file: UploadFile = File(...), hires: bool = False):
     """Import de données SPT depuis un fichier Excel et génération du diagramme de Gantt"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Valider les données
-        validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme SPT
-        result = spt.schedule(parsed_data["jobs_data"], parsed_data["due_dates"])
-        
-        # Générer le diagramme de Gantt
-        fig = create_gantt_figure(
-            result, 
-            "Diagramme de Gantt - SPT (Import Excel)",
-            unite=parsed_data["unite"],
-            job_names=parsed_data["job_names"],
-            machine_names=parsed_data["machine_names"],
-            due_dates=parsed_data["due_dates"]
-        )
-        
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        
-        return StreamingResponse(buf, media_type="image/png")
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et de la génération du Gantt: {str(e)}")
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Valider les données
+    validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme SPT
+    result = await solve_cached(file_key("spt/excel", file_content), spt.schedule, parsed_data["jobs_data"], parsed_data["due_dates"])
+    
+    # Générer le diagramme de Gantt
+    return await gantt_png_response(
+        result, 
+        "Diagramme de Gantt - SPT (Import Excel)",
+        hires=hires,
+        unite=parsed_data["unite"],
+        job_names=parsed_data["job_names"],
+        machine_names=parsed_data["machine_names"],
+        due_dates=parsed_data["due_dates"]
+    )
 
 @app.post("/edd/import-excel")
+@endpoint(detail_prefix="Erreur lors de l'import et du traitement: ")
 async def import_edd_excel(file: UploadFile = File(...)):
     """Import de données EDD depuis un fichier Excel et exécution de l'algorithme"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Valider les données
-        validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme EDD
-        result = edd.schedule(parsed_data["jobs_data"], parsed_data["due_dates"])
-        
-        return {
-            "success": True,
-            "message": f"Fichier '{file.filename}' importé et traité avec succès",
-            "imported_data": {
-                "job_names": parsed_data["job_names"],
-                "machine_names": parsed_data["machine_names"],
-                "jobs_data": parsed_data["jobs_data"],
-                "due_dates": parsed_data["due_dates"],
-                "unite": parsed_data["unite"],
-                "jobs_count": len(parsed_data["jobs_data"]),
-                "machines_count": len(parsed_data["machine_names"])
-            },
-            "results": {
-                "makespan": result["makespan"],
-                "flowtime": result["flowtime"],
-                "retard_cumule": result["retard_cumule"],
-                "completion_times": result["completion_times"],
-                "planification": {parsed_data["machine_names"][int(m)] if int(m) < len(parsed_data["machine_names"]) else f"Machine {int(m)}": tasks for m, tasks in result["machines"].items()}
-            }
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Valider les données
+    validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme EDD
+    result = await solve_cached(file_key("edd/excel", file_content), edd.schedule, parsed_data["jobs_data"], parsed_data["due_dates"])
+    
+    return {
+        "success": True,
+        "message": f"Fichier '{file.filename}' importé et traité avec succès",
+        "imported_data": {
+            "job_names": parsed_data["job_names"],
+            "machine_names": parsed_data["machine_names"],
+            "jobs_data": parsed_data["jobs_data"],
+            "due_dates": parsed_data["due_dates"],
+            "unite": parsed_data["unite"],
+            "jobs_count": len(parsed_data["jobs_data"]),
+            "machines_count": len(parsed_data["machine_names"])
+        },
+        "results": {
+            "makespan": result["makespan"],
+            "flowtime": result["flowtime"],
+            "retard_cumule": result["retard_cumule"],
+            "completion_times": result["completion_times"],
+            "planification": {parsed_data["machine_names"][int(m)] if int(m) < len(parsed_data["machine_names"]) else f"Machine {int(m)}": tasks for m, tasks in result["machines"].items()}
         }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et du traitement: {str(e)}")
+    }
 
 @app.post("/edd/import-excel-gantt")
-async def import_edd_excel_gantt(file: UploadFile = File(...)):
-    try:
-        # Lire le fichier Excel
-        contents = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(contents)
-        
-        # Valider les données
-        validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme EDD
-        result = edd.schedule(parsed_data["jobs_data"], parsed_data["due_dates"])
-        
-        # Créer le graphique Gantt avec due_dates
-        fig = create_gantt_figure(result, "Diagramme de Gantt - Flowshop EDD",
-                                  unite=parsed_data["unite"],
-                                  job_names=parsed_data["job_names"],
-                                  machine_names=parsed_data["machine_names"],
-                                  due_dates=parsed_data["due_dates"])
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        return StreamingResponse(buf, media_type="image/png")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def import_edd_excel_gantt(file: UploadFile = File(...), hires: bool = False):
+    # Lire le fichier Excel
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Valider les données
+    validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme EDD
+    result = await solve_cached(file_key("edd/excel", file_content), edd.schedule, parsed_data["jobs_data"], parsed_data["due_dates"])
+    
+    # Créer le graphique Gantt avec due_dates
+    return await gantt_png_response(result, "Diagramme de Gantt - Flowshop EDD",
+                                    hires=hires,
+                                    unite=parsed_data["unite"],
+                                    job_names=parsed_data["job_names"],
+                                    machine_names=parsed_data["machine_names"],
+                                    due_dates=parsed_data["due_dates"])
 
 # ----------- Import Excel pour Johnson -----------
 
+# Durée d'une tâche [machine, durée], extraite en C
+task_duration = itemgetter(1)
+
 @app.post("/johnson/import-excel")
+@endpoint(detail_prefix="Erreur lors de l'import et du traitement: ")
 async def import_johnson_excel(file: UploadFile = File(...)):
     """Import de données Johnson depuis un fichier Excel et exécution de l'algorithme"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Convertir au format Johnson (List[List[float]] au lieu de List[List[List[float]]])
-        johnson_jobs_data = []
-        for job in parsed_data["jobs_data"]:
-            job_durations = [task[1] for task in job]  # Extraire seulement les durées
-            johnson_jobs_data.append(job_durations)
-        
-        # Valider les données spécifiquement pour Johnson
-        validate_johnson_data(johnson_jobs_data, parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme Johnson
-        result = johnson.schedule(johnson_jobs_data, parsed_data["due_dates"])
-        
-        return {
-            "success": True,
-            "message": f"Fichier '{file.filename}' importé et traité avec succès",
-            "imported_data": {
-                "job_names": parsed_data["job_names"],
-                "machine_names": parsed_data["machine_names"][:2],  # Johnson = 2 machines
-                "jobs_data": johnson_jobs_data,
-                "due_dates": parsed_data["due_dates"],
-                "unite": parsed_data["unite"],
-                "jobs_count": len(johnson_jobs_data),
-                "machines_count": 2
-            },
-            "results": {
-                "sequence": result["sequence"],
-                "makespan": result["makespan"],
-                "flowtime": result["flowtime"],
-                "retard_cumule": result["retard_cumule"],
-                "completion_times": result["completion_times"],
-                "planification": {parsed_data["machine_names"][int(m)]: tasks for m, tasks in result["machines"].items()}
-            }
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Convertir au format Johnson (List[List[float]] au lieu de List[List[List[float]]]) : durées seules
+    johnson_jobs_data = [list(map(task_duration, job)) for job in parsed_data["jobs_data"]]
+    
+    # Valider les données spécifiquement pour Johnson
+    validate_johnson_data(johnson_jobs_data, parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme Johnson
+    result = await solve_cached(file_key("johnson/excel", file_content), johnson.schedule, johnson_jobs_data, parsed_data["due_dates"])
+    
+    return {
+        "success": True,
+        "message": f"Fichier '{file.filename}' importé et traité avec succès",
+        "imported_data": {
+            "job_names": parsed_data["job_names"],
+            "machine_names": parsed_data["machine_names"][:2],  # Johnson = 2 machines
+            "jobs_data": johnson_jobs_data,
+            "due_dates": parsed_data["due_dates"],
+            "unite": parsed_data["unite"],
+            "jobs_count": len(johnson_jobs_data),
+            "machines_count": 2
+        },
+        "results": {
+            "sequence": result["sequence"],
+            "makespan": result["makespan"],
+            "flowtime": result["flowtime"],
+            "retard_cumule": result["retard_cumule"],
+            "completion_times": result["completion_times"],
+            "planification": planification_by_name(result["machines"], parsed_data["machine_names"])
         }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et du traitement: {str(e)}")
+    }
 
 # ----------- Import Excel pour Johnson Modifié -----------
 
 @app.post("/johnson_modifie/import-excel")
+@endpoint(detail_prefix="Erreur lors de l'import et du traitement: ")
 async def import_johnson_modifie_excel(file: UploadFile = File(...)):
     """Import de données Johnson Modifié depuis un fichier Excel et exécution de l'algorithme"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Valider les données spécifiquement pour Johnson Modifié
-        validate_johnson_modifie_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme Johnson Modifié
-        result = johnson_modifie.schedule(parsed_data["jobs_data"], parsed_data["due_dates"])
-        
-        return {
-            "success": True,
-            "message": f"Fichier '{file.filename}' importé et traité avec succès",
-            "imported_data": {
-                "job_names": parsed_data["job_names"],
-                "machine_names": parsed_data["machine_names"],
-                "jobs_data": parsed_data["jobs_data"],
-                "due_dates": parsed_data["due_dates"],
-                "unite": parsed_data["unite"],
-                "jobs_count": len(parsed_data["jobs_data"]),
-                "machines_count": len(parsed_data["machine_names"])
-            },
-            "results": {
-                "sequence": result["sequence"],
-                "makespan": result["makespan"],
-                "flowtime": result["flowtime"],
-                "retard_cumule": result["retard_cumule"],
-                "completion_times": result["completion_times"],
-                "planification": {parsed_data["machine_names"][int(m)]: tasks for m, tasks in result["machines"].items()}
-            }
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Valider les données spécifiquement pour Johnson Modifié
+    validate_johnson_modifie_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme Johnson Modifié
+    result = await solve_cached(file_key("johnson_modifie/excel", file_content), johnson_modifie.schedule, parsed_data["jobs_data"], parsed_data["due_dates"])
+    
+    return {
+        "success": True,
+        "message": f"Fichier '{file.filename}' importé et traité avec succès",
+        "imported_data": {
+            "job_names": parsed_data["job_names"],
+            "machine_names": parsed_data["machine_names"],
+            "jobs_data": parsed_data["jobs_data"],
+            "due_dates": parsed_data["due_dates"],
+            "unite": parsed_data["unite"],
+            "jobs_count": len(parsed_data["jobs_data"]),
+            "machines_count": len(parsed_data["machine_names"])
+        },
+        "results": {
+            "sequence": result["sequence"],
+            "makespan": result["makespan"],
+            "flowtime": result["flowtime"],
+            "retard_cumule": result["retard_cumule"],
+            "completion_times": result["completion_times"],
+            "planification": planification_by_name(result["machines"], parsed_data["machine_names"])
         }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et du traitement: {str(e)}")
+    }
 
 # ----------- Import Excel pour Smith -----------
 
 @app.post("/smith/import-excel")
+@endpoint(detail_prefix="Erreur lors de l'import et du traitement: ")
 async def import_smith_excel(file: UploadFile = File(...)):
     """Import de données Smith depuis un fichier Excel et exécution de l'algorithme"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Convertir au format Smith (List[List[float]] avec [durée, due_date] par job)
-        # Smith utilise seulement la première machine, on ignore les autres
-        smith_jobs_data = []
-        for job_index, job in enumerate(parsed_data["jobs_data"]):
-            if len(job) > 0:
-                # Prendre seulement la première durée (première machine)
-                first_duration = job[0][1]  # [machine_id, duration] -> duration
-                due_date = parsed_data["due_dates"][job_index]
-                smith_jobs_data.append([first_duration, due_date])
-            else:
-                job_name = parsed_data["job_names"][job_index] if job_index < len(parsed_data["job_names"]) else f"Job {job_index}"
-                raise ValueError(f"Le job '{job_name}' ne contient aucune durée.")
-        
-        # Pas besoin de validation spéciale pour Smith car l'algorithme fait sa propre validation
-        
-        # Exécuter l'algorithme Smith
-        result = smith.smith_algorithm(smith_jobs_data)
-        
-        # Message informatif si plusieurs machines détectées
-        machines_detected = len(parsed_data["machine_names"])
-        info_message = f"Fichier '{file.filename}' importé et traité avec succès"
-        if machines_detected > 1:
-            info_message += f" (Smith utilise seulement la première machine '{parsed_data['machine_names'][0]}', les {machines_detected-1} autres machines sont ignorées)"
-        
-        return {
-            "success": True,
-            "message": info_message,
-            "imported_data": {
-                "job_names": parsed_data["job_names"],
-                "machine_names": [parsed_data["machine_names"][0]] if parsed_data["machine_names"] else ["Machine_1"],
-                "jobs_data": smith_jobs_data,
-                "due_dates": parsed_data["due_dates"],
-                "unite": parsed_data["unite"],
-                "jobs_count": len(smith_jobs_data),
-                "machines_count": 1
-            },
-            "results": {
-                "sequence": result["sequence"],
-                "makespan": result["makespan"],
-                "flowtime": result["flowtime"],
-                "retard_cumule": result["retard_cumule"],
-                "completion_times": result["completion_times"],
-                "planification": {"Machine_1": result["machines"]["0"]} if parsed_data["machine_names"] else {"Machine 0": result["machines"]["0"]},
-                "N": result.get("N", 0),
-                "cumulative_delay": result["cumulative_delay"]
-            }
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Convertir au format Smith (List[List[float]] avec [durée, due_date] par job)
+    # Smith utilise seulement la première machine, on ignore les autres
+    smith_jobs_data = []
+    for job_index, job in enumerate(parsed_data["jobs_data"]):
+        if len(job) > 0:
+            # Prendre seulement la première durée (première machine)
+            first_duration = job[0][1]  # [machine_id, duration] -> duration
+            due_date = parsed_data["due_dates"][job_index]
+            smith_jobs_data.append([first_duration, due_date])
+        else:
+            job_name = parsed_data["job_names"][job_index] if job_index < len(parsed_data["job_names"]) else f"Job {job_index}"
+            raise ValueError(f"Le job '{job_name}' ne contient aucune durée.")
+    
+    # Pas besoin de validation spéciale pour Smith car l'algorithme fait sa propre validation
+    
+    # Exécuter l'algorithme Smith
+    result = await solve_cached(file_key("smith/excel", file_content), smith.smith_algorithm, smith_jobs_data)
+    
+    # Message informatif si plusieurs machines détectées
+    machines_detected = len(parsed_data["machine_names"])
+    info_message = f"Fichier '{file.filename}' importé et traité avec succès"
+    if machines_detected > 1:
+        info_message += f" (Smith utilise seulement la première machine '{parsed_data['machine_names'][0]}', les {machines_detected-1} autres machines sont ignorées)"
+    
+    return {
+        "success": True,
+        "message": info_message,
+        "imported_data": {
+            "job_names": parsed_data["job_names"],
+            "machine_names": [parsed_data["machine_names"][0]] if parsed_data["machine_names"] else ["Machine_1"],
+            "jobs_data": smith_jobs_data,
+            "due_dates": parsed_data["due_dates"],
+            "unite": parsed_data["unite"],
+            "jobs_count": len(smith_jobs_data),
+            "machines_count": 1
+        },
+        "results": {
+            "sequence": result["sequence"],
+            "makespan": result["makespan"],
+            "flowtime": result["flowtime"],
+            "retard_cumule": result["retard_cumule"],
+            "completion_times": result["completion_times"],
+            "planification": {"Machine_1": result["machines"]["0"]} if parsed_data["machine_names"] else {"Machine 0": result["machines"]["0"]},
+            "N": result.get("N", 0),
+            "cumulative_delay": result["cumulative_delay"]
         }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et du traitement: {str(e)}")
+    }
 
 @app.post("/smith/import-excel-gantt")
-async def import_smith_excel_gantt(file: UploadFile = File(...)):
+@endpoint(detail_prefix="Erreur lors de l'import et de la génération du Gantt: ")
+async def import_smith_excel_gantt(file: UploadFile = File(...), hires: bool = False):
     """Import de données Smith depuis un fichier Excel et génération du diagramme de Gantt"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Convertir au format Smith (List[List[float]] avec [durée, due_date] par job)
-        # Smith utilise seulement la première machine, on ignore les autres
-        smith_jobs_data = []
-        for job_index, job in enumerate(parsed_data["jobs_data"]):
-            if len(job) > 0:
-                # Prendre seulement la première durée (première machine)
-                first_duration = job[0][1]  # [machine_id, duration] -> duration
-                due_date = parsed_data["due_dates"][job_index]
-                smith_jobs_data.append([first_duration, due_date])
-            else:
-                job_name = parsed_data["job_names"][job_index] if job_index < len(parsed_data["job_names"]) else f"Job {job_index}"
-                raise ValueError(f"Le job '{job_name}' ne contient aucune durée.")
-        
-        # Exécuter l'algorithme Smith
-        result = smith.smith_algorithm(smith_jobs_data)
-        
-        # Extraire les due dates des jobs Smith
-        due_dates = [job[1] for job in smith_jobs_data]
-        
-        # Générer le diagramme de Gantt avec create_gantt_figure
-        machines_detected = len(parsed_data["machine_names"])
-        title = "Diagramme de Gantt - Smith (Import Excel)"
-        if machines_detected > 1:
-            title += f" - Utilise seulement '{parsed_data['machine_names'][0]}'"
-        
-        fig = create_gantt_figure(
-            result, 
-            title,
-            unite=parsed_data["unite"],
-            job_names=parsed_data["job_names"],
-            machine_names=["Machine 1"],  # Smith utilise une seule machine
-            due_dates=due_dates
-        )
-        
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", dpi=300, bbox_inches='tight')
-        plt.close(fig)
-        buf.seek(0)
-        
-        return StreamingResponse(buf, media_type="image/png")
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et de la génération du Gantt: {str(e)}")
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Convertir au format Smith (List[List[float]] avec [durée, due_date] par job)
+    # Smith utilise seulement la première machine, on ignore les autres
+    smith_jobs_data = []
+    for job_index, job in enumerate(parsed_data["jobs_data"]):
+        if len(job) > 0:
+            # Prendre seulement la première durée (première machine)
+            first_duration = job[0][1]  # [machine_id, duration] -> duration
+            due_date = parsed_data["due_dates"][job_index]
+            smith_jobs_data.append([first_duration, due_date])
+        else:
+            job_name = parsed_data["job_names"][job_index] if job_index < len(parsed_data["job_names"]) else f"Job {job_index}"
+            raise ValueError(f"Le job '{job_name}' ne contient aucune durée.")
+    
+    # Exécuter l'algorithme Smith
+    result = await solve_cached(file_key("smith/excel", file_content), smith.smith_algorithm, smith_jobs_data)
+    
+    # Extraire les due dates des jobs Smith
+    due_dates = [job[1] for job in smith_jobs_data]
+    
+    # Générer le diagramme de Gantt avec create_gantt_figure
+    machines_detected = len(parsed_data["machine_names"])
+    title = "Diagramme de Gantt - Smith (Import Excel)"
+    if machines_detected > 1:
+        title += f" - Utilise seulement '{parsed_data['machine_names'][0]}'"
+    
+    return await gantt_png_response(
+        result, 
+        title,
+        hires=hires,
+        unite=parsed_data["unite"],
+        job_names=parsed_data["job_names"],
+        machine_names=["Machine 1"],  # Smith utilise une seule machine
+        due_dates=due_dates
+    )
 
 # ----------- Import Excel pour Contraintes -----------
 
 @app.post("/contraintes/import-excel")
+@endpoint(detail_prefix="Erreur lors de l'import et du traitement: ")
 async def import_contraintes_excel(file: UploadFile = File(...)):
     """Import de données Contraintes depuis un fichier Excel et exécution de l'algorithme"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Valider les données
-        validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme Contraintes
-        result = contraintes.flowshop_contraintes(
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"],
-            parsed_data["job_names"], 
-            parsed_data["machine_names"],
-            None  # machines_per_stage
-        )
-        
-        # Ajuster les noms pour les machines
-        machine_names_to_use = parsed_data["machine_names"] or [f"Machine {i+1}" for i in range(len(parsed_data["jobs_data"][0]))]
-        
-        return {
-            "success": True,
-            "message": f"Fichier '{file.filename}' importé et traité avec succès",
-            "imported_data": {
-                "job_names": parsed_data["job_names"],
-                "machine_names": parsed_data["machine_names"],
-                "jobs_data": parsed_data["jobs_data"],
-                "due_dates": parsed_data["due_dates"],
-                "unite": parsed_data["unite"],
-                "jobs_count": len(parsed_data["jobs_data"]),
-                "machines_count": len(parsed_data["machine_names"])
-            },
-            "results": {
-                "makespan": result["makespan"],
-                "flowtime": result["flowtime"],
-                "retard_cumule": result["retard_cumule"],
-                "completion_times": result["completion_times"],
-                "planification": {machine_names_to_use[int(m)]: tasks for m, tasks in result["machines"].items() if str(m).isdigit() and int(m) < len(machine_names_to_use)},
-                "raw_machines": result["machines"],
-                "gantt_url": result.get("gantt_url")
-            }
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Valider les données
+    validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme Contraintes
+    result = await solve_cached(
+        file_key("contraintes/excel", file_content),
+        contraintes.flowshop_contraintes,
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"],
+        parsed_data["job_names"], 
+        parsed_data["machine_names"],
+        None  # machines_per_stage
+    )
+    
+    # Ajuster les noms pour les machines
+    machine_names_to_use = parsed_data["machine_names"] or [f"Machine {i+1}" for i in range(len(parsed_data["jobs_data"][0]))]
+    
+    return {
+        "success": True,
+        "message": f"Fichier '{file.filename}' importé et traité avec succès",
+        "imported_data": {
+            "job_names": parsed_data["job_names"],
+            "machine_names": parsed_data["machine_names"],
+            "jobs_data": parsed_data["jobs_data"],
+            "due_dates": parsed_data["due_dates"],
+            "unite": parsed_data["unite"],
+            "jobs_count": len(parsed_data["jobs_data"]),
+            "machines_count": len(parsed_data["machine_names"])
+        },
+        "results": {
+            "makespan": result["makespan"],
+            "flowtime": result["flowtime"],
+            "retard_cumule": result["retard_cumule"],
+            "completion_times": result["completion_times"],
+            "planification": planification_named_machines(result["machines"], machine_names_to_use),
+            "raw_machines": result["machines"],
+            "gantt_url": result.get("gantt_url")
         }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'import et du traitement: {str(e)}")
+    }
 
 @app.post("/contraintes/import-excel-gantt")
-async def import_contraintes_excel_gantt(file: UploadFile = File(...)):
+@endpoint(detail_prefix="Erreur lors de la génération du diagramme: ")
+async def import_contraintes_excel_gantt(file: UploadFile = File(...), hires: bool = False):
     """Import de données Contraintes depuis un fichier Excel et génération du diagramme de Gantt"""
-    try:
-        # Vérifier le type de fichier
-        if not file.filename.endswith(('.xlsx', '.xls')):
-            raise HTTPException(status_code=400, detail="Le fichier doit être au format Excel (.xlsx ou .xls)")
-        
-        # Lire et parser le fichier
-        file_content = await file.read()
-        parsed_data = excel_import.parse_flowshop_excel(file_content)
-        
-        # Valider les données
-        validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
-        
-        # Exécuter l'algorithme Contraintes
-        result = contraintes.flowshop_contraintes(
-            parsed_data["jobs_data"], 
-            parsed_data["due_dates"],
-            parsed_data["job_names"], 
-            parsed_data["machine_names"],
-            None  # machines_per_stage
-        )
-        
-        # Générer le diagramme de Gantt
-        fig = create_gantt_figure(
-            result, 
-            "Diagramme de Gantt - Contraintes (Import Excel)",
-            unite=parsed_data["unite"],
-            job_names=parsed_data["job_names"],
-            machine_names=parsed_data["machine_names"],
-            due_dates=parsed_data["due_dates"]
-        )
-        
-        # Convertir en image
-        img_buffer = io.BytesIO()
-        fig.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-        img_buffer.seek(0)
-        plt.close(fig)
-        
-        return StreamingResponse(
-            img_buffer,
-            media_type="image/png",
-            headers={"Content-Disposition": f"attachment; filename=gantt_contraintes_import.png"}
-        )
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la génération du diagramme: {str(e)}")
+    # Vérifier le type de fichier
+    require_excel(file)
+    
+    # Lire et parser le fichier
+    file_content = await file.read()
+    parsed_data = await solve_cached(file_key("flowshop/excel", file_content), excel_import.parse_flowshop_excel, file_content)
+    
+    # Valider les données
+    validate_jobs_data(parsed_data["jobs_data"], parsed_data["due_dates"], parsed_data["job_names"])
+    
+    # Exécuter l'algorithme Contraintes
+    result = await solve_cached(
+        file_key("contraintes/excel", file_content),
+        contraintes.flowshop_contraintes,
+        parsed_data["jobs_data"], 
+        parsed_data["due_dates"],
+        parsed_data["job_names"], 
+        parsed_data["machine_names"],
+        None  # machines_per_stage
+    )
+    
+    # Générer le diagramme de Gantt
+    return await gantt_png_response(
+        result, 
+        "Diagramme de Gantt - Contraintes (Import Excel)",
+        hires=hires,
+        unite=parsed_data["unite"],
+        job_names=parsed_data["job_names"],
+        machine_names=parsed_data["machine_names"],
+        due_dates=parsed_data["due_dates"],
+        filename="gantt_contraintes_import.png"
+    )
 
 # Modèle pour l'export des données manuelles
 class ExportDataRequest(BaseModel):
@@ -2450,164 +2709,70 @@ class FlowshopMMExportDataRequest(BaseModel):
     machines_per_stage: List[int]
     unite: str = "heures"
 
+@endpoint(status=400)
+async def export_manual_excel(request: ExportDataRequest, filename: str):
+    """
+    Classeur Excel des données flowshop saisies manuellement (commun aux exports SPT, EDD, Johnson,
+    Johnson modifié, Contraintes et Smith), généré dans le pool et réutilisé pour une requête identique
+    """
+    excel_content = await solve_args_cached(
+        "export-excel",
+        excel_import.export_manual_data_to_excel,
+        request.jobs_data,
+        request.due_dates,
+        request.job_names,
+        request.machine_names,
+        request.unite
+    )
+    
+    return xlsx_response(excel_content, filename)
+
 @app.post("/spt/export-excel")
-def export_spt_data_to_excel(request: ExportDataRequest):
+async def export_spt_data_to_excel(request: ExportDataRequest):
     """Export des données SPT saisies manuellement vers Excel"""
-    try:
-        excel_content = excel_import.export_manual_data_to_excel(
-            jobs_data=request.jobs_data,
-            due_dates=request.due_dates,
-            job_names=request.job_names,
-            machine_names=request.machine_names,
-            unite=request.unite
-        )
-        
-        buf = io.BytesIO(excel_content)
-        filename = f"Export_SPT_Donnees_Manuelles.xlsx"
-        
-        return StreamingResponse(
-            buf,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await export_manual_excel(request, "Export_SPT_Donnees_Manuelles.xlsx")
 
 @app.post("/edd/export-excel")
-def export_edd_data_to_excel(request: ExportDataRequest):
+async def export_edd_data_to_excel(request: ExportDataRequest):
     """Export des données EDD saisies manuellement vers Excel"""
-    try:
-        excel_content = excel_import.export_manual_data_to_excel(
-            jobs_data=request.jobs_data,
-            due_dates=request.due_dates,
-            job_names=request.job_names,
-            machine_names=request.machine_names,
-            unite=request.unite
-        )
-        
-        buf = io.BytesIO(excel_content)
-        filename = f"Export_EDD_Donnees_Manuelles.xlsx"
-        
-        return StreamingResponse(
-            buf,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await export_manual_excel(request, "Export_EDD_Donnees_Manuelles.xlsx")
 
 @app.post("/johnson/export-excel")
-def export_johnson_data_to_excel(request: ExportDataRequest):
+async def export_johnson_data_to_excel(request: ExportDataRequest):
     """Export des données Johnson saisies manuellement vers Excel"""
-    try:
-        excel_content = excel_import.export_manual_data_to_excel(
-            jobs_data=request.jobs_data,
-            due_dates=request.due_dates,
-            job_names=request.job_names,
-            machine_names=request.machine_names,
-            unite=request.unite
-        )
-        
-        buf = io.BytesIO(excel_content)
-        filename = f"Export_Johnson_Donnees_Manuelles.xlsx"
-        
-        return StreamingResponse(
-            buf,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await export_manual_excel(request, "Export_Johnson_Donnees_Manuelles.xlsx")
 
 @app.post("/johnson_modifie/export-excel")
-def export_johnson_modifie_data_to_excel(request: ExportDataRequest):
+async def export_johnson_modifie_data_to_excel(request: ExportDataRequest):
     """Export des données Johnson Modifié saisies manuellement vers Excel"""
-    try:
-        excel_content = excel_import.export_manual_data_to_excel(
-            jobs_data=request.jobs_data,
-            due_dates=request.due_dates,
-            job_names=request.job_names,
-            machine_names=request.machine_names,
-            unite=request.unite
-        )
-        
-        buf = io.BytesIO(excel_content)
-        filename = f"Export_Johnson_Modifie_Donnees_Manuelles.xlsx"
-        
-        return StreamingResponse(
-            buf,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await export_manual_excel(request, "Export_Johnson_Modifie_Donnees_Manuelles.xlsx")
 
 @app.post("/contraintes/export-excel")
-def export_contraintes_data_to_excel(request: ExportDataRequest):
+async def export_contraintes_data_to_excel(request: ExportDataRequest):
     """Export des données Contraintes saisies manuellement vers Excel"""
-    try:
-        excel_content = excel_import.export_manual_data_to_excel(
-            jobs_data=request.jobs_data,
-            due_dates=request.due_dates,
-            job_names=request.job_names,
-            machine_names=request.machine_names,
-            unite=request.unite
-        )
-        
-        buf = io.BytesIO(excel_content)
-        filename = f"Export_Contraintes_Donnees_Manuelles.xlsx"
-        
-        return StreamingResponse(
-            buf,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await export_manual_excel(request, "Export_Contraintes_Donnees_Manuelles.xlsx")
 
 @app.post("/smith/export-excel")
-def export_smith_data_to_excel(request: ExportDataRequest):
+async def export_smith_data_to_excel(request: ExportDataRequest):
     """Export des données Smith saisies manuellement vers Excel"""
-    try:
-        excel_content = excel_import.export_manual_data_to_excel(
-            jobs_data=request.jobs_data,
-            due_dates=request.due_dates,
-            job_names=request.job_names,
-            machine_names=request.machine_names,
-            unite=request.unite
-        )
-        
-        buf = io.BytesIO(excel_content)
-        filename = f"Export_Smith_Donnees_Manuelles.xlsx"
-        
-        return StreamingResponse(
-            buf,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    return await export_manual_excel(request, "Export_Smith_Donnees_Manuelles.xlsx")
 
 @app.post("/flowshop/machines_multiples/export-excel")
-def export_flowshop_mm_data_to_excel(request: FlowshopMMExportDataRequest):
+@endpoint(status=400)
+async def export_flowshop_mm_data_to_excel(request: FlowshopMMExportDataRequest):
     """Export des données FlowshopMM saisies manuellement vers Excel"""
-    try:
-        excel_content = excel_import.export_flowshop_mm_data_to_excel(
-            request.jobs_data,
-            request.due_dates,
-            request.job_names,
-            request.stage_names,
-            request.machines_per_stage,
-            request.unite
-        )
-        
-        return StreamingResponse(
-            io.BytesIO(excel_content),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=flowshop_mm_export.xlsx"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    excel_content = await solve_args_cached(
+        "flowshop/machines_multiples/export-excel",
+        excel_import.export_flowshop_mm_data_to_excel,
+        request.jobs_data,
+        request.due_dates,
+        request.job_names,
+        request.stage_names,
+        request.machines_per_stage,
+        request.unite
+    )
+    
+    return xlsx_response(excel_content, "flowshop_mm_export.xlsx")
 
 # ===== IMPORT/EXPORT EXCEL POUR PRÉCÉDENCES =====
 
@@ -2632,99 +2797,77 @@ class LigneAssemblageMixteGoulotExportDataRequest(BaseModel):
     format_type: str = "ligne_assemblage_mixte_goulot"
 
 @app.post("/ligne_assemblage/precedence/export-excel")
+@endpoint(detail_prefix="Erreur lors de l'export: ")
 def export_precedence_data_to_excel(request: PrecedenceExportDataRequest):
-    try:
-        # Utiliser la fonction d'export spécialisée pour précédences (sans cycle_time)
-        return excel_import.export_precedence_to_excel(
-            request.tasks_data,
-            request.unite,
-            "Précédences"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de l'export: {str(e)}")
+    # Utiliser la fonction d'export spécialisée pour précédences (sans cycle_time)
+    return excel_import.export_precedence_to_excel(
+        request.tasks_data,
+        request.unite,
+        "Précédences"
+    )
 
 @app.post("/ligne_assemblage/precedence/import-excel")
+@endpoint(status=400, detail_prefix="Erreur lors de l'import: ")
 async def import_precedence_excel(file: UploadFile = File(...), format_type: str = "precedence"):
-    try:
-        # Lire le fichier Excel et parser selon le format précédences
-        result = await excel_import.parse_precedence_excel(file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Erreur lors de l'import: {str(e)}")
+    # Lire le fichier Excel et parser selon le format précédences
+    result = await excel_import.parse_precedence_excel(file)
+    return result
 
 @app.post("/ligne_assemblage_mixte/equilibrage/export-excel")
-def export_ligne_assemblage_mixte_equilibrage_data_to_excel(request: LigneAssemblageMixteEquilibrageExportDataRequest):
-    try:
-        buffer = excel_import.export_ligne_assemblage_mixte_equilibrage_to_excel(
-            request.products_data, 
-            request.tasks_data, 
-            request.cycle_time, 
-            request.unite
-        )
-        return StreamingResponse(
-            io.BytesIO(buffer), 
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=Export_Equilibrage_Mixte_Donnees_Manuelles.xlsx"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def export_ligne_assemblage_mixte_equilibrage_data_to_excel(request: LigneAssemblageMixteEquilibrageExportDataRequest):
+    buffer = await solve_args_cached(
+        "ligne_assemblage_mixte/equilibrage/export-excel",
+        excel_import.export_ligne_assemblage_mixte_equilibrage_to_excel,
+        request.products_data, 
+        request.tasks_data, 
+        request.cycle_time, 
+        request.unite
+    )
+    return xlsx_response(buffer, "Export_Equilibrage_Mixte_Donnees_Manuelles.xlsx")
 
 @app.post("/ligne_assemblage_mixte/equilibrage/import-excel")
+@endpoint(status=400)
 async def import_ligne_assemblage_mixte_equilibrage_excel(file: UploadFile = File(...), format_type: str = "ligne_assemblage_mixte_equilibrage"):
-    try:
-        data = await excel_import.parse_ligne_assemblage_mixte_equilibrage_excel(file)
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    data = await excel_import.parse_ligne_assemblage_mixte_equilibrage_excel(file)
+    return data
 
 @app.post("/ligne_assemblage_mixte/equilibrage_plus_plus/export-excel")
-def export_ligne_assemblage_mixte_equilibrage_plus_plus_data_to_excel(request: LigneAssemblageMixteEquilibrageExportDataRequest):
-    try:
-        buffer = excel_import.export_ligne_assemblage_mixte_equilibrage_to_excel(
-            request.products_data, 
-            request.tasks_data, 
-            request.cycle_time, 
-            request.unite
-        )
-        return StreamingResponse(
-            io.BytesIO(buffer), 
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=Export_Equilibrage_Plus_Plus_Mixte_Donnees_Manuelles.xlsx"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def export_ligne_assemblage_mixte_equilibrage_plus_plus_data_to_excel(request: LigneAssemblageMixteEquilibrageExportDataRequest):
+    buffer = await solve_args_cached(
+        "ligne_assemblage_mixte/equilibrage/export-excel",
+        excel_import.export_ligne_assemblage_mixte_equilibrage_to_excel,
+        request.products_data, 
+        request.tasks_data, 
+        request.cycle_time, 
+        request.unite
+    )
+    return xlsx_response(buffer, "Export_Equilibrage_Plus_Plus_Mixte_Donnees_Manuelles.xlsx")
 
 @app.post("/ligne_assemblage_mixte/equilibrage_plus_plus/import-excel")
+@endpoint(status=400)
 async def import_ligne_assemblage_mixte_equilibrage_plus_plus_excel(file: UploadFile = File(...), format_type: str = "ligne_assemblage_mixte_equilibrage_plus_plus"):
-    try:
-        data = await excel_import.parse_ligne_assemblage_mixte_equilibrage_excel(file)
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    data = await excel_import.parse_ligne_assemblage_mixte_equilibrage_excel(file)
+    return data
 
 @app.post("/ligne_assemblage_mixte/goulot/export-excel")
-def export_ligne_assemblage_mixte_goulot_data_to_excel(request: LigneAssemblageMixteGoulotExportDataRequest):
-    try:
-        buffer = excel_import.export_ligne_assemblage_mixte_goulot_to_excel(
-            request.products_data, 
-            request.tasks_data, 
-            request.s1,
-            request.s2,
-            request.unite
-        )
-        return StreamingResponse(
-            io.BytesIO(buffer), 
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": "attachment; filename=Export_Goulot_Mixte_Donnees_Manuelles.xlsx"}
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@endpoint(status=400)
+async def export_ligne_assemblage_mixte_goulot_data_to_excel(request: LigneAssemblageMixteGoulotExportDataRequest):
+    buffer = await solve_args_cached(
+        "ligne_assemblage_mixte/goulot/export-excel",
+        excel_import.export_ligne_assemblage_mixte_goulot_to_excel,
+        request.products_data, 
+        request.tasks_data, 
+        request.s1,
+        request.s2,
+        request.unite
+    )
+    return xlsx_response(buffer, "Export_Goulot_Mixte_Donnees_Manuelles.xlsx")
 
 @app.post("/ligne_assemblage_mixte/goulot/import-excel")
+@endpoint(status=400)
 async def import_ligne_assemblage_mixte_goulot_excel(file: UploadFile = File(...), format_type: str = "ligne_assemblage_mixte_goulot"):
-    try:
-        data = await excel_import.parse_ligne_assemblage_mixte_goulot_excel(file)
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    data = await excel_import.parse_ligne_assemblage_mixte_goulot_excel(file)
+    return data
 
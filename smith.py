@@ -1,5 +1,7 @@
-import matplotlib.pyplot as plt
+import heapq
+import matplotlib
 import matplotlib.patches as mpatches
+from chart_utils import subplots
 
 def smith_algorithm(jobs):
     if not jobs or not all(len(job) == 2 for job in jobs):
@@ -11,18 +13,25 @@ def smith_algorithm(jobs):
     total_execution_time = sum(job[1][0] for job in sorted_jobs)
     sequence = []
 
-    while sorted_jobs:
-        admissible_jobs = [job for job in sorted_jobs if job[1][1] >= total_execution_time]
-        if admissible_jobs:
-            max_job = max(admissible_jobs, key=lambda x: x[1][0])
-            sequence.insert(0, max_job[0])
-            sorted_jobs.remove(max_job)
-            total_execution_time -= max_job[1][0]
-        else:
+    # Construction à rebours : le temps total ne fait que décroître, donc l'ensemble des jobs admissibles
+    # (date due >= temps total) ne fait que croître. Les jobs y entrent par date due décroissante et le plus
+    # long est extrait d'un tas (à durée égale : plus petite date due puis premier job, comme max() sur la liste triée)
+    admissible = []
+    next_job = len(sorted_jobs) - 1
+    while len(sequence) < len(sorted_jobs):
+        while next_job >= 0 and sorted_jobs[next_job][1][1] >= total_execution_time:
+            job, (duration, due_date) = sorted_jobs[next_job]
+            heapq.heappush(admissible, (-duration, due_date, job))
+            next_job -= 1
+        if not admissible:
             raise ValueError("Aucun job admissible trouvé. Tous les jobs ont une date due trop courte.")
+        neg_duration, _, job = heapq.heappop(admissible)
+        sequence.append(job)
+        total_execution_time -= -neg_duration
+    sequence.reverse()
 
-    flowtime = sum((len(sequence) - i) * jobs[job - 1][0] for i, job in enumerate(sequence)) / len(sequence)
     numerator = sum((len(sequence) - i) * jobs[job - 1][0] for i, job in enumerate(sequence))
+    flowtime = numerator / len(sequence)
     denominator = sum(job[0] for job in jobs)
     N = numerator / denominator if denominator else 0
 
@@ -69,8 +78,9 @@ def smith_algorithm(jobs):
     }
 
 def generate_gantt(sequence, jobs, unite="heures", job_names=None):
-    fig, ax = plt.subplots(figsize=(8, 2))
-    colors = plt.cm.get_cmap('tab10', len(jobs))
+    # Figure réutilisée par thread : à enregistrer avant le prochain rendu du même thread
+    fig, ax = subplots(figsize=(8, 2))
+    colors = matplotlib.colormaps['tab10'].resampled(len(jobs))
 
     cumulative_time = 0
     for i, job in enumerate(sequence):
@@ -94,6 +104,6 @@ def generate_gantt(sequence, jobs, unite="heures", job_names=None):
         for i in range(len(sequence))
     ]
     ax.legend(handles=legend_elements, bbox_to_anchor=(1.05, 1), loc='upper left')
-    plt.subplots_adjust(right=0.8)
+    fig.subplots_adjust(right=0.8)
     return fig
 
@@ -4,4 +4,4 @@ import uvicorn
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=False) 
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=False, loop="uvloop", http="httptools", timeout_keep_alive=75) 
\ No newline at end of file
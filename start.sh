@@ -1,2 +1,4 @@
 #!/bin/bash
-uvicorn main:app --host 0.0.0.0 --port 10000
+# Imports lourds (matplotlib, ortools, pulp) faits une fois avant le fork des workers (--preload)
+# uvloop et httptools (uvicorn[standard]) sont choisis automatiquement par UvicornWorker
+gunicorn main:app -w ${WEB_CONCURRENCY:-2} -k uvicorn.workers.UvicornWorker --preload --bind 0.0.0.0:10000 --keep-alive 75
@@ -1,8 +1,32 @@
+import inspect
+from functools import wraps
 from typing import List, Dict, Optional, Union
 from pydantic import BaseModel
+from cache_utils import LRUCache, payload_key
 
 # ----------- Validation des données de jobs -----------
 
+# Empreintes des données déjà validées avec succès (les mêmes données sont souvent renvoyées
+# pour les métriques, le Gantt, l'agenda puis l'export Excel)
+VALIDATED_DATA = LRUCache(max_entries=512)
+
+def validated_once(validate):
+    """
+    Ne refait pas une validation déjà réussie sur les mêmes jobs_data / due_dates.
+    Les noms des jobs ne servent qu'aux messages d'erreur : ils ne font pas partie de l'empreinte.
+    """
+    signature = inspect.signature(validate)
+
+    @wraps(validate)
+    def wrapper(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs).arguments
+        key = (validate.__name__, payload_key([arguments["jobs_data"], arguments["due_dates"]]))
+        if VALIDATED_DATA.get(key) is None:
+            validate(*args, **kwargs)
+            VALIDATED_DATA.put(key, True)
+    return wrapper
+
+@validated_once
 def validate_jobs_data(jobs_data: List[List[List[float]]], due_dates: List[float], job_names: Optional[List[str]] = None):
     """Validation générale pour tous les algorithmes flowshop"""
     if not jobs_data:
@@ -49,6 +73,7 @@ def validate_jobs_data(jobs_data: List[List[List[float]]], due_dates: List[float
             f"Un indice de machine ({max_machine_index}) est supérieur ou égal au nombre de tâches ({nb_taches_reference})."
         )
 
+@validated_once
 def validate_johnson_data(jobs_data: List[List[float]], due_dates: List[float], job_names: Optional[List[str]] = None):
     """Validation spécifique pour l'algorithme de Johnson (exactement 2 machines)"""
     if not jobs_data:
@@ -75,6 +100,7 @@ def validate_johnson_data(jobs_data: List[List[float]], due_dates: List[float],
             if duration < 0:
                 raise ValueError(f"La durée {task_index + 1} du job '{job_name}' ne peut pas être négative.")
 
+@validated_once
 def validate_johnson_modifie_data(jobs_data: List[List[List[float]]], due_dates: List[float], job_names: Optional[List[str]] = None):
     """Validation spécifique pour l'algorithme de Johnson Modifié (3 machines ou plus)"""
     if not jobs_data: